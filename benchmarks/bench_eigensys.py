@@ -0,0 +1,111 @@
+# bench_eigensys.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Benchmarks for the eigensystem calculation of the individual qubit classes, at several Hilbert space sizes.
+"""
+
+from . import common
+
+
+class TransmonEigensys:
+    params = [10, 30, 100]
+    param_names = ['ncut']
+
+    def setup(self, ncut):
+        self.qbt = common.transmon(ncut=ncut)
+
+    def time_eigenvals(self, ncut):
+        self.qbt.eigenvals(evals_count=6)
+
+    def time_eigensys(self, ncut):
+        self.qbt.eigensys(evals_count=6)
+
+
+class FluxoniumEigensys:
+    params = [50, 110, 300]
+    param_names = ['cutoff']
+
+    def setup(self, cutoff):
+        self.qbt = common.fluxonium(cutoff=cutoff)
+
+    def time_eigenvals(self, cutoff):
+        self.qbt.eigenvals(evals_count=6)
+
+    def time_eigensys(self, cutoff):
+        self.qbt.eigensys(evals_count=6)
+
+
+class FluxQubitEigensys:
+    params = [[5, 10, 15], [False, True]]
+    param_names = ['ncut', 'use_sparse']
+    timeout = 240
+
+    def setup(self, ncut, use_sparse):
+        self.qbt = common.flux_qubit(ncut=ncut)
+        self.qbt.use_sparse = use_sparse
+
+    def time_eigenvals(self, ncut, use_sparse):
+        self.qbt.eigenvals(evals_count=6)
+
+    def time_eigensys(self, ncut, use_sparse):
+        self.qbt.eigensys(evals_count=6)
+
+
+class ZeroPiEigensys:
+    params = [[50, 100], [15, 30]]
+    param_names = ['pt_count', 'ncut']
+    timeout = 240
+
+    def setup(self, pt_count, ncut):
+        self.qbt = common.zeropi(pt_count=pt_count, ncut=ncut)
+
+    def time_eigenvals(self, pt_count, ncut):
+        self.qbt.eigenvals(evals_count=6)
+
+    def time_eigensys(self, pt_count, ncut):
+        self.qbt.eigensys(evals_count=6)
+
+
+class FullZeroPiEigensys:
+    params = [30, 50]
+    param_names = ['pt_count']
+    timeout = 240
+
+    def setup(self, pt_count):
+        self.qbt = common.full_zeropi(pt_count=pt_count)
+
+    def time_eigensys(self, pt_count):
+        self.qbt._zeropi_esys_cache = None    # measure the full calculation, including the inner ZeroPi
+        self.qbt.eigensys(evals_count=6)
+
+
+class CircuitFluxQubitEigensys:
+    params = [3, 5]
+    param_names = ['ncut']
+    timeout = 240
+
+    def setup(self, ncut):
+        self.qbt = common.circuit_flux_qubit(ncut=ncut)
+
+    def time_eigensys(self, ncut):
+        self.qbt.eigensys(evals_count=6)
+
+
+class MatrixElementTable:
+    params = [['fluxonium', 'zeropi'], [6, 20]]
+    param_names = ['qubit', 'evals_count']
+
+    def setup(self, qubit, evals_count):
+        self.qbt = getattr(common, qubit)()
+        _, self.evecs = self.qbt.eigensys(evals_count=evals_count)
+
+    def time_matrixelement_table(self, qubit, evals_count):
+        self.qbt.matrixelement_table('phi_operator', evecs=self.evecs)
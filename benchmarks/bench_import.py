@@ -0,0 +1,24 @@
+# bench_import.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Benchmarks for import times, each measured in a fresh interpreter.
+"""
+
+
+def timeraw_import_scqubits():
+    return "import scqubits"
+
+
+def timeraw_import_and_transmon_eigenvals():
+    return """
+import scqubits
+scqubits.Transmon(EJ=30.02, EC=1.2, ng=0.3, ncut=30).eigenvals()
+"""
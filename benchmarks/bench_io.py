@@ -0,0 +1,68 @@
+# bench_io.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Benchmarks for writing and reading spectral data and parameter sweeps to and from h5 and csv files.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import scqubits as scq
+from . import common
+
+
+class SpectrumDataIO:
+    params = ['h5', 'csv']
+    param_names = ['file_format']
+
+    def setup(self, file_format):
+        common.disable_progressbars()
+        qbt = common.transmon(ncut=50)
+        # csv files store the eigenstates within the meta data, and are therefore benchmarked for energies only
+        self.specdata = qbt.get_spectrum_vs_paramvals('ng', np.linspace(-1.0, 1.0, 200), evals_count=6,
+                                                      get_eigenstates=(file_format == 'h5'))
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'specdata.' + file_format)
+        self.read_filename = os.path.join(self.tmpdir, 'specdata_read.' + file_format)
+        self.specdata.filewrite(self.read_filename)
+
+    def teardown(self, file_format):
+        shutil.rmtree(self.tmpdir)
+
+    def time_write(self, file_format):
+        self.specdata.filewrite(self.filename)
+
+    def time_read(self, file_format):
+        scq.read(self.read_filename)
+
+
+class ParameterSweepIO:
+    timeout = 300
+
+    def setup(self):
+        common.disable_progressbars()
+        self.sweep = common.fluxonium_resonator_sweep(param_count=100, autorun=True)
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'sweep.h5')
+        self.read_filename = os.path.join(self.tmpdir, 'sweep_read.h5')
+        self.sweep.filewrite(self.read_filename)
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def time_write(self):
+        self.sweep.filewrite(self.filename)
+
+    def time_read(self):
+        scq.read(self.read_filename)
@@ -0,0 +1,33 @@
+# bench_noise.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Benchmarks for coherence-time estimates.
+"""
+
+from . import common
+
+
+class EffectiveCoherenceTimes:
+    params = ['transmon', 'fluxonium', 'flux_qubit']
+    param_names = ['qubit']
+
+    def setup(self, qubit):
+        self.qbt = getattr(common, qubit)()
+        self.esys = self.qbt.eigensys(evals_count=self.qbt.truncated_dim)
+
+    def time_t1_effective(self, qubit):
+        self.qbt.t1_effective()
+
+    def time_t2_effective(self, qubit):
+        self.qbt.t2_effective()
+
+    def time_t2_effective_given_esys(self, qubit):
+        self.qbt.t2_effective(esys=self.esys)
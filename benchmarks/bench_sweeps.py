@@ -0,0 +1,68 @@
+# bench_sweeps.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Benchmarks for parameter sweeps: single-qubit spectra vs. a parameter, and `ParameterSweep` for a qubit coupled to a
+resonator, including the generation of the `SpectrumLookup`.
+"""
+
+import numpy as np
+
+import scqubits.core.spec_lookup as spec_lookup
+from . import common
+
+
+class SpectrumVsParamvals:
+    params = [1, 2]
+    param_names = ['num_cpus']
+    timeout = 240
+
+    def setup(self, num_cpus):
+        common.disable_progressbars()
+        self.qbt = common.fluxonium(cutoff=110)
+        self.flux_vals = np.linspace(0.0, 0.5, 40)
+        if num_cpus > 1:   # start the worker pool before timing
+            self.qbt.get_spectrum_vs_paramvals('flux', self.flux_vals[:2], num_cpus=num_cpus)
+
+    def time_get_spectrum_vs_paramvals(self, num_cpus):
+        self.qbt.get_spectrum_vs_paramvals('flux', self.flux_vals, evals_count=6, num_cpus=num_cpus)
+
+    def time_get_matelements_vs_paramvals(self, num_cpus):
+        self.qbt.get_matelements_vs_paramvals('n_operator', 'flux', self.flux_vals, evals_count=6,
+                                              num_cpus=num_cpus)
+
+
+class ParameterSweepRun:
+    params = [20, 50]
+    param_names = ['param_count']
+    timeout = 300
+
+    def setup(self, param_count):
+        common.disable_progressbars()
+        self.sweep = common.fluxonium_resonator_sweep(param_count=param_count)
+
+    def time_run(self, param_count):
+        self.sweep.run()
+
+    def peakmem_run(self, param_count):
+        self.sweep.run()
+
+
+class SpectrumLookupGeneration:
+    params = [20, 50]
+    param_names = ['param_count']
+    timeout = 300
+
+    def setup(self, param_count):
+        common.disable_progressbars()
+        self.sweep = common.fluxonium_resonator_sweep(param_count=param_count, autorun=True)
+
+    def time_spectrum_lookup(self, param_count):
+        spec_lookup.SpectrumLookup(self.sweep, self.sweep.dressed_specdata, self.sweep.bare_specdata_list)
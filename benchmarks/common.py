@@ -0,0 +1,81 @@
+# common.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Shared, deterministic test systems for the benchmark suite.
+"""
+
+import numpy as np
+
+import scqubits as scq
+import scqubits.settings as settings
+
+
+def disable_progressbars():
+    settings.PROGRESSBAR_DISABLED = True
+    settings.TQDM_KWARGS['disable'] = True
+
+
+def transmon(ncut=30):
+    return scq.Transmon(EJ=30.02, EC=1.2, ng=0.3, ncut=ncut, truncated_dim=6)
+
+
+def fluxonium(cutoff=110):
+    return scq.Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.33, cutoff=cutoff, truncated_dim=6)
+
+
+def flux_qubit(ncut=10):
+    ratio = 60.0
+    alpha = 0.8
+    return scq.FluxQubit(EJ1=1.0, EJ2=1.0, EJ3=alpha * 1.0, ECJ1=1.0 / ratio, ECJ2=1.0 / ratio,
+                         ECJ3=1.0 / (alpha * ratio), ECg1=50.0 / ratio, ECg2=50.0 / ratio, ng1=0.0, ng2=0.0,
+                         flux=0.5, ncut=ncut, truncated_dim=6)
+
+
+def zeropi(pt_count=100, ncut=30):
+    phi_grid = scq.Grid1d(-6 * np.pi, 6 * np.pi, pt_count)
+    return scq.ZeroPi(grid=phi_grid, EJ=10.0, EL=0.04, ECJ=20.0, EC=0.04, ng=0.1, flux=0.23, ncut=ncut,
+                      truncated_dim=6)
+
+
+def full_zeropi(pt_count=50, ncut=15):
+    phi_grid = scq.Grid1d(-6 * np.pi, 6 * np.pi, pt_count)
+    return scq.FullZeroPi(grid=phi_grid, EJ=10.0, EL=0.04, ECJ=20.0, EC=0.04, dEJ=0.05, dCJ=0.05, dC=0.08,
+                          dEL=0.05, ng=0.1, flux=0.23, ncut=ncut, zeropi_cutoff=6, zeta_cutoff=20, truncated_dim=6)
+
+
+def circuit_flux_qubit(ncut=5):
+    return scq.CircuitFluxQubit(EJ1=1.0, EJ2=1.0, EJ3=0.8, ECJ1=0.016, ECJ2=0.016, ECJ3=0.021, ECg1=0.83,
+                                ECg2=0.83, ng1=0.0, ng2=0.0, flux=0.5, ncut=ncut, truncated_dim=6)
+
+
+def fluxonium_resonator_sweep(param_count=50, autorun=False):
+    """Returns a `ParameterSweep` over the external flux of a fluxonium coupled to a resonator. With `autorun=False`,
+    the sweep is set up, but not run."""
+    qbt = scq.Fluxonium(EJ=2.55, EC=0.72, EL=0.12, flux=0.0, cutoff=110, truncated_dim=9)
+    osc = scq.Oscillator(E_osc=4.0, truncated_dim=5)
+    hilbertspace = scq.HilbertSpace([qbt, osc])
+    hilbertspace.interaction_list = [
+        scq.InteractionTerm(g_strength=0.2, op1=qbt.n_operator(), subsys1=qbt,
+                            op2=osc.creation_operator() + osc.annihilation_operator(), subsys2=osc)
+    ]
+
+    def update_hilbertspace(param_val):
+        qbt.flux = param_val
+
+    autorun_sweep = settings.AUTORUN_SWEEP
+    settings.AUTORUN_SWEEP = autorun
+    try:
+        sweep = scq.ParameterSweep(param_name='flux', param_vals=np.linspace(-0.5, 0.5, param_count),
+                                   evals_count=20, hilbertspace=hilbertspace, subsys_update_list=[qbt],
+                                   update_hilbertspace=update_hilbertspace, num_cpus=1)
+    finally:
+        settings.AUTORUN_SWEEP = autorun_sweep
+    return sweep
@@ -14,30 +14,83 @@ with composite Hilbert spaces consisting of coupled superconducting qubits and h
 within scqubits is carried out with the help of Numpy and Scipy; plotting capabilities rely on Matplotlib."""
 #######################################################################################################################
 
+import importlib
+import sys
 import warnings
 
 import scqubits.settings
-# core
-from scqubits.core.central_dispatch import CentralDispatch
-from scqubits.core.discretization import Grid1d
-from scqubits.core.explorer import Explorer
-from scqubits.core.flux_qubit import FluxQubit
-from scqubits.core.fluxonium import Fluxonium
-from scqubits.core.harmonic_osc import Oscillator
-from scqubits.core.hilbert_space import HilbertSpace, InteractionTerm
-from scqubits.core.noise import calc_therm_ratio
-from scqubits.core.param_sweep import ParameterSweep, StoredSweep
-from scqubits.core.storage import SpectrumData
-from scqubits.core.transmon import Transmon, TunableTransmon
-from scqubits.core.units import get_units, set_units, show_supported_units, \
-        to_standard_units, from_standard_units, get_units_time_label
-from scqubits.core.zeropi import ZeroPi
-from scqubits.core.zeropi_full import FullZeroPi
-# arbitrary circuit stuff
-from scqubits.core.circuit import Circuit, CircuitNode, Variable, ExternalFlux, ExternalCharge, Capacitance, JosephsonJunction, Inductance, LagrangianCurrentSource
-from scqubits.core.circuit_flux_qubit import CircuitFluxQubit
-# file IO
-from scqubits.io_utils.fileio import read, write
+
+# Public names are imported lazily upon first access (PEP 562), so that `import scqubits` does not load matplotlib,
+# qutip, sympy or ipywidgets unless they are needed by the objects in use. Python 3.6 lacks module-level __getattr__,
+# so there all public names are imported eagerly (see end of file).
+_LAZY_IMPORTS = {
+    # core
+    'CentralDispatch': 'scqubits.core.central_dispatch',
+    'Grid1d': 'scqubits.core.discretization',
+    'dispersive_shifts': 'scqubits.core.dispersive',
+    'Explorer': 'scqubits.core.explorer',
+    'FluxQubit': 'scqubits.core.flux_qubit',
+    'Fluxonium': 'scqubits.core.fluxonium',
+    'Oscillator': 'scqubits.core.harmonic_osc',
+    'HilbertSpace': 'scqubits.core.hilbert_space',
+    'InteractionTerm': 'scqubits.core.hilbert_space',
+    'calc_therm_ratio': 'scqubits.core.noise',
+    'ParameterSweep': 'scqubits.core.param_sweep',
+    'StoredSweep': 'scqubits.core.param_sweep',
+    'SpectrumData': 'scqubits.core.storage',
+    'Transmon': 'scqubits.core.transmon',
+    'TunableTransmon': 'scqubits.core.transmon',
+    'get_units': 'scqubits.core.units',
+    'set_units': 'scqubits.core.units',
+    'show_supported_units': 'scqubits.core.units',
+    'to_standard_units': 'scqubits.core.units',
+    'from_standard_units': 'scqubits.core.units',
+    'get_units_time_label': 'scqubits.core.units',
+    'ZeroPi': 'scqubits.core.zeropi',
+    'FullZeroPi': 'scqubits.core.zeropi_full',
+    # arbitrary circuit stuff
+    'Circuit': 'scqubits.core.circuit',
+    'CircuitNode': 'scqubits.core.circuit',
+    'Variable': 'scqubits.core.circuit',
+    'ExternalFlux': 'scqubits.core.circuit',
+    'ExternalCharge': 'scqubits.core.circuit',
+    'Capacitance': 'scqubits.core.circuit',
+    'JosephsonJunction': 'scqubits.core.circuit',
+    'Inductance': 'scqubits.core.circuit',
+    'LagrangianCurrentSource': 'scqubits.core.circuit',
+    'CircuitFluxQubit': 'scqubits.core.circuit_flux_qubit',
+    # file IO
+    'read': 'scqubits.io_utils.fileio',
+    'write': 'scqubits.io_utils.fileio',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value   # subsequent lookups bypass __getattr__
+        return value
+    raise AttributeError("module 'scqubits' has no attribute '{}'".format(name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+def import_all():
+    """Imports all modules providing the public scqubits names. Registration of classes (e.g., in
+    `SERIALIZABLE_REGISTRY` or `QuantumSystem.subclasses`) occurs upon import, so this is needed where the complete
+    set of classes is required."""
+    for module_name in sorted(set(_LAZY_IMPORTS.values())):
+        importlib.import_module(module_name)
+
+
+if sys.version_info < (3, 7):
+    for _name, _module_name in _LAZY_IMPORTS.items():
+        globals()[_name] = getattr(importlib.import_module(_module_name), _name)
+    del _name, _module_name
 
 # version
 try:
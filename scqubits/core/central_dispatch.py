@@ -10,7 +10,9 @@
 ############################################################################
 
 
+import contextlib
 import logging
+import threading
 import warnings
 import weakref
 
@@ -35,9 +37,26 @@ class CentralDispatch:
     """
     def __init__(self):
         self.clients_dict = {event: weakref.WeakKeyDictionary() for event in EVENTS}    # central dispatch information
+        self._lock = threading.RLock()     # guards clients_dict against concurrent registration and dispatch
+        self._thread_state = threading.local()
     # For each event, store a dict that maps the clients registered for that event to their callback routines
     # The objects are keys in the inner dict, implemented as a WeakKeyDictionary to allow deletion/garbage collection
     # when object should expire. Callback methods are stored as weakref.WeakMethod for the same reason.
+    # `_thread_state.scopes` holds the stack of active `deferred()`/`suppressed()` scopes of each thread: an entry is
+    # a dict collecting deferred events, or None if events are discarded.
+
+    def __getstate__(self):
+        # The lock and the thread-local scopes cannot be pickled (relevant when dill pickles scqubits modules by value
+        # for multiprocessing); they are recreated upon unpickling.
+        state = self.__dict__.copy()
+        del state['_lock']
+        del state['_thread_state']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._thread_state = threading.local()
 
     def get_clients_dict(self, event):
         """For given `event`, return the dict mapping each registered client to their callback routine
@@ -66,7 +85,7 @@ class CentralDispatch:
         callback: method, optional
             custom callback method other than `.receive()`
         """
-        logging.debug("Registering {} for {}. welcome.".format(type(who).__name__, event))
+        logging.debug("Registering %s for %s. welcome.", type(who).__name__, event)
         if callback is None:
             callback_ref = getattr(who, 'receive')
             # For purposes of garbage collection, this should preferably be:
@@ -81,7 +100,8 @@ class CentralDispatch:
             # However, as of 06/12/20, pathos balks on this on Windows (while Linux is passing).
             # Note that the reference to callback methods is likely to prevent proper garbage collection,
             # so may have to revisit this issue if necessary.
-        self.get_clients_dict(event)[who] = callback_ref
+        with self._lock:
+            self.get_clients_dict(event)[who] = callback_ref
 
     def unregister(self, event, who):
         """Unregister object `who` from event `event`.  (This modifies `clients_dict`.)
@@ -93,7 +113,8 @@ class CentralDispatch:
         who: DispatchClient
             object to be unregistered
         """
-        del self.get_clients_dict(event)[who]
+        with self._lock:
+            del self.get_clients_dict(event)[who]
 
     def unregister_object(self, who):
         """Unregister object `who` from all events.  (This modifies `clients_dict`.)
@@ -103,8 +124,9 @@ class CentralDispatch:
           who: DispatchClient
               object to be unregistered
           """
-        for event in self.clients_dict:
-            self.get_clients_dict(event).pop(who, None)
+        with self._lock:
+            for event in self.clients_dict:
+                self.get_clients_dict(event).pop(who, None)
 
     def _dispatch(self, event, sender, **kwargs):
         """Issue a dispatch for `event` coming from `sender.
@@ -117,8 +139,10 @@ class CentralDispatch:
             object requesting the dispatch
         **kwargs
         """
-        for client, callback_ref in self.get_clients_dict(event).items():
-            logging.debug("Central dispatch calling {} about {}.".format(type(client).__name__, event))
+        with self._lock:
+            clients = list(self.get_clients_dict(event).items())   # callbacks may (un)register clients
+        for client, callback_ref in clients:
+            logging.debug("Central dispatch calling %s about %s.", type(client).__name__, event)
             callback_ref(event, sender=sender, **kwargs)
             # When using WeakMethod references, this should rather be:
             # callback_ref()(event, sender=sender, **kwargs)
@@ -135,8 +159,55 @@ class CentralDispatch:
             event name from EVENTS
         **kwargs
         """
-        if settings.DISPATCH_ENABLED:
+        if not settings.DISPATCH_ENABLED:
+            return
+        scopes = self._scopes()
+        if not scopes:
             self._dispatch(event, sender=caller, **kwargs)
+        elif scopes[-1] is not None:
+            scopes[-1][(event, id(caller))] = (event, caller, kwargs)
+
+    def _scopes(self):
+        try:
+            return self._thread_state.scopes
+        except AttributeError:
+            self._thread_state.scopes = []
+            return self._thread_state.scopes
+
+    @contextlib.contextmanager
+    def deferred(self):
+        """Context manager deferring all dispatches requested from within the current thread until the outermost
+        `deferred()` block is exited. Deferred events are coalesced: each event is dispatched once per sender (with the
+        keyword arguments of its last occurrence), in the order in which the events first occurred. Example::
+
+            with CENTRAL_DISPATCH.deferred():
+                qubit.EJ = 10.0
+                qubit.EC = 0.2      # clients receive a single QUANTUMSYSTEM_UPDATE from `qubit`
+        """
+        scopes = self._scopes()
+        pending = {}
+        scopes.append(pending)
+        try:
+            yield
+        finally:
+            scopes.pop()
+        if scopes and scopes[-1] is not None:    # nested: hand over to enclosing `deferred()` block
+            for key, entry in pending.items():
+                scopes[-1][key] = entry
+        elif not scopes:
+            for event, sender, kwargs in pending.values():
+                self._dispatch(event, sender=sender, **kwargs)
+
+    @contextlib.contextmanager
+    def suppressed(self):
+        """Context manager discarding all dispatches requested from within the current thread. In contrast to
+        toggling `settings.DISPATCH_ENABLED`, this leaves other threads unaffected and is undone upon exceptions."""
+        scopes = self._scopes()
+        scopes.append(None)
+        try:
+            yield
+        finally:
+            scopes.pop()
 
 
 # Start global instance of CentralDispatch()
@@ -154,7 +225,7 @@ class DispatchClient:
             event name from EVENTS
         **kwargs
         """
-        logging.debug("Client {} broadcasting {}".format(type(self).__name__, event))
+        logging.debug("Client %s broadcasting %s", type(self).__name__, event)
         CENTRAL_DISPATCH.listen(self, event, **kwargs)
 
     def receive(self, event, sender, **kwargs):
@@ -174,6 +245,6 @@ class DispatchClient:
         # Garbage collection will invoke this at undetermined time. `if` clauses below prevent exceptions upon program
         # exit. (`logging` and `CENTRAL_DISPATCH` may have already been removed.)
         if logging:
-            logging.debug("Unregistering {}. au revoir.".format(type(self).__name__))
+            logging.debug("Unregistering %s. au revoir.", type(self).__name__)
         if CENTRAL_DISPATCH:
             CENTRAL_DISPATCH.unregister_object(self)
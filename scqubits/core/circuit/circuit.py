@@ -2,8 +2,11 @@
 A simple Python module to obtain energy levels of superconducting qubits by sparse Hamiltonian diagonalization.
 """
 
+import copy
+
 import numpy as np
 import sympy
+from scipy import sparse
 from scipy.sparse.linalg import *
 from abc import ABCMeta
 from abc import abstractmethod
@@ -11,12 +14,14 @@ import logging
 
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
+import scqubits.core.discretization as discretization
 
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.utils.plot_defaults as defaults
 import scqubits.utils.plotting as plot
+import scqubits.utils.spectrum_utils as spec_utils
 from typing import Tuple, List, Union
 from .elements import CircuitElement
 from .variable import Variable
@@ -34,7 +39,7 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
     The class containing references to nodes, elements, variables, variable-to-node mappings.
     """
 
-    def __init__(self, tolerance: float = 1e-18, real_mode: bool = False):
+    def __init__(self, tolerance: float = 1e-18, real_mode: bool = False, use_sparse: bool = False):
         """
         Abritrary quantum circuit class.
 
@@ -44,6 +49,9 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
             roundoff error tolerance  (default value = 1e-18)
         real_mode: bool, optional
             assume Hamiltonian is real-valued; yields real-valued wavefunctions where possible (default value = False)
+        use_sparse: bool, optional
+            assemble the charge-basis Hamiltonian as `scipy.sparse.csr_matrix`; the eigensolver is selected
+            automatically (see `eigensolver`) (default value = False)
 
         """
         self.nodes = [CircuitNode('GND')]
@@ -57,6 +65,7 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
         self.phase_potential = None
         self.charge_potential = None
         self.real_mode = real_mode
+        self.use_sparse = use_sparse
         self.nodes_graph = []
 
     # TODO: add something
@@ -70,6 +79,40 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
     def nonfit_params():
         return []
 
+    def copy_with(self, **params) -> 'Circuit':
+        """Returns a copy of the circuit in which the given `__init__` parameters are replaced by new values. The copy
+        is created by re-initialization (compare `Serializable.copy_with`), which rebuilds networks of nodes, elements
+        and variables set up in `__init__`. Networks built after initialization (via `add_element`, `add_variable`,
+        `map_nodes_linear`) are copied to a circuit whose `__init__` leaves the network empty.
+
+        Parameters
+        ----------
+        **params
+            `__init__` parameters (name=value) to be changed in the copy
+
+        Returns
+        -------
+        Circuit
+        """
+        init_data = self.get_initdata()
+        init_data.update(params)
+        new_circuit = type(self)(**init_data)
+        if new_circuit._network_signature() == self._network_signature():
+            return new_circuit
+        if new_circuit.elements or new_circuit.variables or len(new_circuit.nodes) > 1:
+            raise ValueError("The network of this circuit was modified after initialization and cannot be rebuilt "
+                             "from its init parameters.")
+        (new_circuit.nodes, new_circuit.elements, new_circuit.wires, new_circuit.variables, new_circuit.nodes_graph,
+         new_circuit.linear_coordinate_transform) = copy.deepcopy((self.nodes, self.elements, self.wires,
+                                                                   self.variables, self.nodes_graph,
+                                                                   self.linear_coordinate_transform))
+        return new_circuit
+
+    def _network_signature(self):
+        """Returns the names of nodes, elements and variables, and the wires, characterizing the circuit network."""
+        return ([node.name for node in self.nodes], [(type(element), element.name) for element in self.elements],
+                list(self.wires), [variable.name for variable in self.variables])
+
     def grid_shape(self) -> Tuple[int, ...]:
         """Returns Hilbert space dimension
         Returns
@@ -285,14 +328,16 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
         """
         return np.sum(np.conj(state_vector2) * operator * state_vector1)
 
-    def hamiltonian(self) -> np.ndarray:
+    def hamiltonian(self) -> Union[np.ndarray, sparse.csr_matrix]:
         """
         Returns Hamiltonian in charge basis.
 
         Returns
         -------
-        ndarray
+        ndarray or scipy.sparse.csr_matrix
         """
+        if self.use_sparse:
+            return self.sparse_hamiltonian()
         dim = len(self.variables)
         phase_grid = np.reshape(self.get_phase_grid(), (dim, 1, -1))
         charge_grid = np.reshape(self.get_charge_grid(), (dim, -1, 1))
@@ -301,6 +346,44 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
         hamiltonian_mat += np.diag(self.calculate_charge_potential().ravel())
         return hamiltonian_mat
 
+    def sparse_hamiltonian(self) -> sparse.csr_matrix:
+        """
+        Returns Hamiltonian in charge basis as a sparse matrix. In charge basis, the phase potential only depends on
+        differences of charge indices; its entries are given by the Fourier components of the potential sampled on
+        the phase grid. Only Fourier components above roundoff level are kept, so that potentials composed of few
+        harmonics (e.g., Josephson junctions) yield a small number of nonzero diagonals.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+        """
+        grid_shape = self.grid_shape()
+        dim = self.hilbertdim()
+        # fourier[k] = (1/N) sum_j V(phi_j) exp(2 pi i k.j / N)
+        fourier = np.fft.ifftn(self.calculate_phase_potential())
+        fourier_cutoff = 1e-13 * np.max(np.abs(fourier))
+        phase_offsets = np.asarray([variable.get_phase_grid()[0] for variable in self.variables])
+        charge_steps = np.asarray([variable.get_charge_grid()[1] - variable.get_charge_grid()[0]
+                                   if variable.pt_count > 1 else 0.0 for variable in self.variables])
+        pt_counts = np.asarray(grid_shape)
+        charge_indices = np.indices(grid_shape).reshape(len(grid_shape), -1)
+
+        rows, columns, values = [], [], []
+        for k in np.argwhere(np.abs(fourier) > fourier_cutoff):
+            # each Fourier index k contributes to index differences k and k - N (aliases)
+            alias_choices = [(k_i,) if k_i == 0 else (k_i, k_i - n_i) for k_i, n_i in zip(k, pt_counts)]
+            for index_difference in np.array(np.meshgrid(*alias_choices, indexing='ij')).reshape(len(k), -1).T:
+                column_indices = charge_indices - index_difference[:, np.newaxis]
+                valid = np.all((column_indices >= 0) & (column_indices < pt_counts[:, np.newaxis]), axis=0)
+                phase_factor = np.exp(1j * np.sum(index_difference * charge_steps * phase_offsets))
+                rows.append(np.ravel_multi_index(charge_indices[:, valid], grid_shape))
+                columns.append(np.ravel_multi_index(column_indices[:, valid], grid_shape))
+                values.append(np.full(np.count_nonzero(valid), fourier[tuple(k)] * phase_factor))
+        hamiltonian_mat = sparse.coo_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+                                            shape=(dim, dim)).tocsr()
+        hamiltonian_mat += sparse.diags(self.calculate_charge_potential().ravel(), format='csr')
+        return hamiltonian_mat
+
     def find_element(self, element_name: str) -> CircuitElement:
         """
         Returns an element inside the circuit with the specified name, if found.
@@ -577,8 +660,8 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
                             variable.variable_type == 'variable']
         noninverted_indices = [variable_id for variable_id, variable in enumerate(self.variables) if
                                variable.variable_type == 'parameter']
-		inverted_indeces = np.asarray(inverted_indeces, dtype=np.int32)
-		noninverted_indeces = np.asarray(noninverted_indeces, dtype=np.int32)
+        inverted_indices = np.asarray(inverted_indices, dtype=np.int32)
+        noninverted_indices = np.asarray(noninverted_indices, dtype=np.int32)
         if symbolic:
             aii = self.capacitance_matrix_variables(symbolic)[inverted_indices, inverted_indices]
             ain = self.capacitance_matrix_variables(symbolic)[inverted_indices, noninverted_indices]
@@ -619,10 +702,16 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
     def calculate_ndiagonal_hamiltonian(self, d1scheme, d2scheme):
         """
         Calculates the hamiltonian in phase representation in n-diagonal form
-        :param d1scheme: finite difference scheme for first order derivatives
-        :param d2scheme: finite difference scheme for second order derivatives
+        :param d1scheme: finite difference scheme for first order derivatives, or the number of points (3, 5, 7 or 9)
+            of a central stencil from `discretization.FIRST_DERIVATIVE_STENCILS`
+        :param d2scheme: finite difference scheme for second order derivatives, or the number of points (3, 5, 7 or 9)
+            of a central stencil from `discretization.SECOND_DERIVATIVE_STENCILS`
         :returns: the m-ndiagonal kinetic operator
         """
+        if isinstance(d1scheme, int):
+            d1scheme = discretization.first_derivative_stencil(d1scheme)
+        if isinstance(d2scheme, int):
+            d2scheme = discretization.second_derivative_stencil(d2scheme)
         n = len(d1scheme)
         if len(d1scheme) != len(d2scheme):
             raise Exception('ValueError', 'd1scheme and d2scheme lengths are not equal')
@@ -632,7 +721,7 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
             raise Exception('ValueError', 'dscheme length is even')
 
         self.ndiagonal_operator = np.zeros(tuple(n*np.ones((len(self.variables),), dtype=int))+self.grid_shape())
-        slice_diagonal = [(n-1)/2 for v in self.variables]+[slice(0, v.pt_count, 1) for v in self.variables]
+        slice_diagonal = [(n-1)//2 for v in self.variables]+[slice(0, v.pt_count, 1) for v in self.variables]
 
         ECmat = -0.5 * self.capacitance_matrix_legendre_transform()
         # d^2/dxi^2 type elements (C*_ii)
@@ -641,8 +730,8 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
             for column_id in range(n):
                 slice_column = list(slice_diagonal)
                 slice_column[i] = column_id
-                self.ndiagonal_operator[slice_column] += EC / (self.variables[i].get_phase_step() ** 2) * d2scheme[
-                    column_id]
+                self.ndiagonal_operator[tuple(slice_column)] += EC / (self.variables[i].get_phase_step() ** 2) * \
+                    d2scheme[column_id]
         # d^2/dxidxj type elements (C*_ij)
         for i in range(len(self.variables)):
             nondiagonal = (x for x in range(len(self.variables)) if x != i)
@@ -653,12 +742,12 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
                         slice_column = list(slice_diagonal)
                         slice_column[i] = column_id_i
                         slice_column[j] = column_id_j
-                        self.ndiagonal_operator[slice_column] += EC / (
+                        self.ndiagonal_operator[tuple(slice_column)] += EC / (
                                 self.variables[i].get_phase_step() * self.variables[j].get_phase_step()) * (
                                                                          d1scheme[column_id_i] * d1scheme[
                                                                      column_id_j])
 
-        self.ndiagonal_operator[slice_diagonal] += self.phase_potential
+        self.ndiagonal_operator[tuple(slice_diagonal)] += self.phase_potential
 
         self.hamiltonian_ndiagonal = LinearOperator((np.prod(self.grid_shape()), np.prod(self.grid_shape())),
                                                     matvec=self.ndiagonal_operator_action)
@@ -678,7 +767,7 @@ class Circuit(base.QubitBaseClass, serializers.Serializable):
             self.ndiagonal_operator.shape[v_id], dtype=int) for v_id in range(len(self.variables))]), indexing='ij')
         ndiagonal_shifts = np.reshape(ndiagonal_shifts, ndiagonal_columns.shape)
 
-        result = np.zeros(self.grid_shape(), dtype=np.complex)
+        result = np.zeros(self.grid_shape(), dtype=np.complex_)
         for i in range(np.prod(self.ndiagonal_operator.shape[0:len(self.variables)])):
             psii = action[tuple(ndiagonal_columns[:, i]) + tuple([slice(None, None, None)] * len(self.variables))]
             for v_id in range(len(self.variables)):
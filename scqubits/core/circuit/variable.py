@@ -58,6 +58,17 @@ class Variable(discretization.Grid1d):
         """
         return self.make_linspace()
 
+    def get_phase_step(self) -> float:
+        """Returns the spacing between neighboring points of the phase grid
+
+        Returns
+        -------
+        float
+        """
+        if self.pt_count > 1:
+            return (self.max_val - self.min_val) / (self.pt_count - 1)
+        return 0.0
+
     def get_charge_grid(self) -> np.ndarray:
         """Returns a numpy array of the grid points in cooper pair number representation
 
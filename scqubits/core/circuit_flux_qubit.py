@@ -17,6 +17,7 @@ import scipy as sp
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.operators as op
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
@@ -70,6 +71,9 @@ class CircuitFluxQubit(circuit.Circuit):
         charge number cutoff for the charge on both islands `n`,  `n = -ncut, ..., ncut`
     truncated_dim: int, optional
         desired dimension of the truncated quantum system; expected: truncated_dim > 1
+    use_sparse: bool, optional
+        if set to True, the Hamiltonian is assembled as `scipy.sparse.csr_matrix` and diagonalized with `eigsh` in
+        shift-invert mode; recommended for large `ncut` (default value = False)
     """
 
     EJ1 = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
@@ -108,7 +112,7 @@ class CircuitFluxQubit(circuit.Circuit):
         return ['ng1', 'ng2', 'flux', 'ncut', 'truncated_dim']
 
     def __init__(self, EJ1, EJ2, EJ3, ECJ1, ECJ2, ECJ3, ECg1, ECg2, ng1, ng2, flux, ncut,
-                 truncated_dim=None):
+                 truncated_dim=None, use_sparse=False):
         self.EJ1 = EJ1
         self.EJ2 = EJ2
         self.EJ3 = EJ3
@@ -127,7 +131,7 @@ class CircuitFluxQubit(circuit.Circuit):
         self._default_grid = discretization.Grid1d(-np.pi / 2, 3 * np.pi / 2, 100)    # for plotting in phi_j basis
         self._image_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qubit_pngs/fluxqubit.png')
 
-        super().__init__()
+        super().__init__(use_sparse=use_sparse)
 
         self.add_element(circuit.Capacitance('Cg1'), ['g1', '1'])
         self.add_element(circuit.Capacitance('Cg2'), ['g2', '2'])
@@ -178,18 +182,13 @@ class CircuitFluxQubit(circuit.Circuit):
         self.find_element('Cg2').set_capacitance(1 / (8 * self.ECg2))
 
     def _n_operator(self):
-        diag_elements = np.arange(-self.ncut, self.ncut + 1, dtype=np.complex_)
-        return np.diag(diag_elements)
+        return op.charge_number(self.ncut, dtype=np.complex_)
 
     def _exp_i_phi_operator(self):
-        dim = 2 * self.ncut + 1
-        off_diag_elements = np.ones(dim - 1, dtype=np.complex_)
-        e_iphi_matrix = np.diag(off_diag_elements, k=1)
-        return e_iphi_matrix
+        return op.charge_shift(self.ncut, offset=1, dtype=np.complex_)
 
     def _identity(self):
-        dim = 2 * self.ncut + 1
-        return np.eye(dim)
+        return op.identity(2 * self.ncut + 1)
 
     def n_1_operator(self):
         r"""Return charge number operator conjugate to :math:`\phi_1`"""
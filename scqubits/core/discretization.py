@@ -9,6 +9,8 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import time
+
 import numpy as np
 from scipy import sparse
 
@@ -77,9 +79,10 @@ class Grid1d(dispatch.DispatchClient, serializers.Serializable):
         """
         return np.linspace(self.min_val, self.max_val, self.pt_count)
 
-    def first_derivative_matrix(self, prefactor=1.0, periodic=False):
+    def first_derivative_matrix(self, prefactor=1.0, periodic=False, stencil=3):
         """Generate sparse matrix for first derivative of the form :math:`\\partial_{x_i}`.
-        Uses :math:`f'(x) \\approx [f(x+h) - f(x-h)]/2h`.
+        For the default 3-point stencil, uses :math:`f'(x) \\approx [f(x+h) - f(x-h)]/2h`. Higher-order central
+        stencils (5, 7 or 9 points) are available via `stencil`.
 
         Parameters
         ----------
@@ -87,6 +90,8 @@ class Grid1d(dispatch.DispatchClient, serializers.Serializable):
             prefactor of the derivative matrix (default value: 1.0)
         periodic: bool, optional
             set to True if variable is a periodic variable
+        stencil: int, optional
+            number of points in the central finite-difference stencil: 3, 5, 7 or 9 (default value = 3)
 
         Returns
         -------
@@ -97,22 +102,14 @@ class Grid1d(dispatch.DispatchClient, serializers.Serializable):
         else:
             dtp = np.float_
 
-        delta_x = (self.max_val - self.min_val) / self.pt_count
-        offdiag_element = prefactor / (2 * delta_x)
-
-        derivative_matrix = sparse.dia_matrix((self.pt_count, self.pt_count), dtype=dtp)
-        derivative_matrix.setdiag(offdiag_element, k=1)    # occupy first off-diagonal to the right
-        derivative_matrix.setdiag(-offdiag_element, k=-1)  # and left
-
-        if periodic:
-            derivative_matrix.setdiag(-offdiag_element, k=self.pt_count - 1)
-            derivative_matrix.setdiag(offdiag_element, k=-self.pt_count + 1)
+        delta_x = self.grid_spacing()
+        coefficients = prefactor * first_derivative_stencil(stencil) / delta_x
+        return self._stencil_matrix(coefficients, periodic, dtp)
 
-        return derivative_matrix
-
-    def second_derivative_matrix(self, prefactor=1.0, periodic=False):
+    def second_derivative_matrix(self, prefactor=1.0, periodic=False, stencil=3):
         """Generate sparse matrix for second derivative of the form :math:`\\partial^2_{x_i}`.
-        Uses :math:`f''(x) \\approx [f(x+h) - 2f(x) + f(x-h)]/h^2`.
+        For the default 3-point stencil, uses :math:`f''(x) \\approx [f(x+h) - 2f(x) + f(x-h)]/h^2`. Higher-order
+        central stencils (5, 7 or 9 points) are available via `stencil`.
 
         Parameters
         ----------
@@ -120,24 +117,145 @@ class Grid1d(dispatch.DispatchClient, serializers.Serializable):
             optional prefactor of the derivative matrix (default value = 1.0)
         periodic: bool, optional
             set to True if variable is a periodic variable (default value = False)
+        stencil: int, optional
+            number of points in the central finite-difference stencil: 3, 5, 7 or 9 (default value = 3)
 
         Returns
         -------
         sparse matrix in `dia` format
         """
-        delta_x = (self.max_val - self.min_val) / self.pt_count
-        offdiag_element = prefactor / delta_x**2
+        if isinstance(prefactor, complex):
+            dtp = np.complex_
+        else:
+            dtp = np.float_
 
-        derivative_matrix = sparse.dia_matrix((self.pt_count, self.pt_count), dtype=np.float_)
-        derivative_matrix.setdiag(-2.0 * offdiag_element, k=0)
-        derivative_matrix.setdiag(offdiag_element, k=1)
-        derivative_matrix.setdiag(offdiag_element, k=-1)
+        delta_x = self.grid_spacing()
+        coefficients = prefactor * second_derivative_stencil(stencil) / delta_x**2
+        return self._stencil_matrix(coefficients, periodic, dtp)
 
-        if periodic:
-            derivative_matrix.setdiag(offdiag_element, k=self.pt_count - 1)
-            derivative_matrix.setdiag(offdiag_element, k=-self.pt_count + 1)
+    def _stencil_matrix(self, coefficients, periodic, dtype):
+        """Assemble the banded matrix with constant diagonals given by the central stencil `coefficients`. For
+        periodic variables, diagonals wrap around into the corners; for small grids, wrapped diagonals that coincide
+        are summed.
 
-        return derivative_matrix
+        Parameters
+        ----------
+        coefficients: ndarray
+            stencil coefficients for offsets -p, ..., p (length 2p+1)
+        periodic: bool
+        dtype: type
+
+        Returns
+        -------
+        sparse matrix in `dia` format
+        """
+        pt_count = self.pt_count
+        half_width = (len(coefficients) - 1) // 2
+        diagonals = {}
+        for offset, coefficient in zip(range(-half_width, half_width + 1), coefficients):
+            if coefficient == 0:
+                continue
+            offsets = [offset]
+            if periodic and offset != 0:
+                offsets.append(offset - np.sign(offset) * pt_count)
+            for k in offsets:
+                if abs(k) < pt_count:
+                    diagonals[k] = diagonals.get(k, 0) + coefficient
+        return sparse.diags(list(diagonals.values()), list(diagonals.keys()), shape=(pt_count, pt_count),
+                            format='dia', dtype=dtype)
+
+
+# Central finite-difference coefficients for offsets -p, ..., p, keyed by the number of stencil points 2p+1.
+FIRST_DERIVATIVE_STENCILS = {
+    3: [-1/2, 0, 1/2],
+    5: [1/12, -2/3, 0, 2/3, -1/12],
+    7: [-1/60, 3/20, -3/4, 0, 3/4, -3/20, 1/60],
+    9: [1/280, -4/105, 1/5, -4/5, 0, 4/5, -1/5, 4/105, -1/280]
+}
+
+SECOND_DERIVATIVE_STENCILS = {
+    3: [1, -2, 1],
+    5: [-1/12, 4/3, -5/2, 4/3, -1/12],
+    7: [1/90, -3/20, 3/2, -49/18, 3/2, -3/20, 1/90],
+    9: [-1/560, 8/315, -1/5, 8/5, -205/72, 8/5, -1/5, 8/315, -1/560]
+}
+
+
+def _stencil_lookup(stencil_dict, stencil):
+    if stencil not in stencil_dict:
+        raise ValueError("Unsupported stencil: {} points. Supported choices: {}.".format(stencil,
+                                                                                        sorted(stencil_dict)))
+    return np.asarray(stencil_dict[stencil], dtype=np.float_)
+
+
+def first_derivative_stencil(stencil=3):
+    """Returns the coefficients of the central finite-difference stencil for the first derivative (unit spacing).
+
+    Parameters
+    ----------
+    stencil: int, optional
+        number of stencil points: 3, 5, 7 or 9 (default value = 3)
+
+    Returns
+    -------
+    ndarray
+    """
+    return _stencil_lookup(FIRST_DERIVATIVE_STENCILS, stencil)
+
+
+def second_derivative_stencil(stencil=3):
+    """Returns the coefficients of the central finite-difference stencil for the second derivative (unit spacing).
+
+    Parameters
+    ----------
+    stencil: int, optional
+        number of stencil points: 3, 5, 7 or 9 (default value = 3)
+
+    Returns
+    -------
+    ndarray
+    """
+    return _stencil_lookup(SECOND_DERIVATIVE_STENCILS, stencil)
+
+
+def stencil_convergence_benchmark(qubit, pt_counts, stencils=(3, 5, 7, 9), evals_count=6):
+    """Diagonalizes a grid-based qubit (e.g., `ZeroPi` or `FullZeroPi`) for a sequence of grid point counts and
+    finite-difference stencils, recording eigenvalues and wall times. This helps in choosing the smallest grid and
+    stencil combination reaching a desired accuracy. The qubit's `grid` and `stencil` are restored at the end.
+
+    Parameters
+    ----------
+    qubit: QubitBaseClass
+        qubit instance with attributes `grid` (Grid1d) and `stencil` (int)
+    pt_counts: list of int
+        grid point counts to be tested; the grid range of `qubit.grid` is kept fixed
+    stencils: tuple of int, optional
+        stencils to be tested (default value = (3, 5, 7, 9))
+    evals_count: int, optional
+        number of eigenvalues to be computed (default value = 6)
+
+    Returns
+    -------
+    ndarray, ndarray
+        eigenvalues with shape (len(stencils), len(pt_counts), evals_count), and corresponding wall times [s] with
+        shape (len(stencils), len(pt_counts))
+    """
+    previous_grid = qubit.grid
+    previous_stencil = qubit.stencil
+    evals_table = np.empty((len(stencils), len(pt_counts), evals_count), dtype=np.float_)
+    timing_table = np.empty((len(stencils), len(pt_counts)), dtype=np.float_)
+    try:
+        for stencil_index, stencil in enumerate(stencils):
+            qubit.stencil = stencil
+            for pt_index, pt_count in enumerate(pt_counts):
+                qubit.grid = Grid1d(previous_grid.min_val, previous_grid.max_val, pt_count)
+                start_time = time.perf_counter()
+                evals_table[stencil_index, pt_index] = qubit.eigenvals(evals_count=evals_count)
+                timing_table[stencil_index, pt_index] = time.perf_counter() - start_time
+    finally:
+        qubit.grid = previous_grid
+        qubit.stencil = previous_stencil
+    return evals_table, timing_table
 
 
 class GridSpec(dispatch.DispatchClient, serializers.Serializable):
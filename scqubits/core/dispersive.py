@@ -0,0 +1,252 @@
+# dispersive.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+r"""
+Perturbative treatment of a qubit coupled to an oscillator. Dispersive shifts :math:`\chi_j`, Lamb shifts and dressed
+qubit frequencies are obtained from the bare qubit eigenenergies and the bare coupling matrix elements, without
+diagonalizing the Hamiltonian of the composite Hilbert space. This makes scans over oscillator frequencies (and
+over qubit parameters) inexpensive; the results agree with the exact values (as obtained, e.g., by
+`sweep_observables.dispersive_chi`) up to corrections of fourth order in the coupling strength.
+"""
+
+import functools
+
+import numpy as np
+
+import scqubits.core.storage as storage
+import scqubits.settings as settings
+import scqubits.utils.misc as utils
+import scqubits.utils.spectrum_utils as spec_utils
+from scqubits.utils.cpu_switch import get_map_method
+
+if settings.IN_IPYTHON:
+    from tqdm.notebook import tqdm
+else:
+    from tqdm import tqdm
+
+
+def perturbative_energies(qubit_energies, qubit_opmatrices, osc_omegas, osc_opmatrices, g_strengths, add_hc=False,
+                          osc_levels=2, method='perturbative'):
+    r"""Calculates the energies of the dressed states :math:`|\overline{j,n}\rangle` of a qubit coupled to an
+    oscillator, :math:`H = \sum_j E_j |j\rangle\langle j| + \omega a^\dagger a + V`, with the interaction
+    :math:`V = \sum_t g_t A_t B_t` (plus the Hermitean conjugate if `add_hc` is set), where :math:`A_t` are qubit
+    and :math:`B_t` oscillator operators. All bare qubit levels are included as intermediate states.
+
+    Parameters
+    ----------
+    qubit_energies: ndarray
+        bare qubit eigenenergies, shape (..., qubit_levels); leading axes (e.g., one per qubit parameter value) are
+        broadcast against the leading axes of `qubit_opmatrices`
+    qubit_opmatrices: ndarray
+        matrix elements :math:`\langle j|A_t|k\rangle` of the qubit operators in the qubit eigenbasis, shape
+        (term_count, ..., qubit_levels, qubit_levels)
+    osc_omegas: float or ndarray
+        oscillator frequencies
+    osc_opmatrices: ndarray
+        matrix elements :math:`\langle n|B_t|m\rangle` of the oscillator operators in the Fock basis, shape
+        (term_count, osc_dim, osc_dim); they are kept fixed as the oscillator frequency is varied
+    g_strengths: ndarray
+        coupling strengths :math:`g_t`, shape (term_count,)
+    add_hc: bool, optional
+        whether the Hermitean conjugate is added to :math:`V` (default value = False)
+    osc_levels: int, optional
+        number of oscillator levels n = 0, 1, ... for which dressed energies are calculated; must be smaller than
+        osc_dim (default value = 2)
+    method: str, optional
+        'perturbative' (default): Rayleigh-Schroedinger perturbation theory to second order;
+        'schrieffer-wolff': diagonalization of the second-order Schrieffer-Wolff Hamiltonian within the subspace of
+        the `osc_levels` lowest oscillator levels, which treats the coupling among these states exactly and remains
+        valid near qubit-oscillator resonances; this requires (broadcast shape) x qubit_levels^2 x osc_levels^2
+        complex values of memory
+
+    Returns
+    -------
+    ndarray
+        dressed energies :math:`E_{\overline{j,n}}`, shape (..., osc_omegas.shape, qubit_levels, osc_levels), where
+        ... is the broadcast shape of the leading axes of `qubit_energies` and `qubit_opmatrices`
+    """
+    qubit_energies = np.asarray(qubit_energies, dtype=np.float_)
+    qubit_opmatrices = np.asarray(qubit_opmatrices)
+    osc_omegas = np.asarray(osc_omegas, dtype=np.float_)
+    osc_opmatrices = np.asarray(osc_opmatrices)
+    g_strengths = np.asarray(g_strengths)
+    osc_dim = osc_opmatrices.shape[-1]
+    if not 0 < osc_levels < osc_dim:
+        raise ValueError('osc_levels must be positive and smaller than the oscillator dimension {}.'.format(osc_dim))
+    if method not in ('perturbative', 'schrieffer-wolff'):
+        raise ValueError("Unknown method '{}'; use 'perturbative' or 'schrieffer-wolff'.".format(method))
+
+    # coupling matrix elements V[..., j, n, k, m] = <j,n|V|k,m>, rows restricted to n < osc_levels
+    coupling = np.einsum('t,t...jk,tnm->...jnkm', g_strengths, qubit_opmatrices, osc_opmatrices[:, :osc_levels, :])
+    if add_hc:
+        coupling = coupling + np.einsum('t,t...kj,tmn->...jnkm', np.conj(g_strengths), np.conj(qubit_opmatrices),
+                                        np.conj(osc_opmatrices[:, :, :osc_levels]))
+    # append one axis per oscillator frequency: shapes (..., [omega axes,] qubit_levels, osc_levels, ...)
+    omega_axes = (np.newaxis,) * osc_omegas.ndim
+    qubit_energies = qubit_energies[(Ellipsis,) + omega_axes + (slice(None),)]
+    coupling = coupling[(Ellipsis,) + omega_axes + (slice(None),) * 4]
+    omegas = osc_omegas[..., np.newaxis, np.newaxis]    # broadcast against (qubit_levels, osc_levels)
+
+    qubit_levels = qubit_energies.shape[-1]
+    levels = np.arange(osc_levels)
+    bare_energies = qubit_energies[..., :, np.newaxis] + levels * omegas    # (..., qubit_levels, osc_levels)
+
+    if method == 'perturbative':
+        first_order = np.diagonal(np.diagonal(coupling, axis1=-4, axis2=-2), axis1=-3, axis2=-2)   # <j,n|V|j,n>
+        energies = bare_energies + np.real(first_order)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for n in range(osc_levels):
+                for m in range(osc_dim):
+                    couplings_nm = coupling[..., :, n, :, m]    # (..., j, k)
+                    if not np.any(couplings_nm):
+                        continue
+                    # denominators E_j - E_k + (n - m) omega
+                    denominators = (qubit_energies[..., :, np.newaxis] - qubit_energies[..., np.newaxis, :]
+                                    + (n - m) * omegas)
+                    contributions = np.abs(couplings_nm)**2 / denominators
+                    if m == n:
+                        contributions = contributions * (1 - np.eye(qubit_levels))    # exclude the state itself
+                    energies[..., :, n] += np.nansum(contributions, axis=-1)
+        return energies
+
+    # Schrieffer-Wolff: effective Hamiltonian within the subspace P of states with n < osc_levels; states are indexed
+    # by a = j * osc_levels + n
+    dim_p = qubit_levels * osc_levels
+    broadcast_shape = np.broadcast(np.empty(bare_energies.shape),
+                                   np.empty(coupling.shape[:-4] + (qubit_levels, osc_levels))).shape
+    energies_p = np.broadcast_to(bare_energies, broadcast_shape).reshape(broadcast_shape[:-2] + (dim_p,))
+    coupling = np.broadcast_to(coupling, broadcast_shape + (qubit_levels, osc_dim))
+    coupling = coupling.reshape(broadcast_shape[:-2] + (dim_p, qubit_levels, osc_dim))
+    hamiltonian = coupling[..., :osc_levels].reshape(broadcast_shape[:-2] + (dim_p, dim_p)).astype(np.complex_)
+    hamiltonian[..., np.arange(dim_p), np.arange(dim_p)] += energies_p
+    with np.errstate(divide='ignore'):
+        for m in range(osc_levels, osc_dim):
+            couplings_m = coupling[..., :, :, m]     # (..., a, k): <a|V|k,m>
+            if not np.any(couplings_m):
+                continue
+            inverse_denominators = 1 / (energies_p[..., :, np.newaxis] - qubit_energies[..., np.newaxis, :]
+                                        - m * osc_omegas[..., np.newaxis, np.newaxis])
+            second_order = np.matmul(couplings_m * inverse_denominators, np.conj(np.swapaxes(couplings_m, -1, -2)))
+            hamiltonian += (second_order + np.conj(np.swapaxes(second_order, -1, -2))) / 2
+    evals, evecs = np.linalg.eigh(hamiltonian)
+    # assign to each bare state the eigenstate with maximum overlap
+    dressed_indices = np.argmax(np.abs(evecs)**2, axis=-1)
+    energies = np.take_along_axis(evals, dressed_indices, axis=-1)
+    return energies.reshape(broadcast_shape)
+
+
+def _qubit_bare_data_for_paramval(paramval, qubit, param_name, operators, evals_count):
+    """Returns the bare qubit eigenenergies and the matrix-element tables of `operators` in the qubit eigenbasis,
+    with `param_name` set to `paramval` (unless `param_name` is None)."""
+    if param_name is not None:
+        setattr(qubit, param_name, paramval)
+    evals, evecs = qubit.eigensys(evals_count=evals_count)
+    tables = []
+    for operator in operators:
+        if isinstance(operator, str):
+            tables.append(spec_utils.get_matrixelement_table(getattr(qubit, operator)(), evecs))
+        elif isinstance(operator, np.ndarray):
+            tables.append(spec_utils.get_matrixelement_table(operator, evecs))
+        else:   # qutip.Qobj, given in the qubit eigenbasis
+            tables.append(operator.full()[:evals_count, :evals_count])
+    return evals, np.asarray(tables)
+
+
+def _osc_opmatrix(operator, oscillator):
+    """Returns the matrix of `operator` (str, ndarray or qutip.Qobj) in the Fock basis of `oscillator`."""
+    if isinstance(operator, str):
+        return np.asarray(getattr(oscillator, operator)())
+    if isinstance(operator, np.ndarray):
+        return operator
+    return operator.full()
+
+
+def dispersive_shifts(hilbertspace, qubit_subsys, osc_subsys, param_name=None, param_vals=None, osc_omegas=None,
+                      method='perturbative', osc_levels=2, num_cpus=settings.NUM_CPUS):
+    r"""Calculates dispersive shifts, Lamb shifts and dressed qubit frequencies for a qubit coupled to an oscillator
+    by the `InteractionTerm` objects of `hilbertspace` connecting the two. Only the (truncated) bare qubit spectrum
+    and the bare coupling matrix elements are calculated; see `perturbative_energies`. The calculation is vectorized
+    over qubit parameter values and oscillator frequencies.
+
+    With :math:`E_{\overline{j,n}}` the dressed energy of the state with qubit in level j and n oscillator photons,
+
+    * chi: :math:`\chi_j = E_{\overline{j,1}} - E_{\overline{j,0}} - \omega` (as in `sweep_observables.dispersive_chi`)
+    * lamb_shift: :math:`E_{\overline{j,0}} - E_j`
+    * qubit_freqs: :math:`E_{\overline{j,0}} - E_{\overline{0,0}}`
+
+    Parameters
+    ----------
+    hilbertspace: HilbertSpace
+    qubit_subsys: QubitBaseClass
+        qubit subsystem of `hilbertspace`; its truncated_dim sets the number of qubit levels taken into account
+    osc_subsys: Oscillator
+        oscillator subsystem of `hilbertspace`
+    param_name: str, optional
+        name of the qubit parameter to be varied (default value = None: no parameter variation)
+    param_vals: ndarray, optional
+        qubit parameter values
+    osc_omegas: float or ndarray, optional
+        oscillator frequencies (default value = None: use `osc_subsys.E_osc`)
+    method: str, optional
+        'perturbative' or 'schrieffer-wolff', see `perturbative_energies` (default value = 'perturbative')
+    osc_levels: int, optional
+        number of oscillator levels for which the dressed energies are calculated (default value = 2)
+    num_cpus: int, optional
+        number of cores to be used for the bare qubit spectra (default value = settings.NUM_CPUS)
+
+    Returns
+    -------
+    DataStore
+        with data sets `chi`, `lamb_shift`, `qubit_freqs`, each of shape ([param_count,] [osc_omegas.shape,]
+        qubit_levels), and `dressed_energies` of shape ([param_count,] [osc_omegas.shape,] qubit_levels,
+        osc_levels); axes in brackets are present only if `param_vals` or `osc_omegas` are given
+    """
+    terms = [term for term in (hilbertspace.interaction_list or [])
+             if {id(term.subsys1), id(term.subsys2)} == {id(qubit_subsys), id(osc_subsys)}]
+    if not terms:
+        raise ValueError('hilbertspace has no interaction term coupling the given qubit and oscillator.')
+    if len({term.add_hc for term in terms}) > 1:
+        raise ValueError('Interaction terms must either all or none have add_hc set.')
+    qubit_operators = [term.op1 if term.subsys1 is qubit_subsys else term.op2 for term in terms]
+    osc_opmatrices = [_osc_opmatrix(term.op2 if term.subsys1 is qubit_subsys else term.op1, osc_subsys)
+                      for term in terms]
+    g_strengths = [term.g_strength for term in terms]
+
+    evals_count = qubit_subsys.truncated_dim
+    if param_name is None:
+        qubit_energies, qubit_opmatrices = _qubit_bare_data_for_paramval(None, qubit_subsys, None, qubit_operators,
+                                                                         evals_count)
+    else:
+        previous_paramval = getattr(qubit_subsys, param_name)
+        target_map = get_map_method(num_cpus)
+        func = functools.partial(_qubit_bare_data_for_paramval, qubit=qubit_subsys, param_name=param_name,
+                                 operators=qubit_operators, evals_count=evals_count)
+        with utils.InfoBar("Parallel computation of bare qubit data [num_cpus={}]".format(num_cpus), num_cpus):
+            mapdata = list(target_map(func, tqdm(param_vals, desc='Bare qubit data', leave=False,
+                                                 disable=(num_cpus > 1))))
+        setattr(qubit_subsys, param_name, previous_paramval)
+        qubit_energies = np.asarray([evals for evals, _ in mapdata])
+        qubit_opmatrices = np.asarray([tables for _, tables in mapdata]).swapaxes(0, 1)    # term axis first
+
+    if osc_omegas is None:
+        osc_omegas = osc_subsys.E_osc
+    osc_omegas = np.asarray(osc_omegas, dtype=np.float_)
+    energies = perturbative_energies(qubit_energies, qubit_opmatrices, osc_omegas, osc_opmatrices, g_strengths,
+                                     add_hc=terms[0].add_hc, osc_levels=osc_levels, method=method)
+    qubit_energies = qubit_energies[(Ellipsis,) + (np.newaxis,) * osc_omegas.ndim + (slice(None),)]
+
+    data = {'dressed_energies': energies,
+            'lamb_shift': energies[..., 0] - qubit_energies,
+            'qubit_freqs': energies[..., 0] - energies[..., [0], 0]}
+    if osc_levels > 1:
+        data['chi'] = energies[..., 1] - energies[..., 0] - osc_omegas[..., np.newaxis]
+    system_params = {'qubit': qubit_subsys.get_initdata(), 'oscillator': osc_subsys.get_initdata(),
+                     'osc_omegas': osc_omegas}
+    return storage.DataStore(system_params, param_name or '', param_vals, **data)
@@ -9,6 +9,8 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import threading
+
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -20,43 +22,176 @@ else:
     _HAS_IPYWIDGETS = True
 
 try:
-    from IPython.display import display
+    from IPython.display import clear_output, display
 except ImportError:
     _HAS_IPYTHON = False
 else:
     _HAS_IPYTHON = True
 
+import scqubits.core.central_dispatch as dispatch
 import scqubits.core.sweep_generators as swp
+import scqubits.settings as settings
 import scqubits.utils.explorer_panels as panels
 import scqubits.utils.misc as utils
+import scqubits.utils.spectrum_utils as spec_utils
+
+if settings.IN_IPYTHON:
+    from tqdm.notebook import tqdm
+else:
+    from tqdm import tqdm
+
+
+# qubit types for which bare wavefunctions and charge matrix elements are displayed
+_WAVEFUNCTION_QUBIT_TYPES = ['Transmon', 'Fluxonium']
 
 
 class Explorer:
     """
-    This class allows interactive exploration of coupled quantum systems. The generate() method pre-calculates spectral
-    data as a function of a given parameter, which can then be displayed and modified by sliders (when inside jupyter
-    notebook or jupyter lab).
+    This class allows interactive exploration of coupled quantum systems. Upon initialization, all data needed for the
+    explorer panels is pre-calculated as a function of the sweep parameter (optionally in a background thread). This
+    data can then be displayed and modified by sliders (when inside jupyter notebook or jupyter lab); slider changes
+    only select slices of the pre-calculated data and update the existing plot elements.
 
     Parameters
     ----------
     sweep: ParameterSweep
     evals_count: int
     figsize: tuple(int,int), optional
+    background: bool, optional
+        if set to True, panel data is computed in a background thread; `interact()` and `plot_explorer_panels()` wait
+        for the computation to finish and re-raise any exception raised by it (default value = False). The background
+        computation reads the sweep data and temporarily updates the subsystems via the sweep's
+        `update_hilbertspace` (their parameters are restored afterwards); the sweep and its HilbertSpace must not be
+        used or modified until it has finished.
     """
-    def __init__(self, sweep, evals_count, figsize=(10, 8)):
+    def __init__(self, sweep, evals_count, figsize=(10, 8), background=False):
         self.param_name = sweep.param_name
         self.param_vals = sweep.param_vals
         self.param_count = sweep.param_count
         self.sweep = sweep
-        self.evals_count = evals_count
+        self.evals_count = min(evals_count, sweep.evals_count)
         self.figsize = figsize
 
+        self.chi_data = None
+        self.charge_matelem_data = None
+        self.panel_data = None
+        self._panel_data_ready = threading.Event()
+        self._panel_data_error = None
+
+        self._figure = None
+        self._axes_list = None
+        self._handles = {}
+        self._state = {}
+
+        if background:
+            threading.Thread(target=self._compute_panel_data_background, daemon=True).start()
+        else:
+            self._compute_panel_data()
+
+    def _compute_panel_data_background(self):
+        try:
+            self._compute_panel_data()
+        except Exception as error:   # re-raised in the calling thread by `_panel_state`
+            self._panel_data_error = error
+        finally:
+            self._panel_data_ready.set()
+
+    def _compute_panel_data(self):
+        """Pre-calculates the data for all explorer panels. The resulting `panel_data` dictionary holds
+
+        * 'bare_labels': object ndarray (param_count, evals_count), bare labels of dressed states
+        * 'dressed_energies': ndarray (param_count, evals_count), dressed energies relative to the ground state
+        * 'wavefunctions': dict, qbt_index -> dict of phase grid, potential, wavefunction amplitudes, energies and
+          y limits, all indexed by param_index
+        * 'transitions': dict, initial bare labels -> (target labels, transition energies for photonnumber = 1)
+        """
+        sweep = self.sweep
         self.chi_data = swp.generate_chi_sweep(sweep)
         self.charge_matelem_data = swp.generate_charge_matrixelem_sweep(sweep)
 
+        bare_labels = np.empty((self.param_count, self.evals_count), dtype=object)
+        for param_index in range(self.param_count):
+            for dressed_index in range(self.evals_count):
+                bare_labels[param_index, dressed_index] = sweep.lookup.bare_index(dressed_index, param_index)
+
+        energy_table = sweep.dressed_specdata.energy_table[:, :self.evals_count]
+        dressed_energies = energy_table - energy_table[:, [0]]
+
+        wavefunctions = {qbt_index: self._compute_wavefunction_data(qbt_index, qbt_subsys)
+                         for qbt_index, qbt_subsys in sweep.qbt_subsys_list
+                         if type(qbt_subsys).__name__ in _WAVEFUNCTION_QUBIT_TYPES}
+
+        transitions = {}
+        initial_labels_set = {labels for labels in bare_labels.ravel() if labels is not None}
+        for initial_labels in tqdm(sorted(initial_labels_set), desc='transitions', **settings.TQDM_KWARGS):
+            target_labels_list, specdata = swp.generate_qubit_transitions_sweep(sweep, 1, initial_labels)
+            transitions[initial_labels] = (target_labels_list, specdata.energy_table)
+
+        self.panel_data = {
+            'bare_labels': bare_labels,
+            'dressed_energies': dressed_energies,
+            'wavefunctions': wavefunctions,
+            'transitions': transitions
+        }
+        self._panel_data_ready.set()
+
+    def _compute_wavefunction_data(self, qbt_index, qbt_subsys):
+        """Pre-calculates real-valued bare wavefunctions of a 1d qubit in phase basis for all parameter values, using
+        the eigensystems stored in the sweep. Amplitudes are sign-standardized as in `plot_wavefunction`."""
+        bare_specdata = self.sweep.bare_specdata_list[qbt_index]
+        wavefunc_count = qbt_subsys.truncated_dim
+        phi_grid = qbt_subsys._default_grid
+        phi_vals = phi_grid.make_linspace()
+
+        potential_table = np.empty((self.param_count, phi_vals.size))
+        amplitude_table = np.empty((self.param_count, wavefunc_count, phi_vals.size))
+        energy_table = np.empty((self.param_count, wavefunc_count))
+        ylim_list = []
+
+        # parameter updates below must not mark the sweep lookup as out of sync, and are undone afterwards
+        with self.sweep._preserved_hilbertspace(), dispatch.CENTRAL_DISPATCH.suppressed():
+            for param_index in tqdm(range(self.param_count), desc='bare wavefunctions', **settings.TQDM_KWARGS):
+                self.sweep.update_hilbertspace(self.param_vals[param_index])
+                esys = (bare_specdata.energy_table[param_index], bare_specdata.state_table[param_index])
+                potential_table[param_index] = qbt_subsys.potential(phi_vals)
+                for wavefunc_index in range(wavefunc_count):
+                    wavefunc = qbt_subsys.wavefunction(esys, which=wavefunc_index, phi_grid=phi_grid)
+                    amplitude_table[param_index, wavefunc_index] = np.real(spec_utils.standardize_sign(
+                        wavefunc.amplitudes))
+                    energy_table[param_index, wavefunc_index] = wavefunc.energy
+                ylim_list.append(qbt_subsys.wavefunction1d_defaults('real', esys[0], wavefunc_count).get('ylim'))
+
+        return {
+            'phi_vals': phi_vals,
+            'potential_table': potential_table,
+            'amplitude_table': amplitude_table,
+            'energy_table': energy_table,
+            'ylim_list': ylim_list
+        }
+
+    def _panel_state(self, param_val, photonnumber, initial_index, final_index, qbt_index, osc_index):
+        self._panel_data_ready.wait()
+        if self._panel_data_error is not None:
+            raise self._panel_data_error
+        param_index = min(np.searchsorted(self.param_vals, param_val), self.param_count - 1)
+        bare_labels = self.panel_data['bare_labels'][param_index]
+        dressed_energies = self.panel_data['dressed_energies'][param_index]
+        return {
+            'param_index': param_index,
+            'param_val': self.param_vals[param_index],
+            'photonnumber': photonnumber,
+            'initial_bare': bare_labels[initial_index],
+            'final_bare': bare_labels[final_index],
+            'energy_initial': dressed_energies[initial_index],
+            'energy_final': dressed_energies[final_index],
+            'qbt_index': qbt_index,
+            'osc_index': osc_index
+        }
+
     def plot_explorer_panels(self, param_val, photonnumber, initial_index, final_index, qbt_index, osc_index):
         """
         Create a panel of plots (bare spectra, bare wavefunctions, dressed spectrum, n-photon qubit transitions, chi).
+        The figure is retained, and can subsequently be updated via `update_explorer_panels`.
 
         Parameters
         ----------
@@ -77,45 +212,137 @@ class Explorer:
         -------
         Figure, Axes: matplotlib.Figure, matplotlib.Axes
         """
-        def fig_ax(index):
-            return fig, axes_list_flattened[index]
-
-        param_index = np.searchsorted(self.param_vals, param_val)
-        param_val = self.param_vals[param_index]
-
-        initial_bare = self.sweep.lookup.bare_index(initial_index, param_index)
-        final_bare = self.sweep.lookup.bare_index(final_index, param_index)
-        energy_ground = self.sweep.lookup.energy_dressed_index(0, param_index)
-        energy_initial = self.sweep.lookup.energy_dressed_index(initial_index, param_index) - energy_ground
-        energy_final = self.sweep.lookup.energy_dressed_index(final_index, param_index) - energy_ground
-        qbt_subsys = self.sweep.get_subsys(qbt_index)
+        state = self._panel_state(param_val, photonnumber, initial_index, final_index, qbt_index, osc_index)
 
         row_count = 3
         column_count = 2
         fig, axs = plt.subplots(ncols=column_count, nrows=row_count, figsize=self.figsize)
-        axes_list_flattened = [elem for sublist in axs for elem in sublist]
+        self._figure = fig
+        self._axes_list = [elem for sublist in axs for elem in sublist]
+        self._draw_panels(state)
+        fig.tight_layout()
+        return fig, axs
+
+    def update_explorer_panels(self, param_val, photonnumber, initial_index, final_index, qbt_index, osc_index):
+        """
+        Update the panels created by `plot_explorer_panels` for new values of the explorer controls. Only slices of
+        the pre-calculated panel data are selected, and existing plot elements are updated in place. A change of
+        subsystems leads to all panels being redrawn. Rendering of the updated figure is left to the caller (e.g.,
+        `fig.canvas.draw_idle()` for interactive backends).
+
+        Parameters
+        ----------
+        param_val: float
+            current value of the external parameter
+        photonnumber: int
+            photon number n used for display of n-photon qubit transition
+        initial_index: int
+            dressed-state index of the initial state used in transition
+        final_index: int
+            dressed-state index of the final state used in transition (in dressed spectrum display)
+        qbt_index: int
+            index of qubit subsystem for which matrix elements and chi's are displayed
+        osc_index: int
+            index of oscillator subsystem for which chi's are calculated
+
+        Returns
+        -------
+        Figure
+        """
+        if self._figure is None:
+            fig, _ = self.plot_explorer_panels(param_val, photonnumber, initial_index, final_index, qbt_index,
+                                               osc_index)
+            return fig
+
+        state = self._panel_state(param_val, photonnumber, initial_index, final_index, qbt_index, osc_index)
+        previous_state = self._state
+        if (state['qbt_index'], state['osc_index']) != (previous_state['qbt_index'], previous_state['osc_index']):
+            for axes in self._axes_list:
+                axes.clear()
+            self._draw_panels(state)
+            return self._figure
+
+        handles = self._handles
+        param_val = state['param_val']
+        param_index = state['param_index']
+        qbt_index = state['qbt_index']
+
+        panels.update_marker(handles['bare_spectrum'], param_val)
+        if 'wavefunctions' in handles:
+            panels.update_bare_wavefunctions(handles['wavefunctions'], self.panel_data['wavefunctions'][qbt_index],
+                                             param_index)
+        panels.update_dressed_spectrum(handles['dressed_spectrum'], state['initial_bare'], state['final_bare'],
+                                       state['energy_initial'], state['energy_final'], param_val)
+        if state['initial_bare'] != previous_state['initial_bare']:
+            self._axes_list[3].clear()
+            handles['transitions'] = self._draw_transitions_panel(state)
+        else:
+            panels.update_n_photon_qubit_transitions(handles['transitions'], self._transitions_data(state),
+                                                     state['photonnumber'], state['initial_bare'], param_val)
+        panels.update_chi_01(handles['chi_01'], self.chi_data, qbt_index, state['osc_index'], param_index)
+        if 'charge_matrixelems' in handles:
+            if self._bare_qbt_initial(state) != self._bare_qbt_initial(previous_state):
+                self._axes_list[5].clear()
+                handles['charge_matrixelems'] = self._draw_charge_matrixelems_panel(state)
+            else:
+                panels.update_marker(handles['charge_matrixelems'], param_val)
+
+        self._state = state
+        return self._figure
+
+    def _fig_ax(self, index):
+        return self._figure, self._axes_list[index]
+
+    def _transitions_data(self, state):
+        no_transitions = ([], np.empty((self.param_count, 0)))   # initial state without bare-state assignment
+        return self.panel_data['transitions'].get(state['initial_bare'], no_transitions)
+
+    @staticmethod
+    def _bare_qbt_initial(state):
+        if state['initial_bare'] is None:
+            return None
+        return state['initial_bare'][state['qbt_index']]
+
+    def _draw_transitions_panel(self, state):
+        return panels.display_n_photon_qubit_transitions(self.sweep, state['photonnumber'], state['initial_bare'],
+                                                         state['param_val'], self._fig_ax(3),
+                                                         transitions_data=self._transitions_data(state))
+
+    def _draw_charge_matrixelems_panel(self, state):
+        qbt_index = state['qbt_index']
+        qbt_subsys = self.sweep.get_subsys(qbt_index)
+        return panels.display_charge_matrixelems(self.charge_matelem_data, state['initial_bare'],
+                                                 (qbt_index, qbt_subsys), state['param_val'], self._fig_ax(5))
+
+    def _draw_panels(self, state):
+        param_val = state['param_val']
+        qbt_index = state['qbt_index']
+        qbt_subsys = self.sweep.get_subsys(qbt_index)
+        handles = {}
 
         # Panel 1 ----------------------------------
-        panels.display_bare_spectrum(self.sweep, qbt_subsys, param_val, fig_ax(0))
+        handles['bare_spectrum'] = panels.display_bare_spectrum(self.sweep, qbt_subsys, param_val, self._fig_ax(0))
 
         # Panels 2 and 6----------------------------
-        if type(qbt_subsys).__name__ in ['Transmon', 'Fluxonium']:   # do not plot wavefunctions if multi-dimensional
-            panels.display_bare_wavefunctions(self.sweep, qbt_subsys, param_val, fig_ax(1))
-            panels.display_charge_matrixelems(self.charge_matelem_data, initial_bare, (qbt_index, qbt_subsys),
-                                              param_val, fig_ax(5))
+        if type(qbt_subsys).__name__ in _WAVEFUNCTION_QUBIT_TYPES:   # do not plot wavefunctions if multi-dimensional
+            handles['wavefunctions'] = panels.display_bare_wavefunctions_data(
+                self.panel_data['wavefunctions'][qbt_index], (qbt_index, qbt_subsys), state['param_index'],
+                self._fig_ax(1))
+            handles['charge_matrixelems'] = self._draw_charge_matrixelems_panel(state)
 
         # Panel 3 ----------------------------------
-        panels.display_dressed_spectrum(self.sweep, initial_bare, final_bare, energy_initial, energy_final, param_val,
-                                        fig_ax(2))
+        handles['dressed_spectrum'] = panels.display_dressed_spectrum(
+            self.sweep, state['initial_bare'], state['final_bare'], state['energy_initial'], state['energy_final'],
+            param_val, self._fig_ax(2))
 
         # Panel 4 ----------------------------------
-        panels.display_n_photon_qubit_transitions(self.sweep, photonnumber, initial_bare, param_val, fig_ax(3))
+        handles['transitions'] = self._draw_transitions_panel(state)
 
         # Panel 5 ----------------------------------
-        panels.display_chi_01(self.chi_data, qbt_index, osc_index, param_index, fig_ax(4))
-
-        fig.tight_layout()
-        return fig, axs
+        handles['chi_01'] = panels.display_chi_01(self.chi_data, qbt_index, state['osc_index'], state['param_index'],
+                                                  self._fig_ax(4))
+        self._handles = handles
+        self._state = state
 
     @utils.Required(ipywidgets=_HAS_IPYWIDGETS, IPython=_HAS_IPYTHON)
     def interact(self):
@@ -130,8 +357,9 @@ class Explorer:
         param_slider = ipywidgets.FloatSlider(min=param_min, max=param_max, step=param_step,
                                               description=self.param_name, continuous_update=False)
         photon_slider = ipywidgets.IntSlider(value=1, min=1, max=4, description='photon number')
-        initial_slider = ipywidgets.IntSlider(value=0, min=0, max=self.evals_count, description='initial state index')
-        final_slider = ipywidgets.IntSlider(value=1, min=1, max=self.evals_count, description='final state index')
+        initial_slider = ipywidgets.IntSlider(value=0, min=0, max=self.evals_count - 2,
+                                              description='initial state index')
+        final_slider = ipywidgets.IntSlider(value=1, min=1, max=self.evals_count - 1, description='final state index')
 
         qbt_dropdown = ipywidgets.Dropdown(options=qbt_indices, description='qubit subsys')
         osc_dropdown = ipywidgets.Dropdown(options=osc_indices, description='oscillator subsys')
@@ -141,14 +369,29 @@ class Explorer:
 
         initial_slider.observe(update_min_final_index, 'value')
 
-        out = ipywidgets.interactive_output(self.plot_explorer_panels,
-                                            {'param_val': param_slider,
-                                             'photonnumber': photon_slider,
-                                             'initial_index': initial_slider,
-                                             'final_index': final_slider,
-                                             'qbt_index': qbt_dropdown,
-                                             'osc_index': osc_dropdown
-                                             })
+        controls = {'param_val': param_slider,
+                    'photonnumber': photon_slider,
+                    'initial_index': initial_slider,
+                    'final_index': final_slider,
+                    'qbt_index': qbt_dropdown,
+                    'osc_index': osc_dropdown}
+
+        out = ipywidgets.Output()
+
+        def show_figure():
+            with out:
+                clear_output(wait=True)
+                display(self._figure)
+
+        def update_panels(*args):
+            self.update_explorer_panels(**{name: widget.value for name, widget in controls.items()})
+            show_figure()
+
+        fig, _ = self.plot_explorer_panels(**{name: widget.value for name, widget in controls.items()})
+        plt.close(fig)   # figure is displayed and refreshed through the output widget only
+        for widget in controls.values():
+            widget.observe(update_panels, 'value')
+        show_figure()
 
         left_box = ipywidgets.VBox([param_slider])
         mid_box = ipywidgets.VBox([initial_slider, final_slider, photon_slider])
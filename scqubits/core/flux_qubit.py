@@ -12,16 +12,16 @@
 import os
 
 import numpy as np
-import scipy as sp
+from scipy import sparse
 
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.operators as op
 from scqubits.core.noise import NoisySystem, NOISE_PARAMS
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
-import scqubits.utils.plotting as plot
 import scqubits.utils.spectrum_utils as spec_utils
 
 
@@ -56,7 +56,7 @@ class NoisyFluxQubit(NoisySystem):
         if 'tphi_1_over_f_cc1' not in self.supported_noise_channels():
             raise RuntimeError("Critical current noise channel 'tphi_1_over_f_cc1' is not supported in this system.")
 
-        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ1(),
+        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ1,
                                   esys=esys, get_rate=get_rate, **kwargs)
 
     def tphi_1_over_f_cc2(self, A_noise=NOISE_PARAMS['A_cc'], i=0, j=1, esys=None, get_rate=False, **kwargs):
@@ -87,7 +87,7 @@ class NoisyFluxQubit(NoisySystem):
         if 'tphi_1_over_f_cc2' not in self.supported_noise_channels():
             raise RuntimeError("Critical current noise channel 'tphi_1_over_f_cc2' is not supported in this system.")
 
-        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ2(),
+        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ2,
                                   esys=esys, get_rate=get_rate, **kwargs)
 
     def tphi_1_over_f_cc3(self, A_noise=NOISE_PARAMS['A_cc'], i=0, j=1, esys=None, get_rate=False, **kwargs):
@@ -117,7 +117,7 @@ class NoisyFluxQubit(NoisySystem):
         if 'tphi_1_over_f_cc3' not in self.supported_noise_channels():
             raise RuntimeError("Critical current noise channel 'tphi_1_over_f_cc3' is not supported in this system.")
 
-        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ3(),
+        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ3,
                                   esys=esys, get_rate=get_rate, **kwargs)
 
     def tphi_1_over_f_cc(self, A_noise=NOISE_PARAMS['A_cc'], i=0, j=1, esys=None, get_rate=False, **kwargs):
@@ -201,6 +201,10 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         charge number cutoff for the charge on both islands `n`,  `n = -ncut, ..., ncut`
     truncated_dim: int, optional
         desired dimension of the truncated quantum system; expected: truncated_dim > 1
+    use_sparse: bool, optional
+        if set to True, the Hamiltonian and operators are assembled as `scipy.sparse.csr_matrix`, avoiding dense
+        intermediate arrays; recommended for large `ncut` (default value = False). The eigensolver is selected
+        automatically (see `eigensolver`).
     """
 
     EJ1 = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
@@ -217,7 +221,7 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
     ncut = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
 
     def __init__(self, EJ1, EJ2, EJ3, ECJ1, ECJ2, ECJ3, ECg1, ECg2, ng1, ng2, flux, ncut,
-                 truncated_dim=None):
+                 truncated_dim=None, use_sparse=False):
         self.EJ1 = EJ1
         self.EJ2 = EJ2
         self.EJ3 = EJ3
@@ -231,6 +235,7 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         self.flux = flux
         self.ncut = ncut
         self.truncated_dim = truncated_dim
+        self.use_sparse = use_sparse
         self._sys_type = type(self).__name__
         self._evec_dtype = np.complex_
         self._default_grid = discretization.Grid1d(-np.pi / 2, 3 * np.pi / 2, 100)    # for plotting in phi_j basis
@@ -281,17 +286,6 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
 
         return np.linalg.inv(Cmat) / 2.
 
-    def _evals_calc(self, evals_count):
-        hamiltonian_mat = self.hamiltonian()
-        evals = sp.linalg.eigh(hamiltonian_mat, eigvals=(0, evals_count - 1), eigvals_only=True)
-        return np.sort(evals)
-
-    def _esys_calc(self, evals_count):
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sp.linalg.eigh(hamiltonian_mat, eigvals=(0, evals_count - 1), eigvals_only=False)
-        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
-        return evals, evecs
-
     def hilbertdim(self):
         """Return Hilbert space dimension."""
         return (2 * self.ncut + 1) ** 2
@@ -305,26 +299,26 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         """Return the kinetic energy matrix."""
         ECmat = self.EC_matrix()
 
-        kinetic_mat = 4.0 * ECmat[0, 0] * np.kron(np.matmul(self._n_operator() - self.ng1 * self._identity(),
-                                                            self._n_operator() - self.ng1 * self._identity()),
-                                                  self._identity())
-        kinetic_mat += 4.0 * ECmat[1, 1] * np.kron(self._identity(),
-                                                   np.matmul(self._n_operator() - self.ng2 * self._identity(),
-                                                             self._n_operator() - self.ng2 * self._identity()))
-        kinetic_mat += 4.0 * (ECmat[0, 1] + ECmat[1, 0]) * np.kron(self._n_operator() - self.ng1 * self._identity(),
-                                                                   self._n_operator() - self.ng2 * self._identity())
+        kinetic_mat = 4.0 * ECmat[0, 0] * self._kron((self._n_operator() - self.ng1 * self._identity())
+                                                     @ (self._n_operator() - self.ng1 * self._identity()),
+                                                     self._identity())
+        kinetic_mat += 4.0 * ECmat[1, 1] * self._kron(self._identity(),
+                                                      (self._n_operator() - self.ng2 * self._identity())
+                                                      @ (self._n_operator() - self.ng2 * self._identity()))
+        kinetic_mat += 4.0 * (ECmat[0, 1] + ECmat[1, 0]) * self._kron(self._n_operator() - self.ng1 * self._identity(),
+                                                                      self._n_operator() - self.ng2 * self._identity())
         return kinetic_mat
 
     def potentialmat(self):
         """Return the potential energy matrix for the potential."""
-        potential_mat = -0.5 * self.EJ1 * np.kron(self._exp_i_phi_operator() + self._exp_i_phi_operator().T,
-                                                  self._identity())
-        potential_mat += -0.5 * self.EJ2 * np.kron(self._identity(),
-                                                   self._exp_i_phi_operator() + self._exp_i_phi_operator().T)
+        potential_mat = -0.5 * self.EJ1 * self._kron(self._exp_i_phi_operator() + self._exp_i_phi_operator().T,
+                                                     self._identity())
+        potential_mat += -0.5 * self.EJ2 * self._kron(self._identity(),
+                                                      self._exp_i_phi_operator() + self._exp_i_phi_operator().T)
         potential_mat += -0.5 * self.EJ3 * (np.exp(1j * 2 * np.pi * self.flux)
-                                            * np.kron(self._exp_i_phi_operator(), self._exp_i_phi_operator().T))
+                                            * self._kron(self._exp_i_phi_operator(), self._exp_i_phi_operator().T))
         potential_mat += -0.5 * self.EJ3 * (np.exp(-1j * 2 * np.pi * self.flux)
-                                            * np.kron(self._exp_i_phi_operator().T, self._exp_i_phi_operator()))
+                                            * self._kron(self._exp_i_phi_operator().T, self._exp_i_phi_operator()))
         return potential_mat
 
     def hamiltonian(self):
@@ -333,48 +327,51 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
 
     def d_hamiltonian_d_EJ1(self):
         """Returns operator representing a derivittive of the Hamiltonian with respect to EJ1."""
-        return -0.5 * np.kron(self._exp_i_phi_operator() + self._exp_i_phi_operator().T, self._identity())
+        return -0.5 * self._kron(self._exp_i_phi_operator() + self._exp_i_phi_operator().T, self._identity())
 
     def d_hamiltonian_d_EJ2(self):
         """Returns operator representing a derivittive of the Hamiltonian with respect to EJ2."""
-        return -0.5 * np.kron(self._identity(), self._exp_i_phi_operator() + self._exp_i_phi_operator().T)
+        return -0.5 * self._kron(self._identity(), self._exp_i_phi_operator() + self._exp_i_phi_operator().T)
 
     def d_hamiltonian_d_EJ3(self):
         """Returns operator representing a derivittive of the Hamiltonian with respect to EJ3."""
         return (-0.5 * (np.exp(1j * 2 * np.pi * self.flux)
-                                            * np.kron(self._exp_i_phi_operator(), self._exp_i_phi_operator().T)))\
-               + (-0.5 * (np.exp(-1j * 2 * np.pi * self.flux)
-                                            * np.kron(self._exp_i_phi_operator().T, self._exp_i_phi_operator())))
+                        * self._kron(self._exp_i_phi_operator(), self._exp_i_phi_operator().T))) \
+            + (-0.5 * (np.exp(-1j * 2 * np.pi * self.flux)
+                       * self._kron(self._exp_i_phi_operator().T, self._exp_i_phi_operator())))
+
+    def _kron(self, operator1, operator2):
+        if self.use_sparse:
+            return sparse.kron(operator1, operator2, format='csr')
+        return np.kron(operator1, operator2)
+
+    def _sparse_format(self):
+        return 'csr' if self.use_sparse else None
 
     def _n_operator(self):
-        diag_elements = np.arange(-self.ncut, self.ncut + 1, dtype=np.complex_)
-        return np.diag(diag_elements)
+        return op.charge_number(self.ncut, sparse_format=self._sparse_format(), dtype=np.complex_)
 
     def _exp_i_phi_operator(self):
-        dim = 2 * self.ncut + 1
-        off_diag_elements = np.ones(dim - 1, dtype=np.complex_)
-        e_iphi_matrix = np.diag(off_diag_elements, k=1)
-        return e_iphi_matrix
+        return op.charge_shift(self.ncut, offset=1, sparse_format=self._sparse_format(), dtype=np.complex_)
 
     def _identity(self):
-        dim = 2 * self.ncut + 1
-        return np.eye(dim)
+        return op.identity(2 * self.ncut + 1, sparse_format=self._sparse_format())
 
     def n_1_operator(self):
         r"""Return charge number operator conjugate to :math:`\phi_1`"""
-        return np.kron(self._n_operator(), self._identity())
+        return self._kron(self._n_operator(), self._identity())
 
     def n_2_operator(self):
         r"""Return charge number operator conjugate to :math:`\phi_2`"""
-        return np.kron(self._identity(), self._n_operator())
+        return self._kron(self._identity(), self._n_operator())
 
     def exp_i_phi_1_operator(self):
         r"""Return operator :math:`e^{i\phi_1}` in the charge basis."""
-        return np.kron(self._exp_i_phi_operator(), self._identity())
+        return self._kron(self._exp_i_phi_operator(), self._identity())
 
     def exp_i_phi_2_operator(self):
         r"""Return operator :math:`e^{i\phi_2}` in the charge basis."""
-        return np.kron(self._identity(), self._exp_i_phi_operator())
+        return self._kron(self._identity(), self._exp_i_phi_operator())
 
     def cos_phi_1_operator(self):
         """Return operator :math:`\\cos \\phi_1` in the charge basis"""
@@ -413,6 +410,7 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         **kwargs:
             plot options
         """
+        import scqubits.utils.plotting as plot
         phi_grid = phi_grid or self._default_grid
         x_vals = y_vals = phi_grid.make_linspace()
         if 'figsize' not in kwargs:
@@ -458,6 +456,42 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
                                                      [phi_grid.min_val, phi_grid.max_val, phi_grid.pt_count]]))
         return storage.WaveFunctionOnGrid(grid2d, wavefunc_amplitudes)
 
+    def update_wavefunction_plot(self, handle=None, which=0, phi_grid=None, mode='abs', zero_calibrate=True):
+        """Plots the 2d phase-basis wave function with index `which` for the current parameters. If a plot handle from
+        a previous call is provided, the existing plot is updated in place instead of creating a new figure.
+
+        Parameters
+        ----------
+        handle: Wavefunction2dHandle, optional
+            handle returned by a previous call to `update_wavefunction_plot` (default value = None)
+        which: int, optional
+            index of wave function to be plotted (default value = 0)
+        phi_grid: Grid1d, optional
+            used for setting a custom grid for phi; if None use self._default_grid
+        mode: str, optional
+            choices as specified in `constants.MODE_FUNC_DICT` (default value = 'abs')
+        zero_calibrate: bool, optional
+            if True, colors are adjusted to use zero wavefunction amplitude as the neutral color in the palette
+
+        Returns
+        -------
+        Wavefunction2dHandle
+        """
+        return self._wavefunction_plot_renderer(which=which, phi_grid=phi_grid, mode=mode,
+                                                zero_calibrate=zero_calibrate)(handle)
+
+    def _wavefunction_plot_renderer(self, which=0, phi_grid=None, mode='abs', zero_calibrate=True):
+        import scqubits.utils.plotting as plot
+        wavefunc = self.wavefunction(phi_grid=phi_grid, which=which)
+        wavefunc.amplitudes = constants.MODE_FUNC_DICT[mode](wavefunc.amplitudes)
+
+        def render(handle):
+            if handle is None:
+                return plot.Wavefunction2dHandle(wavefunc, zero_calibrate=zero_calibrate, figsize=(5, 5))
+            handle.update(wavefunc)
+            return handle
+        return render
+
     def plot_wavefunction(self, esys=None, which=0, phi_grid=None, mode='abs', zero_calibrate=True, **kwargs):
         """Plots 2d phase-basis wave function.
 
@@ -480,6 +514,7 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         -------
         Figure, Axes
         """
+        import scqubits.utils.plotting as plot
         amplitude_modifier = constants.MODE_FUNC_DICT[mode]
         wavefunc = self.wavefunction(esys, phi_grid=phi_grid, which=which)
         wavefunc.amplitudes = amplitude_modifier(wavefunc.amplitudes)
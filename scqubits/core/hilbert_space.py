@@ -25,6 +25,7 @@ import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.settings as settings
 import scqubits.ui.hspace_widget
 import scqubits.utils.cpu_switch as cpu_switch
+import scqubits.utils.eigensolvers as eigensolvers
 import scqubits.utils.misc as utils
 import scqubits.utils.spectrum_utils as spec_utils
 
@@ -95,6 +96,10 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
     lookup = descriptors.ReadOnlyProperty()
     interaction_list = descriptors.WatchedProperty('INTERACTIONLIST_UPDATE')
 
+    # weights w_i defining the excitation number N = sum_i w_i n_i conserved by the Hamiltonian (see
+    # `excitation_blocks`); 'auto': unit weights, used only if N is conserved; None: no block diagonalization
+    excitation_weights = 'auto'
+
     def __init__(self, subsystem_list, interaction_list=None):
 
         # Make sure all the given subsystems have required parameters set up. 
@@ -231,38 +236,134 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
         self._lookup = spec_lookup.SpectrumLookup(self, bare_specdata_list=bare_specdata_list,
                                                   dressed_specdata=dressed_specdata)
 
-    def eigenvals(self, evals_count=6):
-        """Calculates eigenvalues of the full Hamiltonian using `qutip.Qob.eigenenergies()`.
+    def eigenvals(self, evals_count=6, num_cpus=1):
+        """Calculates eigenvalues of the full Hamiltonian using `qutip.Qob.eigenenergies()`. If the Hamiltonian
+        conserves the excitation number (see `excitation_blocks`), the blocks are diagonalized independently.
 
         Parameters
         ----------
         evals_count: int, optional
             number of desired eigenvalues/eigenstates
+        num_cpus: int, optional
+            number of cores among which excitation-number blocks are distributed (default value = 1)
 
         Returns
         -------
         eigenvalues: ndarray of float
         """
         hamiltonian_mat = self.hamiltonian()
-        return hamiltonian_mat.eigenenergies(eigvals=evals_count)
+        blocks = self.excitation_blocks(hamiltonian_mat)
+        if blocks is None:
+            return hamiltonian_mat.eigenenergies(eigvals=evals_count)
+        return eigensolvers.blockwise_eigensys(hamiltonian_mat.data, blocks, evals_count, return_eigenvectors=False,
+                                              num_cpus=num_cpus)
 
-    def eigensys(self, evals_count):
-        """Calculates eigenvalues and eigenvectore of the full Hamiltonian using `qutip.Qob.eigenstates()`.
+    def eigensys(self, evals_count, num_cpus=1):
+        """Calculates eigenvalues and eigenvectore of the full Hamiltonian using `qutip.Qob.eigenstates()`. If the
+        Hamiltonian conserves the excitation number (see `excitation_blocks`), the blocks are diagonalized
+        independently.
 
         Parameters
         ----------
         evals_count: int, optional
             number of desired eigenvalues/eigenstates
+        num_cpus: int, optional
+            number of cores among which excitation-number blocks are distributed (default value = 1)
+
+        Returns
+        -------
+        evals: ndarray of float
+        evecs: ndarray of Qobj kets
+        """
+        return self._hamiltonian_eigensys(self.hamiltonian(), evals_count, num_cpus)
+
+    def _hamiltonian_eigensys(self, hamiltonian_mat, evals_count, num_cpus=1):
+        """Returns eigenvalues and eigenvectors (as QutipEigenstates) of the given Hamiltonian of the composite Hilbert
+        space, diagonalized block by block if it conserves the excitation number."""
+        blocks = self.excitation_blocks(hamiltonian_mat)
+        if blocks is None:
+            evals, evecs = hamiltonian_mat.eigenstates(eigvals=evals_count)
+            return evals, evecs.view(scqubits.io_utils.fileio_qutip.QutipEigenstates)
+        evals, evecs = eigensolvers.blockwise_eigensys(hamiltonian_mat.data, blocks, evals_count, num_cpus=num_cpus)
+        return evals, spec_utils.convert_evecs_to_qutip_eigenstates(evecs, self.subsystem_dims)
+
+    def excitation_numbers(self, weights=None):
+        """Returns the excitation number :math:`N = \\sum_i w_i n_i` of each bare product state, where :math:`n_i` is
+        the bare label of subsystem i. States are ordered as the basis of the composite Hilbert space.
+
+        Parameters
+        ----------
+        weights: list of int, optional
+            weights :math:`w_i` of the subsystems (default value = None: `excitation_weights` if set to a list,
+            otherwise 1 for all subsystems)
+
+        Returns
+        -------
+        ndarray of int
+        """
+        if weights is None:
+            weights = self.excitation_weights
+        if weights is None or isinstance(weights, str):
+            weights = [1] * self.subsystem_count
+        bare_labels = np.indices(self.subsystem_dims).reshape(self.subsystem_count, -1)
+        return np.tensordot(np.asarray(weights, dtype=np.int_), bare_labels, axes=1)
+
+    def excitation_blocks(self, hamiltonian_mat=None):
+        """Partitions the bare product states into blocks of equal excitation number (see `excitation_numbers`), if
+        the Hamiltonian conserves the excitation number. This is the case for couplings of Jaynes-Cummings type, e.g.,
+        `InteractionTerm` objects with `add_hc=True` coupling a qubit lowering operator to an oscillator raising
+        operator. Whether blocks are used is controlled by `excitation_weights`: with 'auto' (default), unit weights are
+        tried; with a list of weights, conservation of the corresponding excitation number is required; with None,
+        no partitioning is performed.
+
+        Parameters
+        ----------
+        hamiltonian_mat: qutip.Qobj, optional
+            Hamiltonian of the composite Hilbert space (default value = None: use `hamiltonian()`)
+
+        Returns
+        -------
+        list of ndarray or None
+            basis indices of the states in each block, ordered by excitation number; None if the Hamiltonian does not
+            separate into several blocks
+        """
+        if self.excitation_weights is None or self.subsystem_count < 2:
+            return None
+        if hamiltonian_mat is None:
+            hamiltonian_mat = self.hamiltonian()
+        blocks = eigensolvers.conserved_blocks(hamiltonian_mat.data, self.excitation_numbers())
+        if blocks is None and not isinstance(self.excitation_weights, str):
+            raise ValueError('The Hamiltonian does not conserve the excitation number defined by excitation_weights = '
+                             '{}.'.format(self.excitation_weights))
+        if blocks is None or len(blocks) == 1:
+            return None
+        return blocks
+
+    def eigensys_for_bare_states(self, bare_labels, candidates_count=3):
+        """Calculates the dressed eigenstates belonging to the given bare product states, i.e., the eigenstates of the
+        full Hamiltonian with largest overlap. For large Hilbert spaces, only the few eigenstates with energies
+        closest to each bare state are obtained (shift-invert mode, see `eigensolvers.eigensys_for_basis_states`),
+        so that states high up in the spectrum (e.g., with many oscillator photons) are accessible without
+        calculating all states below.
+
+        Parameters
+        ----------
+        bare_labels: list of tuple(int)
+            bare product states, each specified by its bare labels (index1, index2, ...)
+        candidates_count: int, optional
+            number of eigenstates closest in energy to a bare state among which the one with largest overlap is
+            selected (default value = 3)
 
         Returns
         -------
         evals: ndarray of float
         evecs: ndarray of Qobj kets
+            one dressed eigenstate per entry of `bare_labels`, in the same order
         """
         hamiltonian_mat = self.hamiltonian()
-        evals, evecs = hamiltonian_mat.eigenstates(eigvals=evals_count)
-        evecs = evecs.view(scqubits.io_utils.fileio_qutip.QutipEigenstates)
-        return evals, evecs
+        positions = np.ravel_multi_index(tuple(np.asarray(bare_labels).T), self.subsystem_dims)
+        evals, evecs = eigensolvers.eigensys_for_basis_states(hamiltonian_mat.data, positions, candidates_count)
+        return evals, spec_utils.convert_evecs_to_qutip_eigenstates(evecs, self.subsystem_dims)
 
     def diag_operator(self, diag_elements, subsystem):
         """For given diagonal elements of a diagonal operator in `subsystem`, return the `Qobj` operator for the
@@ -9,14 +9,15 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
-import matplotlib.pyplot as plt
+import contextlib
+import functools
 import math
 import numpy as np
 import scipy as sp
 import scipy.constants
-import scqubits.utils.plotting as plotting
 import scqubits.core.units as units
 import scqubits.settings as settings
+import scqubits.utils.spectrum_utils as spec_utils
 
 # Helpers for units conversion
 
@@ -81,6 +82,14 @@ NOISE_PARAMS = {
 }
 
 
+def _noise_op_key(noise_op):
+    """Returns a hashable key identifying a noise operator given as a callable (bound method or `functools.partial`
+    of a bound method)."""
+    if isinstance(noise_op, functools.partial):
+        return noise_op.func, noise_op.args, tuple(sorted(noise_op.keywords.items()))
+    return noise_op
+
+
 class NoisySystem:
 
     def effective_noise_channels(self):
@@ -125,6 +134,8 @@ class NoisySystem:
         Figure, Axes
 
         """
+        import matplotlib.pyplot as plt
+        import scqubits.utils.plotting as plotting
         common_noise_options = {} if common_noise_options is None else common_noise_options
 
         # if we're not told what channels to consider, just use the supported list
@@ -258,6 +269,8 @@ class NoisySystem:
         Figure, Axes
 
         """
+        import matplotlib.pyplot as plt
+        import scqubits.utils.plotting as plotting
         common_noise_options = {} if common_noise_options is None else common_noise_options
 
         # If we're not given channels to consider, just use the effective noise channel list that
@@ -355,6 +368,8 @@ class NoisySystem:
         Figure, Axes
 
         """
+        import matplotlib.pyplot as plt
+        import scqubits.utils.plotting as plotting
         common_noise_options = {} if common_noise_options is None else common_noise_options
 
         # If we're not given channels to consider, just use ones from the effective noise channel list
@@ -427,6 +442,53 @@ class NoisySystem:
         coherence rate: float
 
         """
+        with self._noise_op_cache():
+            return self._sum_channel_rates(noise_channels, common_noise_options, esys, noise_type)
+
+    @contextlib.contextmanager
+    def _noise_op_cache(self):
+        """Within this context, noise operators passed to `t1` and `tphi_1_over_f` as callables (e.g., the bound
+        method `self.d_hamiltonian_d_flux`) are constructed and transformed to the eigenbasis only once per
+        eigensystem. The eigenbasis representation is then shared between all noise channels using the operator."""
+        if self.__dict__.get('_noise_op_tables') is not None:    # nested use: keep the outer cache
+            yield
+            return
+        self._noise_op_tables = {}
+        try:
+            yield
+        finally:
+            del self._noise_op_tables
+
+    def _noise_op_matrixelement(self, noise_op, evecs, i, j):
+        """Returns the matrix element `<i|noise_op|j>` with respect to the eigenvectors `evecs`. Inside
+        `_noise_op_cache`, the full table of matrix elements is calculated once for every noise operator given as a
+        callable, and reused.
+
+        Parameters
+        ----------
+        noise_op: operator (ndarray or sparse matrix) or callable
+            noise operator, or callable without arguments returning the noise operator
+        evecs: ndarray
+            eigenvectors, `evecs[:, 0]` is the first eigenvector etc.
+        i, j: int
+
+        Returns
+        -------
+        complex
+        """
+        tables = self.__dict__.get('_noise_op_tables')
+        if tables is not None and callable(noise_op):
+            key = (_noise_op_key(noise_op), id(evecs))
+            if key not in tables:
+                # evecs are stored along with the table, so that id(evecs) remains a valid key
+                tables[key] = (evecs, spec_utils.get_matrixelement_table(noise_op(), evecs))
+            return tables[key][1][i, j]
+        if callable(noise_op):
+            noise_op = noise_op()
+        return np.vdot(evecs[:, i], noise_op.dot(evecs[:, j]))
+
+    def _sum_channel_rates(self, noise_channels, common_noise_options, esys, noise_type):
+        """Sums the rates of all `noise_channels`, see `_effective_rate`."""
         rate = 0.0
 
         for n, noise_channel in enumerate(noise_channels):
@@ -623,8 +685,10 @@ class NoisySystem:
             state index that along with j defines a qubit
         j: int >=0
             state index that along with i defines a qubit
-        noise_op: operator (ndarray)
-            noise operator, typically Hamiltonian derivative w.r.t. noisy parameter
+        noise_op: operator (ndarray or sparse matrix) or callable
+            noise operator, typically Hamiltonian derivative w.r.t. noisy parameter; may be given as a callable without
+            arguments returning the operator, allowing `t1_effective` and `t2_effective` to share its eigenbasis
+            representation between noise channels
         esys: tuple(ndarray, ndarray)
             evals, evecs tuple
         get_rate: bool
@@ -646,13 +710,8 @@ class NoisySystem:
 
         evals, evecs = self.eigensys(evals_count=max(j, i)+1) if esys is None else esys
 
-        if isinstance(noise_op, np.ndarray):  # Check if the operator is given in dense form
-            # if so, use numpy's vdot and dot
-            rate = np.abs(np.vdot(evecs[:, i], np.dot(noise_op, evecs[:, i])) -
-                          np.vdot(evecs[:, j], np.dot(noise_op, evecs[:, j])))
-        else:  # Else, we have a sparse operator, use it's own dot method.
-            rate = np.abs(np.vdot(evecs[:, i], noise_op.dot(evecs[:, i])) -
-                          np.vdot(evecs[:, j], noise_op.dot(evecs[:, j])))
+        rate = np.abs(self._noise_op_matrixelement(noise_op, evecs, i, i) -
+                      self._noise_op_matrixelement(noise_op, evecs, j, j))
 
         rate *= A_noise * np.sqrt(2 * np.abs(np.log(p['omega_low'] * p['t_exp'])))
 
@@ -692,7 +751,7 @@ class NoisySystem:
         if 'tphi_1_over_f_flux' not in self.supported_noise_channels():
             raise RuntimeError("Flux noise channel 'tphi_1_over_f_flux' is not supported in this system.")
 
-        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_flux(),
+        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_flux,
                                   esys=esys, get_rate=get_rate, **kwargs)
 
     def tphi_1_over_f_cc(self, A_noise=NOISE_PARAMS['A_cc'], i=0, j=1, esys=None, get_rate=False, **kwargs):
@@ -722,7 +781,7 @@ class NoisySystem:
         if 'tphi_1_over_f_cc' not in self.supported_noise_channels():
             raise RuntimeError("Critical current noise channel 'tphi_1_over_f_cc' is not supported in this system.")
 
-        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ(),
+        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_EJ,
                                   esys=esys, get_rate=get_rate, **kwargs)
 
     def tphi_1_over_f_ng(self, A_noise=NOISE_PARAMS['A_ng'], i=0, j=1, esys=None, get_rate=False, **kwargs):
@@ -752,7 +811,7 @@ class NoisySystem:
         if 'tphi_1_over_f_ng' not in self.supported_noise_channels():
             raise RuntimeError("Charge noise channel 'tphi_1_over_f_ng' is not supported in this system.")
 
-        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_ng(),
+        return self.tphi_1_over_f(A_noise=A_noise, i=i, j=j, noise_op=self.d_hamiltonian_d_ng,
                                   esys=esys, get_rate=get_rate, **kwargs)
 
     def t1(self, i, j, noise_op, spectral_density, total=True, esys=None, get_rate=False, **kwargs):
@@ -776,8 +835,9 @@ class NoisySystem:
             state index that along with j defines a transition (i->j)
         j: int >=0
             state index that along with i defines a transition (i->j)
-        noise_op: operator (ndarray)
-            noise operator
+        noise_op: operator (ndarray or sparse matrix) or callable
+            noise operator; may be given as a callable without arguments returning the operator, allowing
+            `t1_effective` and `t2_effective` to share its eigenbasis representation between noise channels
         spectral_density: callable object 
             defines a spectral density, must take one argument: `omega`
             (assumed to be in units of `2 \pi * <system units>`)
@@ -810,11 +870,7 @@ class NoisySystem:
 
         s = spectral_density(omega) + spectral_density(-omega) if total else spectral_density(omega)
 
-        if isinstance(noise_op, np.ndarray):  # Check if the operator is given in dense form
-            # if so, use numpy's vdot and dot
-            rate = np.abs(np.vdot(evecs[:, i], np.dot(noise_op, evecs[:, j])))**2 * s
-        else:  # Else, we have a sparse operator, use it's own dot method.
-            rate = np.abs(np.vdot(evecs[:, i], noise_op.dot(evecs[:, j])))**2 * s
+        rate = np.abs(self._noise_op_matrixelement(noise_op, evecs, i, j))**2 * s
 
         if get_rate:
             return rate
@@ -870,7 +926,7 @@ class NoisySystem:
             s *= 2 * np.pi  # We assume that system energies are given in units of frequency
             return s
 
-        noise_op = self.n_operator()
+        noise_op = self.n_operator
 
         return self.t1(i=i, j=j, noise_op=noise_op, spectral_density=spectral_density, total=total,
                        esys=esys, get_rate=get_rate, **kwargs)
@@ -918,7 +974,7 @@ class NoisySystem:
             s = 2 * omega / Q_c * (1/np.tanh(0.5*therm_ratio)) / (1 + np.exp(-therm_ratio))
             return s
 
-        noise_op = self.n_operator()
+        noise_op = self.n_operator
 
         return self.t1(i=i, j=j, noise_op=noise_op, spectral_density=spectral_density, total=total, esys=esys,
                        get_rate=get_rate, **kwargs)
@@ -974,7 +1030,7 @@ class NoisySystem:
             s *= (units.to_standard_units(1))**2.0
             return s
 
-        noise_op = self.d_hamiltonian_d_flux()
+        noise_op = self.d_hamiltonian_d_flux
 
         return self.t1(i=i, j=j, noise_op=noise_op, spectral_density=spectral_density, total=total, esys=esys,
                        get_rate=get_rate, **kwargs)
@@ -1037,7 +1093,7 @@ class NoisySystem:
             s *= 2 * np.pi  # We assume that system energies are given in units of frequency
             return s
 
-        noise_op = self.phi_operator()
+        noise_op = self.phi_operator
 
         return self.t1(i=i, j=j, noise_op=noise_op, spectral_density=spectral_density, total=total,
                        esys=esys, get_rate=get_rate, **kwargs)
@@ -1112,7 +1168,7 @@ class NoisySystem:
             return omega * NOISE_PARAMS['R_k'] / np.pi * complex(y_qp_fun(omega)).real  \
                 * (1/np.tanh(0.5 * np.abs(therm_ratio))) / (1 + np.exp(-therm_ratio))
 
-        noise_op = self.sin_phi_operator(alpha=0.5)
+        noise_op = functools.partial(self.sin_phi_operator, alpha=0.5)
 
         return self.t1(i=i, j=j, noise_op=noise_op, spectral_density=spectral_density, total=total,
                        esys=esys, get_rate=get_rate, **kwargs)
@@ -9,8 +9,46 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import functools
+
 import numpy as np
 import scipy as sp
+import scipy.sparse
+
+# maximum number of operators retained by each of the cached operator builders below
+OPERATOR_CACHE_SIZE = 128
+
+
+def _make_read_only(operator):
+    """Marks the underlying data of a dense or sparse matrix as read-only, so that a cached operator cannot be
+    altered by in-place operations of its users."""
+    if sp.sparse.issparse(operator):
+        for array_name in ('data', 'indices', 'indptr', 'offsets'):
+            array = getattr(operator, array_name, None)
+            if array is not None:
+                array.flags.writeable = False
+    else:
+        operator.flags.writeable = False
+    return operator
+
+
+def cached_operator(builder):
+    """Decorator for operator builders whose result is fully determined by their (hashable) arguments, typically a
+    Hilbert space dimension and a matrix format. Results are kept in an LRU cache of size `OPERATOR_CACHE_SIZE` and
+    returned as read-only matrices. Repeated calls return the identical object; copy before modifying in place.
+    The cache can be inspected and emptied via the `cache_info()` and `cache_clear()` methods of the decorated
+    function."""
+    @functools.lru_cache(maxsize=OPERATOR_CACHE_SIZE)
+    @functools.wraps(builder)
+    def cached_builder(*args, **kwargs):
+        return _make_read_only(builder(*args, **kwargs))
+    return cached_builder
+
+
+def clear_operator_caches():
+    """Empties the caches of all cached operator builders."""
+    for builder in (identity, charge_number, charge_shift):
+        builder.cache_clear()
 
 
 def annihilation(dimension):
@@ -140,3 +178,78 @@ def hubbard_sparse(j1, j2, dimension):
     hubbardmat = sp.sparse.dok_matrix((dimension, dimension), dtype=np.float_)
     hubbardmat[j1, j2] = 1.0
     return hubbardmat.asformat('csc')
+
+
+def _dense_or_sparse(diagonals, offsets, dimension, sparse_format, dtype):
+    if sparse_format is None:
+        matrix = np.zeros((dimension, dimension), dtype=dtype)
+        for diagonal, offset in zip(diagonals, offsets):
+            matrix += np.diag(np.asarray(diagonal, dtype=dtype), k=offset)
+        return matrix
+    return sp.sparse.diags(diagonals, offsets, shape=(dimension, dimension), format=sparse_format, dtype=dtype)
+
+
+@cached_operator
+def identity(dimension, sparse_format=None, dtype=np.float_):
+    """Identity operator of size dimension x dimension, cached.
+
+    Parameters
+    ----------
+    dimension: int
+    sparse_format: str, optional
+        scipy sparse matrix format such as 'csc' or 'csr'; if None, a dense ndarray is returned (default value = None)
+    dtype: type, optional
+        data type of matrix elements (default value = np.float_)
+
+    Returns
+    -------
+    ndarray or scipy.sparse matrix
+        read-only identity matrix, size dimension x dimension
+    """
+    return _dense_or_sparse([np.ones(dimension)], [0], dimension, sparse_format, dtype)
+
+
+@cached_operator
+def charge_number(ncut, sparse_format=None, dtype=np.float_):
+    """Charge number operator :math:`n` in the charge basis `n = -ncut, ..., ncut`, cached.
+
+    Parameters
+    ----------
+    ncut: int
+        charge number cutoff
+    sparse_format: str, optional
+        scipy sparse matrix format such as 'csc' or 'csr'; if None, a dense ndarray is returned (default value = None)
+    dtype: type, optional
+        data type of matrix elements (default value = np.float_)
+
+    Returns
+    -------
+    ndarray or scipy.sparse matrix
+        read-only charge number matrix, size (2*ncut+1) x (2*ncut+1)
+    """
+    return _dense_or_sparse([np.arange(-ncut, ncut + 1)], [0], 2 * ncut + 1, sparse_format, dtype)
+
+
+@cached_operator
+def charge_shift(ncut, offset=-1, sparse_format=None, dtype=np.float_):
+    r"""Operator shifting the charge number by one unit in the charge basis `n = -ncut, ..., ncut`, cached. With
+    `offset=-1` this is :math:`e^{i\varphi} = \sum_n |n+1\rangle\langle n|`, with `offset=1` its transpose.
+
+    Parameters
+    ----------
+    ncut: int
+        charge number cutoff
+    offset: int, optional
+        diagonal holding the nonzero entries: -1 (sub-diagonal) or 1 (super-diagonal) (default value = -1)
+    sparse_format: str, optional
+        scipy sparse matrix format such as 'csc' or 'csr'; if None, a dense ndarray is returned (default value = None)
+    dtype: type, optional
+        data type of matrix elements (default value = np.float_)
+
+    Returns
+    -------
+    ndarray or scipy.sparse matrix
+        read-only charge shift matrix, size (2*ncut+1) x (2*ncut+1)
+    """
+    dimension = 2 * ncut + 1
+    return _dense_or_sparse([np.ones(dimension - 1)], [offset], dimension, sparse_format, dtype)
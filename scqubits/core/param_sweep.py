@@ -10,10 +10,13 @@
 ############################################################################
 
 
+import contextlib
 import functools
 from abc import ABC, abstractmethod
 
 import numpy as np
+import qutip as qt
+from scipy import sparse
 
 import scqubits.core.central_dispatch as dispatch
 import scqubits.core.descriptors as descriptors
@@ -21,11 +24,13 @@ import scqubits.core.hilbert_space as hspace
 import scqubits.core.spec_lookup as spec_lookup
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio as io
-import scqubits.io_utils.fileio_qutip as qutip_serializer
 import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.settings as settings
 import scqubits.utils.cpu_switch as cpu_switch
+import scqubits.utils.eigensolvers as eigensolvers
 import scqubits.utils.misc as utils
+import scqubits.utils.profiling as profiling
+import scqubits.utils.spectrum_utils as spec_utils
 
 if settings.IN_IPYTHON:
     from tqdm.notebook import tqdm
@@ -128,6 +133,18 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
         the Hilbert space components
     num_cpus: int, optional
         number of CPUS requested for computing the sweep (default value settings.NUM_CPUS)
+    target_bare_labels: list of tuple(int), optional
+        if given, instead of the lowest `evals_count` dressed states, only the dressed states belonging to the listed
+        bare product states are calculated (one per bare state, in the given order, see
+        `HilbertSpace.eigensys_for_bare_states`); `evals_count` is then set to the number of bare states. This gives
+        access to states high up in the spectrum, e.g., with many oscillator photons. (default value = None)
+    interaction_only: bool, optional
+        declares that `update_hilbertspace` only changes the `g_strength` of interaction terms (coupling sweeps). Bare
+        spectra are then calculated once, and the dressed Hamiltonian H = H_bare + sum_k g_k V_k is assembled from
+        cached H_bare and V_k at each parameter value; requires an empty `subsys_update_list` (default value = False)
+    labeling_scheme: str, optional
+        scheme for labeling dressed states by bare product states, 'overlap' or 'continuation' (see `SpectrumLookup`);
+        'continuation' gives continuous branches across avoided crossings (default value = 'overlap')
     """
     param_name = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
     param_vals = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
@@ -135,23 +152,40 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
     evals_count = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
     subsys_update_list = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
     update_hilbertspace = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
+    target_bare_labels = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
+    interaction_only = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
+    labeling_scheme = descriptors.WatchedProperty('PARAMETERSWEEP_UPDATE')
     lookup = descriptors.ReadOnlyProperty()
 
     def __init__(self, param_name, param_vals, evals_count, hilbertspace, subsys_update_list, update_hilbertspace,
-                 num_cpus=settings.NUM_CPUS):
+                 num_cpus=settings.NUM_CPUS, target_bare_labels=None, interaction_only=False,
+                 labeling_scheme='overlap'):
+        if interaction_only and subsys_update_list:
+            raise ValueError("An interaction-only sweep requires an empty subsys_update_list: bare spectra must not "
+                             "depend on the external parameter.")
+        spec_lookup.check_labeling_scheme(labeling_scheme)
         self.param_name = param_name
         self.param_vals = param_vals
         self.param_count = len(param_vals)
+        if target_bare_labels is not None:
+            target_bare_labels = [tuple(labels) for labels in target_bare_labels]
+            evals_count = len(target_bare_labels)
+        self.target_bare_labels = target_bare_labels
         self.evals_count = evals_count
         self._hilbertspace = hilbertspace
         self.subsys_update_list = tuple(subsys_update_list)
         self.update_hilbertspace = update_hilbertspace
+        self.interaction_only = interaction_only
+        self.labeling_scheme = labeling_scheme
         self.num_cpus = num_cpus
 
         self.tqdm_disabled = settings.PROGRESSBAR_DISABLED or (num_cpus > 1)
 
         self._lookup = None
         self._bare_hamiltonian_constant = None
+        self._hamiltonian_constant = None
+        self._interaction_terms_varying = None
+        self._interaction_operators = None
 
         # setup for file Serializable
 
@@ -164,12 +198,13 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
 
     def run(self):
         """Top-level method for generating all parameter sweep data"""
-        self.cause_dispatch()   # generate one dispatch before temporarily disabling CENTRAL_DISPATCH
-        settings.DISPATCH_ENABLED = False
-        bare_specdata_list = self._compute_bare_specdata_sweep()
-        dressed_specdata = self._compute_dressed_specdata_sweep(bare_specdata_list)
-        self._lookup = spec_lookup.SpectrumLookup(self, dressed_specdata, bare_specdata_list)
-        settings.DISPATCH_ENABLED = True
+        self.cause_dispatch()   # generate one dispatch before temporarily suppressing CENTRAL_DISPATCH
+        with dispatch.CENTRAL_DISPATCH.suppressed(), profiling.stage('ParameterSweep.run'):
+            bare_specdata_list = self._compute_bare_specdata_sweep()
+            dressed_specdata = self._compute_dressed_specdata_sweep(bare_specdata_list)
+            with profiling.stage('spectrum lookup'):
+                self._lookup = spec_lookup.SpectrumLookup(self, dressed_specdata, bare_specdata_list,
+                                                          labeling_scheme=self.labeling_scheme)
 
     def cause_dispatch(self):
         self.update_hilbertspace(self.param_vals[0])
@@ -195,22 +230,27 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
                 self._lookup._out_of_sync = True
                 # print('Lookup table now out of sync')
 
+    @profiling.stage('bare spectra')
     def _compute_bare_specdata_sweep(self):
         """
         Pre-calculates all bare spectral data needed for the interactive explorer display.
         """
         bare_eigendata_constant = [self._compute_bare_spectrum_constant()] * self.param_count
-        target_map = cpu_switch.get_map_method(self.num_cpus)
-        with utils.InfoBar("Parallel compute bare eigensys [num_cpus={}]".format(self.num_cpus), self.num_cpus):
-            bare_eigendata_varying = list(
-                target_map(self._compute_bare_spectrum_varying,
-                           tqdm(self.param_vals, desc='Bare spectra', leave=False, disable=self.tqdm_disabled))
-            )
+        if self.interaction_only:
+            bare_eigendata_varying = [None] * self.param_count
+        else:
+            target_map = cpu_switch.get_map_method(self.num_cpus)
+            with utils.InfoBar("Parallel compute bare eigensys [num_cpus={}]".format(self.num_cpus), self.num_cpus):
+                bare_eigendata_varying = list(
+                    target_map(self._compute_bare_spectrum_varying,
+                               tqdm(self.param_vals, desc='Bare spectra', leave=False, disable=self.tqdm_disabled))
+                )
         bare_specdata_list = self._recast_bare_eigendata(bare_eigendata_constant, bare_eigendata_varying)
         del bare_eigendata_constant
         del bare_eigendata_varying
         return bare_specdata_list
 
+    @profiling.stage('dressed spectra')
     def _compute_dressed_specdata_sweep(self, bare_specdata_list):
         """
         Calculates and returns all dressed spectral data.
@@ -220,12 +260,22 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
         SpectrumData
         """
         self._bare_hamiltonian_constant = self._compute_bare_hamiltonian_constant(bare_specdata_list)
-        param_indices = range(self.param_count)
-        func = functools.partial(self._compute_dressed_eigensystem, bare_specdata_list=bare_specdata_list)
+        if self.interaction_only:
+            self._hamiltonian_constant = _sparse_matrix(self._bare_hamiltonian_constant)
+            self._interaction_operators = self._prepare_interaction_operators(bare_specdata_list)
+            func = self._compute_dressed_eigensystem_interaction_only
+            param_iterable = self.param_vals
+        else:
+            interaction_hamiltonian_constant, self._interaction_terms_varying = \
+                self._prepare_interaction_hamiltonian(bare_specdata_list)
+            self._hamiltonian_constant = (_sparse_matrix(self._bare_hamiltonian_constant) +
+                                          interaction_hamiltonian_constant)
+            func = functools.partial(self._compute_dressed_eigensystem, bare_specdata_list=bare_specdata_list)
+            param_iterable = range(self.param_count)
         target_map = cpu_switch.get_map_method(self.num_cpus)
 
         with utils.InfoBar("Parallel compute dressed eigensys [num_cpus={}]".format(self.num_cpus), self.num_cpus):
-            dressed_eigendata = list(target_map(func, tqdm(param_indices, desc='Dressed spectrum', leave=False,
+            dressed_eigendata = list(target_map(func, tqdm(param_iterable, desc='Dressed spectrum', leave=False,
                                                            disable=self.tqdm_disabled)))
         dressed_specdata = self._recast_dressed_eigendata(dressed_eigendata)
         del dressed_eigendata
@@ -304,16 +354,107 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
 
         Returns
         -------
-        qutip.Qobj operator
+        scipy.sparse.dia_matrix
             composite Hamiltonian consisting of all bare Hamiltonians which depend on the external parameter
         """
-        hamiltonian = 0
+        subsystem_dims = self._hilbertspace.subsystem_dims
+        diagonal = np.zeros(self._hilbertspace.dimension)
         for index, subsys in enumerate(self._hilbertspace):
             if subsys in self.subsys_update_list:
                 evals = bare_specdata_list[index].energy_table[param_index]
-                hamiltonian += self._hilbertspace.diag_hamiltonian(subsys, evals)
+                dim_left = int(np.prod(subsystem_dims[:index]))
+                dim_right = int(np.prod(subsystem_dims[index + 1:]))
+                diagonal += np.kron(np.ones(dim_left), np.kron(evals[:subsys.truncated_dim], np.ones(dim_right)))
+        return sparse.diags(diagonal)
+
+    def _prepare_interaction_hamiltonian(self, bare_specdata_list):
+        """
+        Precomputes the parts of the interaction Hamiltonian that are reused at all parameter values. Interaction
+        terms involving only subsystems not affected by the external parameter are summed into a constant operator.
+        For the remaining terms, the identity-wrapped operators of constant subsystems are stored; for subsystems
+        affected by the parameter, the operator matrix (in the internal basis) and the sparsity pattern of its
+        identity-wrapped form are stored, so that only its projection onto the bare eigenstates is recomputed at
+        each parameter value.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix or 0, list of (InteractionTerm, list)
+            constant interaction Hamiltonian; varying interaction terms with their two prepared operator factors
+        """
+        constant_hamiltonian = 0
+        varying_terms = []
+        for interaction_term in self._hilbertspace.interaction_list:
+            factors = [self._prepare_interaction_factor(operator, subsys, bare_specdata_list)
+                       for operator, subsys in [(interaction_term.op1, interaction_term.subsys1),
+                                                (interaction_term.op2, interaction_term.subsys2)]]
+            if all(sparse.issparse(factor) for factor in factors):
+                constant_hamiltonian += self._interaction_term_from_factors(interaction_term, *factors)
+            else:
+                varying_terms.append((interaction_term, factors))
+        return constant_hamiltonian, varying_terms
+
+    def _prepare_interaction_factor(self, operator, subsys, bare_specdata_list):
+        """Returns the identity-wrapped operator (sparse matrix) if it does not change with the external parameter,
+        otherwise a tuple (subsystem index, operator matrix in the internal basis, `_IdentityWrapPattern`)."""
+        subsys_index = self.get_subsys_index(subsys)
+        if subsys not in self.subsys_update_list or spec_utils.is_qobj(operator):   # Qobj: given in the eigenbasis
+            evecs = bare_specdata_list[subsys_index].state_table[0]
+            return sparse.csr_matrix(self._hilbertspace.identity_wrap(operator, subsys, evecs=evecs).data)
+        operator_matrix = getattr(subsys, operator)() if isinstance(operator, str) else operator
+        return subsys_index, operator_matrix, _IdentityWrapPattern(self._hilbertspace.subsystem_dims, subsys_index)
+
+    def _interaction_factor(self, factor, param_index, bare_specdata_list):
+        """Returns the identity-wrapped operator (sparse matrix) for a factor prepared by
+        `_prepare_interaction_factor`."""
+        if sparse.issparse(factor):
+            return factor
+        subsys_index, operator_matrix, pattern = factor
+        evecs = bare_specdata_list[subsys_index].state_table[param_index]
+        return pattern.matrix(spec_utils.get_matrixelement_table(operator_matrix, evecs))
+
+    def _prepare_interaction_operators(self, bare_specdata_list):
+        """
+        For an interaction-only sweep, precomputes the identity-wrapped operators V_k = op1 * op2 of all interaction
+        terms at unit coupling strength, so that the interaction Hamiltonian is sum_k (g_k V_k [+ g_k^* V_k^dag]).
+
+        Returns
+        -------
+        list of (scipy.sparse.csr_matrix, scipy.sparse.csr_matrix or None)
+            operator V_k and, for terms with `add_hc`, its adjoint
+        """
+        interaction_operators = []
+        for interaction_term in self._hilbertspace.interaction_list:
+            operator1, operator2 = [self._prepare_interaction_factor(operator, subsys, bare_specdata_list)
+                                    for operator, subsys in [(interaction_term.op1, interaction_term.subsys1),
+                                                             (interaction_term.op2, interaction_term.subsys2)]]
+            operator = sparse.csr_matrix(operator1 @ operator2)
+            operator_dag = sparse.csr_matrix(operator.getH()) if interaction_term.add_hc else None
+            interaction_operators.append((operator, operator_dag))
+        return interaction_operators
+
+    @staticmethod
+    def _interaction_term_from_factors(interaction_term, operator1, operator2):
+        hamiltonian = interaction_term.g_strength * (operator1 @ operator2)
+        if interaction_term.add_hc:
+            return hamiltonian + hamiltonian.getH()
         return hamiltonian
 
+    @contextlib.contextmanager
+    def _preserved_hilbertspace(self):
+        """Context manager undoing changes of the HilbertSpace made by calls of `update_hilbertspace` inside the
+        block: upon exit, the `__init__` parameters of all subsystems and interaction terms are restored without
+        central-dispatch broadcasts."""
+        saved_states = [(obj, obj.get_initdata())
+                        for obj in list(self._hilbertspace) + list(self._hilbertspace.interaction_list)]
+        try:
+            yield
+        finally:
+            with dispatch.CENTRAL_DISPATCH.suppressed():
+                for obj, initdata in saved_states:
+                    for name, value in initdata.items():
+                        if getattr(obj, name) is not value:
+                            setattr(obj, name, value)
+
     def _compute_bare_spectrum_constant(self):
         """
         Returns
@@ -325,7 +466,8 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
         for subsys in self._hilbertspace:
             if subsys not in self.subsys_update_list:
                 evals_count = subsys.truncated_dim
-                eigendata.append(subsys.eigensys(evals_count=evals_count))
+                with profiling.stage(self._bare_stage_name(subsys)):
+                    eigendata.append(subsys.eigensys(evals_count=evals_count))
             else:
                 eigendata.append(None)
         return eigendata
@@ -345,27 +487,58 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
             (evals, evecs) bare eigendata for each subsystem that is parameter-dependent
         """
         eigendata = []
-        self.update_hilbertspace(param_val)
+        with dispatch.CENTRAL_DISPATCH.suppressed():   # also applies when executed in a worker process
+            self.update_hilbertspace(param_val)
         for subsys in self._hilbertspace:
             if subsys in self.subsys_update_list:
                 evals_count = subsys.truncated_dim
                 subsys_index = self._hilbertspace.index(subsys)
-                eigendata.append(self._hilbertspace[subsys_index].eigensys(evals_count=evals_count))
+                with profiling.stage(self._bare_stage_name(subsys)):
+                    eigendata.append(self._hilbertspace[subsys_index].eigensys(evals_count=evals_count))
             else:
                 eigendata.append(None)
         return eigendata
 
-    def _compute_dressed_eigensystem(self, param_index, bare_specdata_list):
-        hamiltonian = (self._bare_hamiltonian_constant +
-                       self._compute_bare_hamiltonian_varying(bare_specdata_list, param_index))
+    def _bare_stage_name(self, subsys):
+        return 'bare eigensys: {} (subsys {})'.format(type(subsys).__name__, self._hilbertspace.index(subsys))
 
-        for interaction_term in self._hilbertspace.interaction_list:
-            evecs1 = self._lookup_bare_eigenstates(param_index, interaction_term.subsys1, bare_specdata_list)
-            evecs2 = self._lookup_bare_eigenstates(param_index, interaction_term.subsys2, bare_specdata_list)
-            hamiltonian += self._hilbertspace.interactionterm_hamiltonian(interaction_term,
-                                                                          evecs1=evecs1, evecs2=evecs2)
-        evals, evecs = hamiltonian.eigenstates(eigvals=self.evals_count)
-        evecs = evecs.view(qutip_serializer.QutipEigenstates)
+    def _compute_dressed_eigensystem(self, param_index, bare_specdata_list):
+        with profiling.stage('dressed Hamiltonian assembly'):
+            hamiltonian = self._hamiltonian_constant + self._compute_bare_hamiltonian_varying(bare_specdata_list,
+                                                                                              param_index)
+            for interaction_term, factors in self._interaction_terms_varying:
+                operator1, operator2 = [self._interaction_factor(factor, param_index, bare_specdata_list)
+                                        for factor in factors]
+                hamiltonian = hamiltonian + self._interaction_term_from_factors(interaction_term, operator1, operator2)
+            hamiltonian = self._hamiltonian_qobj(hamiltonian)
+        return self._dressed_eigensystem(hamiltonian)
+
+    def _compute_dressed_eigensystem_interaction_only(self, param_val):
+        with profiling.stage('dressed Hamiltonian assembly'):
+            with dispatch.CENTRAL_DISPATCH.suppressed():   # also applies when executed in a worker process
+                self.update_hilbertspace(param_val)
+            hamiltonian = self._hamiltonian_constant
+            for interaction_term, (operator, operator_dag) in zip(self._hilbertspace.interaction_list,
+                                                                  self._interaction_operators):
+                hamiltonian = hamiltonian + interaction_term.g_strength * operator
+                if operator_dag is not None:
+                    hamiltonian = hamiltonian + np.conj(interaction_term.g_strength) * operator_dag
+            hamiltonian = self._hamiltonian_qobj(hamiltonian)
+        return self._dressed_eigensystem(hamiltonian)
+
+    def _hamiltonian_qobj(self, hamiltonian):
+        subsystem_dims = self._hilbertspace.subsystem_dims
+        return qt.Qobj(inpt=sparse.csr_matrix(hamiltonian), dims=[subsystem_dims, subsystem_dims])
+
+    def _dressed_eigensystem(self, hamiltonian):
+        with profiling.stage('dressed eigensys'):
+            if self.target_bare_labels is None:
+                evals, evecs = self._hilbertspace._hamiltonian_eigensys(hamiltonian, self.evals_count)
+            else:
+                subsys_dims = self._hilbertspace.subsystem_dims
+                positions = np.ravel_multi_index(tuple(np.asarray(self.target_bare_labels).T), subsys_dims)
+                evals, evecs = eigensolvers.eigensys_for_basis_states(hamiltonian.data, positions)
+                evecs = spec_utils.convert_evecs_to_qutip_eigenstates(evecs, subsys_dims)
         return evals, evecs
 
     def _lookup_bare_eigenstates(self, param_index, subsys, bare_specdata_list):
@@ -418,7 +591,8 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
                     'evals_count': self.evals_count,
                     'hilbertspace': self._hilbertspace,
                     'dressed_specdata': self._lookup._dressed_specdata,
-                    'bare_specdata_list': self._lookup._bare_specdata_list}
+                    'bare_specdata_list': self._lookup._bare_specdata_list,
+                    'labeling_scheme': self._lookup.labeling_scheme}
         iodata = serializers.dict_serialize(initdata)
         iodata.typename = 'StoredSweep'
         return iodata
@@ -433,14 +607,65 @@ class ParameterSweep(ParameterSweepBase, dispatch.DispatchClient, serializers.Se
         io.write(self, filename)
 
 
+def _sparse_matrix(operator):
+    """Returns the scipy sparse matrix of a qutip.Qobj operator; 0 (no operator) is passed through."""
+    if spec_utils.is_qobj(operator):
+        return sparse.csr_matrix(operator.data)
+    return operator
+
+
+class _IdentityWrapPattern:
+    """Sparsity pattern of an operator of a single subsystem, given as a full matrix in the subsystem eigenbasis,
+    after wrapping in identities for all other subsystems. Inserting the matrix elements into the precomputed pattern
+    replaces the repeated evaluation of tensor products.
+
+    Parameters
+    ----------
+    subsystem_dims: list of int
+        (truncated) dimensions of all subsystems
+    subsys_index: int
+        index of the subsystem the operator acts on
+    """
+    def __init__(self, subsystem_dims, subsys_index):
+        dim = subsystem_dims[subsys_index]
+        dim_left = int(np.prod(subsystem_dims[:subsys_index]))
+        dim_right = int(np.prod(subsystem_dims[subsys_index + 1:]))
+        # template matrix whose entries record their (1-based) flat positions
+        template = sparse.csr_matrix(np.arange(1, dim**2 + 1, dtype=np.float_).reshape(dim, dim))
+        wrapped = sparse.kron(sparse.identity(dim_left), sparse.kron(template, sparse.identity(dim_right)),
+                              format='csr')
+        wrapped.sort_indices()
+        self._positions = np.rint(wrapped.data).astype(np.int_) - 1
+        self._indices = wrapped.indices
+        self._indptr = wrapped.indptr
+        self._shape = wrapped.shape
+
+    def matrix(self, matrix):
+        """Returns the identity-wrapped operator with the given matrix elements in the subsystem.
+
+        Parameters
+        ----------
+        matrix: ndarray
+            matrix of shape (dim, dim) with dim the subsystem dimension
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+        """
+        data = np.asarray(matrix).ravel()[self._positions]
+        return sparse.csr_matrix((data, self._indices, self._indptr), shape=self._shape)
+
+
 class StoredSweep(ParameterSweepBase, serializers.Serializable):
-    def __init__(self, param_name, param_vals, evals_count, hilbertspace, dressed_specdata, bare_specdata_list):
+    def __init__(self, param_name, param_vals, evals_count, hilbertspace, dressed_specdata, bare_specdata_list,
+                 labeling_scheme='overlap'):
         self.param_name = param_name
         self.param_vals = param_vals
         self.param_count = len(param_vals)
         self.evals_count = evals_count
         self._hilbertspace = hilbertspace
-        self._lookup = spec_lookup.SpectrumLookup(hilbertspace, dressed_specdata, bare_specdata_list)
+        self._lookup = spec_lookup.SpectrumLookup(hilbertspace, dressed_specdata, bare_specdata_list,
+                                                  labeling_scheme=labeling_scheme)
 
     @property
     def lookup(self):
@@ -457,5 +682,6 @@ class StoredSweep(ParameterSweepBase, serializers.Serializable):
             self._hilbertspace,
             subsys_update_list,
             update_hilbertspace,
-            num_cpus
+            num_cpus,
+            labeling_scheme=self._lookup.labeling_scheme
         )
@@ -16,29 +16,18 @@ import functools
 import inspect
 from abc import ABC, abstractmethod
 
-import matplotlib.pyplot as plt
 import numpy as np
-import scipy as sp
 
 import scqubits.core.constants as constants
 import scqubits.settings as settings
-import scqubits.ui.qubit_widget as ui
-import scqubits.utils.plotting as plot
+import scqubits.utils.eigensolvers as eigensolvers
 from scqubits.core.central_dispatch import DispatchClient
 from scqubits.core.discretization import Grid1d
 from scqubits.core.storage import SpectrumData, DataStore
-from scqubits.settings import IN_IPYTHON, TQDM_KWARGS
 from scqubits.utils.cpu_switch import get_map_method
-from scqubits.utils.misc import InfoBar, drop_private_keys, process_which
+from scqubits.utils.misc import InfoBar, drop_private_keys, process_which, tqdm
 from scqubits.utils.plot_defaults import set_scaling
-from scqubits.utils.spectrum_utils import (get_matrixelement_table, order_eigensystem, recast_esys_mapdata,
-                                           standardize_sign)
-
-if IN_IPYTHON:
-    from tqdm.notebook import tqdm
-else:
-    from tqdm import tqdm
-
+from scqubits.utils.spectrum_utils import get_matrixelement_table, recast_esys_mapdata, standardize_sign
 
 # To facilitate warnings in set_units, introduce a counter keeping track of the number of QuantumSystem instances
 _QUANTUMSYSTEM_COUNTER = 0
@@ -98,10 +87,58 @@ class QuantumSystem(DispatchClient, ABC):
         instance.widget()
         return instance
 
-    def widget(self, params=None):
-        """Use ipywidgets to modify parameters of class instance"""
+    def widget(self, params=None, live_plot=False):
+        """Use ipywidgets to modify parameters of class instance
+
+        Parameters
+        ----------
+        params: dict, optional
+            initial parameter values; if None, the current parameters of the instance are used
+        live_plot: bool, optional
+            if set to True, the ground state wave function is displayed and updated in place upon parameter changes,
+            see `update_wavefunction_plot`; only available for classes supporting updatable wave function plots
+            (default value = False)
+        """
+        if live_plot:
+            self._check_live_plot_support()
+        import scqubits.ui.qubit_widget as ui
         init_params = params or self.get_initdata()
-        ui.create_widget(self.set_params, init_params, image_filename=self._image_filename)
+        plot_func = self._live_plot_job if live_plot else None
+        ui.create_widget(self.set_params, init_params, image_filename=self._image_filename, plot_func=plot_func)
+
+    def update_wavefunction_plot(self, handle=None, which=0):
+        """Plots the wave function with index `which` for the current parameters. If a plot handle from a previous
+        call is provided, the existing plot is updated in place instead of creating a new figure.
+
+        Parameters
+        ----------
+        handle: PlotHandle, optional
+            handle returned by a previous call to `update_wavefunction_plot` (default value = None)
+        which: int, optional
+            index of the wave function (default value = 0)
+
+        Returns
+        -------
+        PlotHandle
+        """
+        self._check_live_plot_support()
+        return self._wavefunction_plot_renderer(which=which)(handle)
+
+    # Subclasses supporting updatable wave function plots override this by a method computing the data for
+    # `update_wavefunction_plot` and returning a function `render(handle)` that creates or updates the plot. Keeping all
+    # matplotlib calls in `render` allows the computation to run in a background thread (see `ui.create_widget`).
+    _wavefunction_plot_renderer = None
+
+    def _live_plot_job(self):
+        """Returns a function computing the wave function plot for the present parameters, see `widget`. The
+        computation operates on a copy of the system, so that it can run in a background thread while the parameters
+        of the system itself are changed."""
+        return self.copy_with()._wavefunction_plot_renderer
+
+    def _check_live_plot_support(self):
+        if self._wavefunction_plot_renderer is None:
+            raise NotImplementedError('Updatable wave function plots are not available for {}.'
+                                      .format(type(self).__name__))
 
     @staticmethod
     @abstractmethod
@@ -138,6 +175,10 @@ class QubitBaseClass(QuantumSystem, ABC):
     _evec_dtype: type
     _sys_type: str
     _init_params: list
+    # eigensolver used for diagonalizing the Hamiltonian, one of `scqubits.utils.eigensolvers.SOLVERS`; None selects
+    # the solver automatically, depending on the dimension and sparsity of the Hamiltonian and on `evals_count`.
+    # May be overridden per class or per instance.
+    eigensolver = None
 
     @abstractmethod
     def hamiltonian(self):
@@ -145,17 +186,14 @@ class QubitBaseClass(QuantumSystem, ABC):
 
     def _evals_calc(self, evals_count):
         hamiltonian_mat = self.hamiltonian()
-        evals = sp.linalg.eigh(hamiltonian_mat, eigvals_only=True, eigvals=(0, evals_count - 1))
-        return np.sort(evals)
+        return eigensolvers.lowest_eigenvals(hamiltonian_mat, evals_count, solver=self.eigensolver)
 
     def _esys_calc(self, evals_count):
         hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sp.linalg.eigh(hamiltonian_mat, eigvals_only=False, eigvals=(0, evals_count - 1))
-        evals, evecs = order_eigensystem(evals, evecs)
-        return evals, evecs
+        return eigensolvers.lowest_eigensys(hamiltonian_mat, evals_count, solver=self.eigensolver)
 
     def eigenvals(self, evals_count=6, filename=None, return_spectrumdata=False):
-        """Calculates eigenvalues using `scipy.linalg.eigh`, returns numpy array of eigenvalues.
+        """Calculates eigenvalues using the solver selected by `eigensolver`, returns numpy array of eigenvalues.
 
         Parameters
         ----------
@@ -179,7 +217,7 @@ class QubitBaseClass(QuantumSystem, ABC):
         return specdata if return_spectrumdata else evals
 
     def eigensys(self, evals_count=6, filename=None, return_spectrumdata=False):
-        """Calculates eigenvalues and corresponding eigenvectors using `scipy.linalg.eigh`. Returns
+        """Calculates eigenvalues and corresponding eigenvectors using the solver selected by `eigensolver`. Returns
         two numpy arrays containing the eigenvalues and eigenvectors, respectively.
 
         Parameters
@@ -245,6 +283,12 @@ class QubitBaseClass(QuantumSystem, ABC):
         setattr(self, param_name, paramval)
         return self.eigenvals(evals_count)
 
+    def _esys_and_operator_states_for_paramval(self, paramval, param_name, operator, evals_count):
+        """Returns evals, evecs and the operator applied to evecs, with the operator evaluated at `paramval`."""
+        setattr(self, param_name, paramval)
+        evals, evecs = self.eigensys(evals_count)
+        return evals, evecs, np.asarray(getattr(self, operator)() @ evecs)
+
     def get_spectrum_vs_paramvals(self, param_name, param_vals, evals_count=6, subtract_ground=False,
                                   get_eigenstates=False, filename=None, num_cpus=settings.NUM_CPUS):
         """Calculates eigenvalues/eigenstates for a varying system parameter, given an array of parameter values.
@@ -324,17 +368,29 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
         SpectrumData object
         """
-        spectrumdata = self.get_spectrum_vs_paramvals(param_name, param_vals, evals_count=evals_count,
-                                                      get_eigenstates=True, num_cpus=num_cpus)
-        paramvals_count = len(param_vals)
-        matelem_table = np.empty(shape=(paramvals_count, evals_count, evals_count), dtype=np.complex_)
+        previous_paramval = getattr(self, param_name)
 
-        for index, paramval in tqdm(enumerate(param_vals), total=len(param_vals), **TQDM_KWARGS):
-            evecs = spectrumdata.state_table[index]
-            matelem_table[index] = self.matrixelement_table(operator, evecs=evecs, evals_count=evals_count)
+        # The operator is evaluated and applied to the eigenstates for each parameter value within the (possibly
+        # parallel) map; only the final contraction with the conjugate eigenstates is done here, for all parameter
+        # values at once.
+        target_map = get_map_method(num_cpus)
+        func = functools.partial(self._esys_and_operator_states_for_paramval, param_name=param_name, operator=operator,
+                                 evals_count=evals_count)
+        with InfoBar("Parallel computation of matrix elements [num_cpus={}]".format(num_cpus), num_cpus):
+            mapdata = list(target_map(func, tqdm(param_vals, desc='Matrix elements', leave=False,
+                                                 disable=(num_cpus > 1))))
+        setattr(self, param_name, previous_paramval)
+
+        eigenvalue_table, eigenstate_table = recast_esys_mapdata([(evals, evecs) for evals, evecs, _ in mapdata])
+        operator_states = [op_states for _, _, op_states in mapdata]
+        if len({evecs.shape for evecs in eigenstate_table}) == 1:
+            matelem_table = np.matmul(np.conj(np.transpose(eigenstate_table, (0, 2, 1))), operator_states)
+        else:   # Hilbert space dimension varies with the parameter
+            matelem_table = np.asarray([evecs.conj().T @ op_states
+                                        for evecs, op_states in zip(eigenstate_table, operator_states)])
 
-        spectrumdata.matrixelem_table = matelem_table
-        return spectrumdata
+        return SpectrumData(eigenvalue_table, self.get_initdata(), param_name, param_vals, state_table=eigenstate_table,
+                            matrixelem_table=matelem_table.astype(np.complex_, copy=False))
 
     def plot_evals_vs_paramvals(self, param_name, param_vals,
                                 evals_count=6, subtract_ground=None, num_cpus=settings.NUM_CPUS, **kwargs):
@@ -360,6 +416,7 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
         Figure, Axes
         """
+        import scqubits.utils.plotting as plot
         specdata = self.get_spectrum_vs_paramvals(param_name, param_vals, evals_count=evals_count,
                                                   subtract_ground=subtract_ground, num_cpus=num_cpus)
         return plot.evals_vs_paramvals(specdata, which=range(evals_count), **kwargs)
@@ -392,6 +449,7 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
         Figure, Axes
         """
+        import scqubits.utils.plotting as plot
         matrixelem_array = self.matrixelement_table(operator, evecs, evals_count)
         if not show3d:
             return plot.matrix2d(matrixelem_array, mode=mode, show_numbers=show_numbers, **kwargs)
@@ -430,6 +488,7 @@ class QubitBaseClass(QuantumSystem, ABC):
             flattened_list = [index for tupl in select_elems for index in tupl]
             evals_count = max(flattened_list) + 1
 
+        import scqubits.utils.plotting as plot
         specdata = self.get_matelements_vs_paramvals(operator, param_name, param_vals,
                                                      evals_count=evals_count, num_cpus=num_cpus)
         return plot.matelem_vs_paramvals(specdata, select_elems=select_elems, mode=mode, **kwargs)
@@ -484,6 +543,49 @@ class QubitBaseClass1d(QubitBaseClass):
     def wavefunction1d_defaults(self, mode, evals, wavefunc_count):
         pass
 
+    def update_wavefunction_plot(self, handle=None, which=0, mode='real', phi_grid=None, scaling=None):
+        """Plots the 1d phase-basis wave function with index `which`, along with the potential, for the current
+        parameters. If a plot handle from a previous call is provided, the existing plot is updated in place instead
+        of creating a new figure.
+
+        Parameters
+        ----------
+        handle: Wavefunction1dHandle, optional
+            handle returned by a previous call to `update_wavefunction_plot` (default value = None)
+        which: int, optional
+            index of the wave function (default value = 0)
+        mode: str, optional
+            choices as specified in `constants.MODE_FUNC_DICT` (default value = 'real')
+        phi_grid: Grid1d, optional
+            used for setting a custom grid for phi; if None use self._default_grid
+        scaling: float or None, optional
+            custom scaling of wave function amplitude/modulus
+
+        Returns
+        -------
+        Wavefunction1dHandle
+        """
+        return self._wavefunction_plot_renderer(which=which, mode=mode, phi_grid=phi_grid, scaling=scaling)(handle)
+
+    def _wavefunction_plot_renderer(self, which=0, mode='real', phi_grid=None, scaling=None):
+        import scqubits.utils.plotting as plot
+        esys = self.eigensys(evals_count=which + 2)
+        phi_grid = phi_grid or self._default_grid
+        potential_vals = self.potential(phi_grid.make_linspace())
+        scale = set_scaling(self, scaling, potential_vals)
+
+        phi_wavefunc = self.wavefunction(esys, which=which, phi_grid=phi_grid)
+        phi_wavefunc.amplitudes = constants.MODE_FUNC_DICT[mode](standardize_sign(phi_wavefunc.amplitudes))
+        plot_options = self.wavefunction1d_defaults(mode, esys[0], 1)
+
+        def render(handle):
+            if handle is None:
+                return plot.Wavefunction1dHandle(phi_wavefunc, potential_vals=potential_vals,
+                                                 offset=phi_wavefunc.energy, scaling=scale, **plot_options)
+            handle.update(phi_wavefunc, potential_vals=potential_vals, offset=phi_wavefunc.energy, scaling=scale)
+            return handle
+        return render
+
     def plot_wavefunction(self, which=0,  mode='real', esys=None, phi_grid=None, scaling=None, **kwargs):
         """Plot 1d phase-basis wave function(s). Must be overwritten by higher-dimensional qubits like FluxQubits and
         ZeroPi.
@@ -508,6 +610,8 @@ class QubitBaseClass1d(QubitBaseClass):
         -------
         Figure, Axes
         """
+        import matplotlib.pyplot as plt
+        import scqubits.utils.plotting as plot
         fig_ax = kwargs.get('fig_ax') or plt.subplots()
         kwargs['fig_ax'] = fig_ax
 
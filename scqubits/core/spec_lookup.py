@@ -16,11 +16,21 @@ from functools import wraps
 
 import numpy as np
 import qutip as qt
+from scipy import optimize
 
 import scqubits
 import scqubits.io_utils.fileio_serializers as serializers
+import scqubits.utils.profiling as profiling
 import scqubits.utils.spectrum_utils as spec_utils
 
+LABELING_SCHEMES = ('overlap', 'continuation')
+
+
+def check_labeling_scheme(labeling_scheme):
+    """Raises a ValueError if `labeling_scheme` is not one of `LABELING_SCHEMES`."""
+    if labeling_scheme not in LABELING_SCHEMES:
+        raise ValueError("Unknown labeling scheme '{}': use 'overlap' or 'continuation'.".format(labeling_scheme))
+
 
 def check_sync_status(func):
     @wraps(func)
@@ -50,8 +60,16 @@ class SpectrumLookup(serializers.Serializable):
         dressed spectral data needed for generating the lookup mapping
     bare_specdata_list: SpectrumData
         bare spectral data needed for generating the lookup mapping
+    labeling_scheme: str, optional
+        'overlap' (default): each dressed state is labeled by the bare product state with which it has the largest
+        overlap, independently for each parameter value; no label is assigned when that overlap is below 0.5, e.g.,
+        close to avoided crossings. 'continuation': labels are assigned once at the first parameter value, then
+        carried over to the dressed states at each subsequent parameter value with which they have maximal overlap
+        (one-to-one assignment), producing continuous branches across avoided crossings.
     """
-    def __init__(self, framework, dressed_specdata, bare_specdata_list):
+    def __init__(self, framework, dressed_specdata, bare_specdata_list, labeling_scheme='overlap'):
+        check_labeling_scheme(labeling_scheme)
+        self.labeling_scheme = labeling_scheme
         self._dressed_specdata = dressed_specdata
         self._bare_specdata_list = bare_specdata_list
         # Store ParameterSweep and/or HilbertSpace objects only as weakref.proxy objects to avoid circular references
@@ -66,8 +84,13 @@ class SpectrumLookup(serializers.Serializable):
             raise TypeError
 
         self._canonical_bare_labels = self._generate_bare_labels()
-        self._dressed_indices = self._generate_mappings()  # lists of as many elements as there are parameter values.
-        # For HilbertSpace objects the above is a single-element list.
+        # Bare labels are encoded as their position in the canonical order (mixed-radix encoding with the subsystem
+        # dimensions as radices). `_dressed_indices[param_index, position]` is the dressed index belonging to a bare
+        # state, and `_bare_positions[param_index, dressed_index]` the position of the bare state belonging to a
+        # dressed state; -1 marks states without assignment. For HilbertSpace objects, param_count is 1.
+        self._subsys_dims = tuple(self._hilbertspace.subsystem_dims)
+        self._dressed_indices = self._generate_mappings()
+        self._bare_positions = self._generate_inverse_mappings()
         self._out_of_sync = False
         # Setup for Serializable operations
         self._init_params = ['_dressed_specdata', '_bare_specdata_list']
@@ -96,23 +119,133 @@ class SpectrumLookup(serializers.Serializable):
         basis_labels_list = list(itertools.product(*basis_label_ranges))   # generate list of bare basis states (tuples)
         return basis_labels_list
 
+    @profiling.stage('bare-dressed state mapping')
     def _generate_mappings(self):
         """
         For each parameter value of the parameter sweep (may only be one if called from HilbertSpace, so no sweep),
-        generate the map between bare states and dressed states.
+        generate the map between bare states and dressed states, according to `labeling_scheme`.
 
         Returns
         -------
-        list
-            each list item is a list of dressed indices whose order corresponds to the ordering of bare indices (as
-            stored in .canonical_bare_labels, thus establishing the mapping
+        ndarray
+            array of shape (param_count, dimension); each row holds the dressed indices whose order corresponds to the
+            ordering of bare indices (as stored in ._canonical_bare_labels), thus establishing the mapping; -1
+            indicates that no dressed state was assigned
         """
         param_indices = range(self._dressed_specdata.param_count)
-        dressed_indices_list = []
+        dressed_indices = np.empty((len(param_indices), self._hilbertspace.dimension), dtype=np.int32)
+        if self.labeling_scheme == 'continuation':
+            bare_positions = self._generate_continued_bare_positions()
+            dressed_indices.fill(-1)
+            dressed_indices[np.arange(len(param_indices))[:, np.newaxis], bare_positions] = \
+                np.arange(bare_positions.shape[1])
+            return dressed_indices
         for index in param_indices:
-            dressed_indices = self._generate_single_mapping(index)
-            dressed_indices_list.append(dressed_indices)
-        return dressed_indices_list
+            dressed_indices[index] = self._generate_single_mapping(index)
+        return dressed_indices
+
+    def _generate_continued_bare_positions(self):
+        """
+        Labels the dressed states by continuation across the parameter sweep. At the first parameter value, the bare
+        labels are assigned one to one by maximizing the total overlap between dressed and bare states. At each
+        following parameter value, the overlaps with the dressed states of the previous parameter value (see
+        `_successive_overlaps`) determine the one-to-one assignment that maximizes the total overlap, and labels are
+        carried over. Dressed states whose overlap with their predecessor is below 0.5, e.g., states entering the range
+        of `evals_count` calculated states, are relabeled by their overlaps with the bare states not taken by other
+        dressed states.
+
+        Returns
+        -------
+        ndarray
+            array of shape (param_count, evals_count) holding the positions of the bare states (in canonical order)
+            assigned to the dressed states
+        """
+        dressed_states = np.asarray([spec_utils.convert_esys_to_ndarray(state_table)
+                                     for state_table in self._dressed_specdata.state_table])
+        param_count, evals_count, _ = dressed_states.shape
+        successive_overlaps = self._successive_overlaps(dressed_states)
+
+        bare_positions = np.empty((param_count, evals_count), dtype=np.int32)
+        bare_positions[0] = self._assign_bare_positions(np.abs(dressed_states[0]))
+        for index in range(1, param_count):
+            overlaps = successive_overlaps[index - 1]
+            previous, current = optimize.linear_sum_assignment(-overlaps)   # maximal total overlap
+            bare_positions[index, current] = bare_positions[index - 1, previous]
+            lost = current[overlaps[previous, current] < 0.5]
+            if lost.size:
+                taken = np.delete(bare_positions[index], lost)
+                bare_positions[index, lost] = self._assign_bare_positions(np.abs(dressed_states[index, lost]), taken)
+        return bare_positions
+
+    def _successive_overlaps(self, dressed_states):
+        """
+        Calculates the absolute overlaps |<psi_i(p-1)|psi_j(p)>| between the dressed states at all pairs of successive
+        parameter values. Dressed states are expressed in the basis of bare product states, and the bare eigenstates
+        themselves (including their arbitrary phases) change with the parameter; the states at parameter value p are
+        therefore first transformed to the bare basis at p-1 by the bare-state overlap matrices of each subsystem.
+
+        Parameters
+        ----------
+        dressed_states: ndarray
+            array of shape (param_count, evals_count, dimension)
+
+        Returns
+        -------
+        ndarray
+            array of shape (param_count - 1, evals_count, evals_count)
+        """
+        param_count, evals_count, _ = dressed_states.shape
+        states = dressed_states[1:].reshape((param_count - 1, evals_count) + self._subsys_dims)
+        for subsys_index, bare_specdata in enumerate(self._bare_specdata_list):
+            bare_states = np.asarray(bare_specdata.state_table)
+            basis_change = np.einsum('pai,paj->pij', bare_states[:-1].conj(), bare_states[1:])
+            states = np.moveaxis(states, 2 + subsys_index, -1)
+            states = np.einsum('p...j,pij->p...i', states, basis_change)
+            states = np.moveaxis(states, -1, 2 + subsys_index)
+        states = states.reshape((param_count - 1, evals_count, -1))
+        return np.abs(np.einsum('pid,pjd->pij', dressed_states[:-1].conj(), states))
+
+    @staticmethod
+    def _assign_bare_positions(overlap_matrix, taken_positions=()):
+        """
+        Assigns bare states one to one to dressed states such that the total overlap is maximal.
+
+        Parameters
+        ----------
+        overlap_matrix: ndarray
+            absolute overlaps of the dressed states (rows) with the bare states (columns, in canonical order)
+        taken_positions: array_like of int, optional
+            positions of bare states excluded from the assignment
+
+        Returns
+        -------
+        ndarray of int
+            positions of the bare states assigned to the dressed states
+        """
+        available_positions = np.setdiff1d(np.arange(overlap_matrix.shape[1]), taken_positions)
+        dressed, bare = optimize.linear_sum_assignment(-overlap_matrix[:, available_positions])
+        positions = np.empty(overlap_matrix.shape[0], dtype=np.int32)
+        positions[dressed] = available_positions[bare]
+        return positions
+
+    def _generate_inverse_mappings(self):
+        """
+        Inverts the bare-to-dressed mappings. Where several bare states were assigned the same dressed state, the
+        bare state appearing first in canonical order is used.
+
+        Returns
+        -------
+        ndarray
+            array of shape (param_count, evals_count) holding the positions of the bare states (in canonical order)
+            belonging to the dressed states; -1 indicates that no bare state was assigned
+        """
+        param_count, dimension = self._dressed_indices.shape
+        evals_count = len(self._dressed_specdata.energy_table[0])
+        bare_positions = np.full((param_count, evals_count), dimension, dtype=np.int32)
+        param_indices, positions = np.nonzero(self._dressed_indices >= 0)
+        np.minimum.at(bare_positions, (param_indices, self._dressed_indices[param_indices, positions]), positions)
+        bare_positions[bare_positions == dimension] = -1
+        return bare_positions
 
     def _generate_single_mapping(self, param_index):
         """
@@ -125,20 +258,14 @@ class SpectrumLookup(serializers.Serializable):
 
         Returns
         -------
-        list of int
-            dressed-state indices
-        """
-        overlap_matrix = spec_utils.convert_esys_to_ndarray(self._dressed_specdata.state_table[param_index])
-
-        dressed_indices = []
-        for bare_basis_index in range(self._hilbertspace.dimension):   # for given bare basis index, find dressed index
-            max_position = (np.abs(overlap_matrix[:, bare_basis_index])).argmax()
-            max_overlap = np.abs(overlap_matrix[max_position, bare_basis_index])
-            if max_overlap < 0.5:     # overlap too low, make no assignment
-                dressed_indices.append(None)
-            else:
-                dressed_indices.append(max_position)
-        return dressed_indices
+        ndarray of int
+            dressed-state indices, -1 where no dressed state was assigned
+        """
+        overlap_matrix = np.abs(spec_utils.convert_esys_to_ndarray(self._dressed_specdata.state_table[param_index]))
+        # for each bare basis index, find the dressed index with maximum overlap
+        max_positions = overlap_matrix.argmax(axis=0)
+        max_overlaps = overlap_matrix[max_positions, np.arange(overlap_matrix.shape[1])]
+        return np.where(max_overlaps < 0.5, -1, max_positions)    # overlap too low: make no assignment
 
     @check_sync_status
     def dressed_index(self, bare_labels, param_index=0):
@@ -157,11 +284,45 @@ class SpectrumLookup(serializers.Serializable):
         int
             dressed state index closest to the specified bare state
         """
-        try:
-            lookup_position = self._canonical_bare_labels.index(bare_labels)
-        except ValueError:
+        if len(bare_labels) != len(self._subsys_dims):
             return None
-        return self._dressed_indices[param_index][lookup_position]
+        position = 0    # position of the bare state in canonical order (mixed-radix encoding)
+        for label, dim in zip(bare_labels, self._subsys_dims):
+            if not 0 <= label < dim:
+                return None
+            position = position * dim + label
+        dressed_index = self._dressed_indices[param_index, position]
+        return None if dressed_index < 0 else int(dressed_index)
+
+    @check_sync_status
+    def dressed_index_batch(self, bare_labels, param_indices=None):
+        """
+        Vectorized version of `dressed_index`: for an array of bare product-state labels, return the corresponding
+        dressed-state indices.
+
+        Parameters
+        ----------
+        bare_labels: array_like of int
+            array of shape (..., subsystem_count), each entry along the last axis specifying a bare product state
+        param_indices: int or array_like of int, optional
+            parameter indices, broadcast against `bare_labels.shape[:-1]`; if None, all parameter indices are used and
+            prepended as the first axis of the result (default value = None)
+
+        Returns
+        -------
+        ndarray of int
+            dressed-state indices, -1 where no dressed state is assigned
+        """
+        positions = self._bare_positions_of(bare_labels)
+        if param_indices is None:
+            return self._dressed_indices[:, positions]
+        return self._dressed_indices[np.asarray(param_indices), positions]
+
+    def _bare_positions_of(self, bare_labels):
+        """Returns the positions (in canonical order) of the bare states given by the array of labels
+        `bare_labels`, shape (..., subsystem_count)."""
+        bare_labels = np.asarray(bare_labels)
+        return np.ravel_multi_index(tuple(np.moveaxis(bare_labels, -1, 0)), self._subsys_dims)
 
     @check_sync_status
     def bare_index(self, dressed_index, param_index=0):
@@ -179,12 +340,10 @@ class SpectrumLookup(serializers.Serializable):
             Bare state specification in tuple form. Example: (1,0,3) means subsystem 1 is in bare state 1, subsystem 2
             in bare state 0, and subsystem 3 in bare state 3.
         """
-        try:
-            lookup_position = self._dressed_indices[param_index].index(dressed_index)
-        except ValueError:
+        bare_positions = self._bare_positions[param_index]
+        if not 0 <= dressed_index < len(bare_positions) or bare_positions[dressed_index] < 0:
             return None
-        basis_labels = self._canonical_bare_labels[lookup_position]
-        return basis_labels
+        return self._canonical_bare_labels[bare_positions[dressed_index]]
 
     @check_sync_status
     def dressed_eigenstates(self, param_index=0):
@@ -242,6 +401,35 @@ class SpectrumLookup(serializers.Serializable):
             return None
         return self._dressed_specdata.energy_table[param_index][dressed_index]
 
+    @check_sync_status
+    def energy_bare_index_batch(self, bare_labels, param_indices=None):
+        """
+        Vectorized version of `energy_bare_index`: for an array of bare product-state labels, look up the dressed
+        energies most closely corresponding to them.
+
+        Parameters
+        ----------
+        bare_labels: array_like of int
+            array of shape (..., subsystem_count), each entry along the last axis specifying a bare product state
+        param_indices: int or array_like of int, optional
+            parameter indices, broadcast against `bare_labels.shape[:-1]`; if None, all parameter indices are used and
+            prepended as the first axis of the result (default value = None)
+
+        Returns
+        -------
+        ndarray of float
+            dressed energies, NaN where no dressed state is assigned
+        """
+        energy_table = np.asarray(self._dressed_specdata.energy_table)
+        positions = self._bare_positions_of(bare_labels)
+        if param_indices is None:
+            param_indices = np.arange(len(self._dressed_indices)).reshape((-1,) + (1,) * positions.ndim)
+        else:
+            param_indices = np.asarray(param_indices)
+        dressed_indices = self._dressed_indices[param_indices, positions]
+        energies = energy_table[param_indices, np.maximum(dressed_indices, 0)]
+        return np.where(dressed_indices < 0, np.nan, energies)
+
     @check_sync_status
     def energy_dressed_index(self, dressed_index, param_index=0):
         """
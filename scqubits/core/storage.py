@@ -10,7 +10,6 @@
 ############################################################################
 
 import scqubits.io_utils.fileio_serializers as serializers
-import scqubits.utils.plotting as plot
 
 
 # —WaveFunction class———————————————————————————————————————————————————————————————————————————————————————————————————
@@ -156,5 +155,6 @@ class SpectrumData(DataStore):
         -------
         Figure, Axes
         """
+        import scqubits.utils.plotting as plot
         return plot.evals_vs_paramvals(self, which=which, subtract_ground=subtract_ground,
                                        label_list=label_list, **kwargs)
@@ -10,12 +10,15 @@
 ############################################################################
 
 
+import functools
+
 import numpy as np
 
 import scqubits.core.storage as storage
-import scqubits.core.sweep_observables as observable
 import scqubits.settings as settings
+import scqubits.utils.misc as utils
 import scqubits.utils.spectrum_utils as spec_utils
+from scqubits.utils.cpu_switch import get_map_method
 
 if settings.IN_IPYTHON:
     from tqdm.notebook import tqdm
@@ -23,7 +26,7 @@ else:
     from tqdm import tqdm
 
 
-def compute_custom_data_sweep(sweep, func, **kwargs):
+def compute_custom_data_sweep(sweep, func, num_cpus=settings.NUM_CPUS, **kwargs):
     """Method for computing custom data as a function of the external parameter, calculated via the function `func`.
 
     Parameters
@@ -31,6 +34,10 @@ def compute_custom_data_sweep(sweep, func, **kwargs):
     sweep: ParameterSweep
     func: function
         signature: `func(parametersweep, param_value, **kwargs)`, specifies how to calculate the data
+    num_cpus: int, optional
+        number of cores to be used for evaluating `func` at the different parameter indices (default value =
+        settings.NUM_CPUS); for num_cpus > 1, `func` and `sweep` must be picklable by the library selected in
+        `settings.MULTIPROC`
     **kwargs: optional
         other parameters to be included in func
 
@@ -38,8 +45,13 @@ def compute_custom_data_sweep(sweep, func, **kwargs):
     -------
     ndarray
     """
-    return np.asarray([func(sweep, param_index, **kwargs)
-                       for param_index in tqdm(range(sweep.param_count), desc='data sweep', **settings.TQDM_KWARGS)])
+    target_map = get_map_method(num_cpus)
+    func_at_param_index = functools.partial(func, sweep, **kwargs)
+    tqdm_disabled = settings.PROGRESSBAR_DISABLED or (num_cpus > 1)
+    with utils.InfoBar("Parallel compute data sweep [num_cpus={}]".format(num_cpus), num_cpus):
+        data = list(target_map(func_at_param_index,
+                               tqdm(range(sweep.param_count), desc='data sweep', leave=False, disable=tqdm_disabled)))
+    return np.asarray(data)
 
 
 def generate_chi_sweep(sweep):
@@ -54,16 +66,16 @@ def generate_chi_sweep(sweep):
     dict
         (osc_index, qbt_index) -> ndararray of chi values
     """
-    osc_subsys_list = sweep.osc_subsys_list
-    qbt_subsys_list = sweep.qbt_subsys_list
-
     data_dict = {}
-    for (osc_index, osc_subsys) in osc_subsys_list:
-        for (qbt_index, qubit_subsys) in qbt_subsys_list:
-            data_dict[(osc_index, qbt_index)] = sweep.new_datastore(
-                chi=compute_custom_data_sweep(sweep, observable.dispersive_chi, qubit_subsys=qubit_subsys,
-                                              osc_subsys=osc_subsys, chi_indices=(1, 0))
-            )
+    for (osc_index, osc_subsys) in sweep.osc_subsys_list:
+        for (qbt_index, qubit_subsys) in sweep.qbt_subsys_list:
+            # bare_labels[n, j]: oscillator in state n, qubit in state j; chi_j = E_1j - E_0j - omega
+            bare_labels = np.zeros((2, 2, sweep.subsystem_count), dtype=np.int_)
+            bare_labels[..., osc_index] = [[0, 0], [1, 1]]
+            bare_labels[..., qbt_index] = [[0, 1], [0, 1]]
+            energies = sweep.lookup.energy_bare_index_batch(bare_labels)
+            chi_values = energies[:, 1] - energies[:, 0] - osc_subsys.E_osc
+            data_dict[(osc_index, qbt_index)] = sweep.new_datastore(chi=chi_values[:, 1] - chi_values[:, 0])
     return data_dict
 
 
@@ -82,8 +94,8 @@ def generate_charge_matrixelem_sweep(sweep):
     data_dict = dict()
     for qbt_index, subsys in sweep.qbt_subsys_list:
         if type(subsys).__name__ in ['Transmon', 'Fluxonium']:
-            data = compute_custom_data_sweep(sweep, observable.qubit_matrixelement, qubit_subsys=subsys,
-                                             qubit_operator=subsys.n_operator())
+            bare_state_tables = sweep.bare_specdata_list[qbt_index].state_table
+            data = spec_utils.get_matrixelement_table_stack(subsys.n_operator(), bare_state_tables)
             datastore = sweep.new_datastore(matrixelem_table=data)
             data_dict[(qbt_index, subsys)] = datastore
     return data_dict
@@ -103,19 +115,12 @@ def generate_diffspec_sweep(sweep, initial_state_ind=0):
     -------
     SpectrumData
     """
-    lookup = sweep.lookup
-    param_count = sweep.param_count
-    evals_count = sweep.evals_count
-    diff_eigenenergy_table = np.empty(shape=(param_count, evals_count))
-
-    for param_index in tqdm(range(param_count), desc="difference spectrum", **settings.TQDM_KWARGS):
-        eigenenergies = sweep.dressed_specdata.energy_table[param_index]
-        if isinstance(initial_state_ind, int):
-            eigenenergy_index = initial_state_ind
-        else:
-            eigenenergy_index = lookup.dressed_index(initial_state_ind, param_index)
-        diff_eigenenergies = eigenenergies - eigenenergies[eigenenergy_index]
-        diff_eigenenergy_table[param_index] = diff_eigenenergies
+    energy_table = np.asarray(sweep.dressed_specdata.energy_table)
+    if isinstance(initial_state_ind, int):
+        initial_energies = energy_table[:, initial_state_ind]
+    else:
+        initial_energies = sweep.lookup.energy_bare_index_batch(initial_state_ind)
+    diff_eigenenergy_table = energy_table - initial_energies[:, np.newaxis]
     return storage.SpectrumData(diff_eigenenergy_table, sweep.system_params, sweep.param_name, sweep.param_vals)
 
 
@@ -137,22 +142,11 @@ def generate_qubit_transitions_sweep(sweep, photonnumber, initial_state_labels):
     list, SpectrumData
         list of transition target states, spectrum data
     """
-    lookup = sweep.lookup
-
     target_states_list = spec_utils.generate_target_states_list(sweep, initial_state_labels)
-    difference_energies_table = []
-
-    for param_index in range(sweep.param_count):
-        difference_energies = []
-        initial_energy = lookup.energy_bare_index(initial_state_labels, param_index)
-        for target_labels in target_states_list:
-            target_energy = lookup.energy_bare_index(target_labels, param_index)
-            if target_energy is None or initial_energy is None:
-                difference_energies.append(np.NaN)
-            else:
-                difference_energies.append((target_energy - initial_energy) / photonnumber)
-        difference_energies_table.append(difference_energies)
-
-    data = np.asarray(difference_energies_table)
+    target_labels = np.asarray(target_states_list, dtype=np.int_).reshape(-1, sweep.subsystem_count)
+
+    initial_energies = sweep.lookup.energy_bare_index_batch(initial_state_labels)
+    target_energies = sweep.lookup.energy_bare_index_batch(target_labels)
+    data = (target_energies - initial_energies[:, np.newaxis]) / photonnumber
     specdata = storage.SpectrumData(data, sweep.system_params, sweep.param_name, sweep.param_vals)
     return target_states_list, specdata
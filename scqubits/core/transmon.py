@@ -17,12 +17,12 @@ import numpy as np
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.operators as op
 from scqubits.core.noise import NoisySystem
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.utils.plot_defaults as defaults
-import scqubits.utils.plotting as plot
 
 
 # —Cooper pair box / transmon——————————————————————————————————————————————
@@ -91,15 +91,11 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
 
     def n_operator(self):
         """Returns charge operator `n` in the charge basis"""
-        diag_elements = np.arange(-self.ncut, self.ncut + 1, 1)
-        return np.diag(diag_elements)
+        return op.charge_number(self.ncut, dtype=np.int_).copy()
 
     def exp_i_phi_operator(self):
         """Returns operator :math:`e^{i\\varphi}` in the charge basis"""
-        dimension = self.hilbertdim()
-        entries = np.repeat(1.0, dimension - 1)
-        exp_op = np.diag(entries, -1)
-        return exp_op
+        return op.charge_shift(self.ncut, offset=-1).copy()
 
     def cos_phi_operator(self):
         """Returns operator :math:`\\cos \\varphi` in the charge basis"""
@@ -168,6 +164,7 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         -------
         Figure, Axes
         """
+        import scqubits.utils.plotting as plot
         if nrange is None:
             nrange = self._default_n_range
         n_wavefunc = self.numberbasis_wavefunction(esys, which=which)
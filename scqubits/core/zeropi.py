@@ -19,12 +19,11 @@ import scqubits.core.central_dispatch as dispatch
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.operators as op
 from scqubits.core.noise import NoisySystem, NOISE_PARAMS
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
-import scqubits.ui.qubit_widget as ui
-import scqubits.utils.plotting as plot
 import scqubits.utils.spectrum_utils as spec_utils
 
 
@@ -83,6 +82,9 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         of EC
     truncated_dim: int, optional
         desired dimension of the truncated quantum system; expected: truncated_dim > 1
+    stencil: int, optional
+        number of points in the finite-difference stencil for derivatives w.r.t. `phi`: 3, 5, 7 or 9;
+        higher-order stencils converge with fewer grid points (default value = 3)
    """
     EJ = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
     EL = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
@@ -92,8 +94,10 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
     dCJ = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
     ng = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
     ncut = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
+    stencil = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
 
-    def __init__(self, EJ, EL, ECJ, EC, ng, flux, grid, ncut, dEJ=0, dCJ=0, ECS=None, truncated_dim=None):
+    def __init__(self, EJ, EL, ECJ, EC, ng, flux, grid, ncut, dEJ=0, dCJ=0, ECS=None, truncated_dim=None,
+                 stencil=3):
         self.EJ = EJ
         self.EL = EL
         self.ECJ = ECJ
@@ -113,6 +117,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         self.grid = grid
         self.ncut = ncut
         self.truncated_dim = truncated_dim
+        self.stencil = stencil
         self._sys_type = type(self).__name__
         self._evec_dtype = np.complex_
         # for theta, needed for plotting wavefunction
@@ -154,13 +159,20 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
                 't1_inductive_loss',
                 ]
 
-    def widget(self, params=None):
+    def widget(self, params=None, live_plot=False):
+        import scqubits.ui.qubit_widget as ui
         init_params = params or self.get_initdata()
         del init_params['grid']
         init_params['grid_max_val'] = self.grid.max_val
         init_params['grid_min_val'] = self.grid.min_val
         init_params['grid_pt_count'] = self.grid.pt_count
-        ui.create_widget(self.set_params, init_params, image_filename=self._image_filename)
+    def _live_plot_job(self):
+        """Returns a function computing the wave function plot for the present parameters, see `widget`. The
+        computation operates on a copy of the system, so that it can run in a background thread while the parameters
+        of the system itself are changed."""
+        return self.copy_with()._wavefunction_plot_renderer
+
+    def _check_live_plot_support(self):        ui.create_widget(self.set_params, init_params, image_filename=self._image_filename, plot_func=plot_func)
 
     def set_params(self, **kwargs):
         phi_grid = discretization.Grid1d(kwargs.pop('grid_min_val'),
@@ -174,20 +186,6 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         if sender is self.grid:
             self.broadcast('QUANTUMSYSTEM_UPDATE')
 
-    def _evals_calc(self, evals_count):
-        hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(hamiltonian_mat, k=evals_count, sigma=0.0, which='LM', return_eigenvectors=False)
-        return np.sort(evals)
-
-    def _esys_calc(self, evals_count):
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(hamiltonian_mat, k=evals_count, sigma=0.0, which='LM',
-                                           return_eigenvectors=True)
-        # TODO consider normalization of zeropi wavefunctions
-        # evecs /= np.sqrt(self.grid.grid_spacing())
-        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
-        return evals, evecs
-
     def get_ECS(self):
         return 1 / (1 / self.EC + 1 / self.ECJ)
 
@@ -235,7 +233,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         dim_theta = 2 * self.ncut + 1
         identity_phi = sparse.identity(pt_count, format='csc')
         identity_theta = sparse.identity(dim_theta, format='csc')
-        kinetic_matrix_phi = self.grid.second_derivative_matrix(prefactor=-2.0 * self.ECJ)
+        kinetic_matrix_phi = self.grid.second_derivative_matrix(prefactor=-2.0 * self.ECJ, stencil=self.stencil)
         diag_elements = 2.0 * self.ECS * np.square(np.arange(-self.ncut + self.ng, self.ncut + 1 + self.ng))
         kinetic_matrix_theta = sparse.dia_matrix((diag_elements, [0]), shape=(dim_theta, dim_theta)).tocsc()
         kinetic_matrix = (sparse.kron(kinetic_matrix_phi, identity_theta, format='csc')
@@ -364,8 +362,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         -------
             scipy.sparse.csc_matrix
         """
-        pt_count = self.grid.pt_count
-        return sparse.identity(pt_count, format='csc')
+        return op.identity(self.grid.pt_count, sparse_format='csc')
 
     def _identity_theta(self):
         r"""
@@ -375,8 +372,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         -------
             scipy.sparse.csc_matrix
         """
-        dim_theta = 2 * self.ncut + 1
-        return sparse.identity(dim_theta, format='csc')
+        return op.identity(2 * self.ncut + 1, sparse_format='csc')
 
     def i_d_dphi_operator(self):
         r"""
@@ -386,7 +382,8 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         -------
             scipy.sparse.csc_matrix
         """
-        return sparse.kron(self.grid.first_derivative_matrix(prefactor=1j), self._identity_theta(), format='csc')
+        return sparse.kron(self.grid.first_derivative_matrix(prefactor=1j, stencil=self.stencil), self._identity_theta(),
+                           format='csc')
 
     def _phi_operator(self):
         r"""
@@ -513,6 +510,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         **kwargs:
             plotting parameters
         """
+        import scqubits.utils.plotting as plot
         theta_grid = theta_grid or self._default_grid
 
         x_vals = self.grid.make_linspace()
@@ -558,6 +556,44 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
                                                      [theta_grid.min_val, theta_grid.max_val, theta_grid.pt_count]]))
         return storage.WaveFunctionOnGrid(grid2d, wavefunc_amplitudes)
 
+    def update_wavefunction_plot(self, handle=None, which=0, theta_grid=None, mode='abs', zero_calibrate=True):
+        """Plots the 2d phase-basis wave function with index `which` for the current parameters. If a plot handle from
+        a previous call is provided, the existing plot is updated in place instead of creating a new figure.
+
+        Parameters
+        ----------
+        handle: Wavefunction2dHandle, optional
+            handle returned by a previous call to `update_wavefunction_plot` (default value = None)
+        which: int, optional
+            index of wave function to be plotted (default value = 0)
+        theta_grid: Grid1d, optional
+            used for setting a custom grid for theta; if None use self._default_grid
+        mode: str, optional
+            choices as specified in `constants.MODE_FUNC_DICT` (default value = 'abs')
+        zero_calibrate: bool, optional
+            if True, colors are adjusted to use zero wavefunction amplitude as the neutral color in the palette
+
+        Returns
+        -------
+        Wavefunction2dHandle
+        """
+        return self._wavefunction_plot_renderer(which=which, theta_grid=theta_grid, mode=mode,
+                                                zero_calibrate=zero_calibrate)(handle)
+
+    def _wavefunction_plot_renderer(self, which=0, theta_grid=None, mode='abs', zero_calibrate=True):
+        import scqubits.utils.plotting as plot
+        theta_grid = theta_grid or self._default_grid
+        wavefunc = self.wavefunction(theta_grid=theta_grid, which=which)
+        wavefunc.amplitudes = constants.MODE_FUNC_DICT[mode](wavefunc.amplitudes)
+
+        def render(handle):
+            if handle is None:
+                return plot.Wavefunction2dHandle(wavefunc, zero_calibrate=zero_calibrate, xlabel=r'$\phi$',
+                                                 ylabel=r'$\theta$')
+            handle.update(wavefunc)
+            return handle
+        return render
+
     def plot_wavefunction(self, esys=None, which=0, theta_grid=None, mode='abs', zero_calibrate=True, **kwargs):
         """Plots 2d phase-basis wave function.
 
@@ -580,6 +616,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         -------
         Figure, Axes
         """
+        import scqubits.utils.plotting as plot
         theta_grid = theta_grid or self._default_grid
 
         amplitude_modifier = constants.MODE_FUNC_DICT[mode]
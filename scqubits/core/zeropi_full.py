@@ -22,7 +22,7 @@ from scqubits.core.noise import NoisySystem, NOISE_PARAMS
 import scqubits.core.operators as op
 import scqubits.core.qubit_base as base
 import scqubits.io_utils.fileio_serializers as serializers
-import scqubits.ui.qubit_widget as ui
+import scqubits.utils.eigensolvers as eigensolvers
 import scqubits.utils.spectrum_utils as spec_utils
 
 
@@ -87,6 +87,9 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         of EC
     truncated_dim: int, optional
         desired dimension of the truncated quantum system; expected: truncated_dim > 1
+    stencil: int, optional
+        number of points in the finite-difference stencil for derivatives w.r.t. `phi`: 3, 5, 7 or 9
+        (default value = 3)
     """
 
     EJ = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE', inner_object_name='_zeropi')
@@ -100,13 +103,14 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
     flux = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE', inner_object_name='_zeropi')
     grid = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE', inner_object_name='_zeropi')
     ncut = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE', inner_object_name='_zeropi')
+    stencil = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE', inner_object_name='_zeropi')
     zeropi_cutoff = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE', inner_object_name='_zeropi',
                                                 attr_name='truncated_dim')
     dC = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
     dEL = descriptors.WatchedProperty('QUANTUMSYSTEM_UPDATE')
 
     def __init__(self, EJ, EL, ECJ, EC, dEJ, dCJ, dC, dEL, flux, ng, zeropi_cutoff, zeta_cutoff, grid, ncut,
-                 ECS=None, truncated_dim=None):
+                 ECS=None, truncated_dim=None, stencil=3):
         self._zeropi = scqubits.ZeroPi(
             EJ=EJ,
             EL=EL,
@@ -120,7 +124,8 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
             dCJ=dCJ,
             ECS=ECS,
             # the zeropi_cutoff defines the truncated_dim of the "base" zeropi object
-            truncated_dim=zeropi_cutoff
+            truncated_dim=zeropi_cutoff,
+            stencil=stencil
         )
         self.dC = dC
         self.dEL = dEL
@@ -130,8 +135,12 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         self._evec_dtype = np.complex_
         self._init_params.remove('ECS')  # used for file IO Serializable purposes; remove ECS as init parameter
         self._image_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qubit_img/fullzeropi.jpg')
+        # cache for the eigensystem of the inner ZeroPi object, stored as (version, parameter key, evals, evecs)
+        self._zeropi_esys_version = 0
+        self._zeropi_esys_cache = None
 
         dispatch.CENTRAL_DISPATCH.register('GRID_UPDATE', self)
+        dispatch.CENTRAL_DISPATCH.register('QUANTUMSYSTEM_UPDATE', self)
 
     @staticmethod
     def default_params():
@@ -162,14 +171,15 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
 
     def supported_noise_channels(self):
         """Return a list of supported noise channels"""
-        return ['tphi_1_over_f_cc', 
-                'tphi_1_over_f_flux'
-                't1_bias_flux_line'
+        return ['tphi_1_over_f_cc',
+                'tphi_1_over_f_flux',
+                't1_flux_bias_line',
                 # 't1_capacitive_loss',
                 't1_inductive_loss',
                 ]
 
     def widget(self, params=None):
+        import scqubits.ui.qubit_widget as ui
         init_params = params or self.get_initdata()
         del init_params['grid']
         init_params['grid_max_val'] = self.grid.max_val
@@ -186,8 +196,43 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
             setattr(self, param_name, param_val)
 
     def receive(self, event, sender, **kwargs):
-        if sender is self._zeropi.grid:
+        if event == 'GRID_UPDATE' and sender is self._zeropi.grid:
+            self._zeropi_esys_version += 1
             self.broadcast('QUANTUMSYSTEM_UPDATE')
+        elif event == 'QUANTUMSYSTEM_UPDATE' and sender is self._zeropi:
+            self._zeropi_esys_version += 1
+
+    def _zeropi_params_key(self):
+        grid = self._zeropi.grid
+        return (tuple(getattr(self._zeropi, name) for name in self._zeropi._init_params if name != 'grid')
+                + (grid.min_val, grid.max_val, grid.pt_count))
+
+    def _zeropi_eigensys(self, evals_count=None):
+        """Returns the eigensystem of the inner ZeroPi object. The result is cached and reused as long as the ZeroPi
+        parameters remain unchanged. Invalidation is triggered by central dispatch; since dispatch may be disabled
+        (e.g., while a `ParameterSweep` is running), the cache entry additionally records the ZeroPi parameters.
+
+        Parameters
+        ----------
+        evals_count: int, optional
+            number of desired eigenvalues/eigenstates (default value = `zeropi_cutoff`)
+
+        Returns
+        -------
+        ndarray, ndarray
+        """
+        evals_count = evals_count or self.zeropi_cutoff
+        params_key = self._zeropi_params_key()
+        cache = self._zeropi_esys_cache
+        if (cache is None or cache[0] != self._zeropi_esys_version or cache[1] != params_key
+                or len(cache[2]) < evals_count):
+            evals, evecs = self._zeropi.eigensys(evals_count=evals_count)
+            self._zeropi_esys_cache = (self._zeropi_esys_version, params_key, evals, evecs)
+            return evals, evecs
+        _, _, evals, evecs = cache
+        if len(evals) == evals_count:
+            return evals, evecs
+        return evals[:evals_count], evecs[:, :evals_count]
 
     def __str__(self):
         output_str = super().__str__() + '\n\n'
@@ -220,28 +265,20 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         scipy.sparse.csc_matrix or list
         """
         zeropi_dim = self.zeropi_cutoff
-        zeropi_evals, zeropi_evecs = self._zeropi.eigensys(evals_count=zeropi_dim)
-        zeropi_diag_hamiltonian = sparse.dia_matrix((zeropi_dim, zeropi_dim), dtype=np.complex_)
-        zeropi_diag_hamiltonian.setdiag(zeropi_evals)
+        zeropi_evals, zeropi_evecs = self._zeropi_eigensys(evals_count=zeropi_dim)
 
         zeta_dim = self.zeta_cutoff
         prefactor = self.E_zeta
 
-        zeta_diag_hamiltonian = op.number_sparse(zeta_dim, prefactor)
-
-        hamiltonian_mat = sparse.kron(zeropi_diag_hamiltonian,
-                                      sparse.identity(zeta_dim, format='dia', dtype=np.complex_))
-        hamiltonian_mat += sparse.kron(sparse.identity(zeropi_dim, format='dia', dtype=np.complex_),
-                                       zeta_diag_hamiltonian)
+        # uncoupled part is diagonal in the product basis: E_l + E_zeta * n, with the zeta index running fastest
+        diag_elements = (zeropi_evals[:, np.newaxis] + prefactor * np.arange(zeta_dim)[np.newaxis, :]).ravel()
+        hamiltonian_mat = sparse.dia_matrix((diag_elements.astype(np.complex_), [0]),
+                                            shape=(zeropi_dim * zeta_dim, zeropi_dim * zeta_dim)).tocsc()
 
         gmat = self.g_coupling_matrix(zeropi_evecs)
-        zeropi_coupling = sparse.dia_matrix((zeropi_dim, zeropi_dim), dtype=np.complex_)
-        for l1 in range(zeropi_dim):
-            for l2 in range(zeropi_dim):
-                zeropi_coupling += gmat[l1, l2] * op.hubbard_sparse(l1, l2, zeropi_dim)
-        hamiltonian_mat += sparse.kron(zeropi_coupling,
-                                       op.annihilation_sparse(zeta_dim)) + sparse.kron(zeropi_coupling.conjugate().T,
-                                                                                       op.creation_sparse(zeta_dim))
+        zeropi_coupling = sparse.csc_matrix(gmat, dtype=np.complex_)
+        hamiltonian_mat += sparse.kron(zeropi_coupling, op.annihilation_sparse(zeta_dim), format='csc')
+        hamiltonian_mat += sparse.kron(zeropi_coupling.conjugate().T, op.creation_sparse(zeta_dim), format='csc')
 
         if return_parts:
             return [hamiltonian_mat.tocsc(), zeropi_evals, zeropi_evecs, gmat]
@@ -275,7 +312,7 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         return self._zeropi_operator_in_product_basis(self._zeropi.d_hamiltonian_d_EJ(),
                                                       zeropi_evecs=zeropi_evecs)
 
-    def d_hamiltonian_d_ng(self):
+    def d_hamiltonian_d_ng(self, zeropi_evecs=None):
         r"""Calculates a derivative of the Hamiltonian w.r.t ng.
         as stored in the object.
 
@@ -284,7 +321,7 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         scipy.sparse.csc_matrix
             matrix representing the derivative of the Hamiltonian
         """
-        return -8 * self.EC * self.n_theta_operator()
+        return -8 * self.EC * self.n_theta_operator(zeropi_evecs=zeropi_evecs)
 
     def _zeropi_operator_in_product_basis(self, zeropi_operator, zeropi_evecs=None):
         """Helper method that converts a zeropi operator into one in the product basis.
@@ -298,16 +335,10 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         zeta_dim = self.zeta_cutoff
 
         if zeropi_evecs is None:
-            _, zeropi_evecs = self._zeropi.eigensys(evals_count=zeropi_dim)
-
-        op_eigen_basis = sparse.dia_matrix((zeropi_dim, zeropi_dim),
-                                           dtype=np.complex_)  # is this guaranteed to be zero?
-
-        op_zeropi = spec_utils.get_matrixelement_table(zeropi_operator, zeropi_evecs)
-        for n in range(zeropi_dim):
-            for m in range(zeropi_dim):
-                op_eigen_basis += op_zeropi[n, m] * op.hubbard_sparse(n, m, zeropi_dim)
+            _, zeropi_evecs = self._zeropi_eigensys(evals_count=zeropi_dim)
 
+        op_eigen_basis = sparse.csc_matrix(spec_utils.get_matrixelement_table(zeropi_operator, zeropi_evecs),
+                                           dtype=np.complex_)
         return sparse.kron(op_eigen_basis, sparse.identity(zeta_dim, format='csc', dtype=np.complex_), format='csc')
 
     def i_d_dphi_operator(self, zeropi_evecs=None):
@@ -352,16 +383,12 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
     def _evals_calc(self, evals_count, hamiltonian_mat=None):
         if hamiltonian_mat is None:
             hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(hamiltonian_mat, k=evals_count, sigma=0.0, which='LM', return_eigenvectors=False)
-        return np.sort(evals)
+        return eigensolvers.lowest_eigenvals(hamiltonian_mat, evals_count, solver=self.eigensolver)
 
     def _esys_calc(self, evals_count, hamiltonian_mat=None):
         if hamiltonian_mat is None:
             hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(hamiltonian_mat, k=evals_count, sigma=0.0, which='LM',
-                                           return_eigenvectors=True)
-        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
-        return evals, evecs
+        return eigensolvers.lowest_eigensys(hamiltonian_mat, evals_count, solver=self.eigensolver)
 
     def g_phi_coupling_matrix(self, zeropi_states):
         """Returns a matrix of coupling strengths g^\\phi_{ll'} [cmp. Dempster et al., Eq. (18)], using the states
@@ -386,5 +413,5 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         if evals_count is None:
             evals_count = self._zeropi.truncated_dim
         if zeropi_states is None:
-            _, zeropi_states = self._zeropi.eigensys(evals_count=evals_count)
+            _, zeropi_states = self._zeropi_eigensys(evals_count=evals_count)
         return self.g_phi_coupling_matrix(zeropi_states) + self.g_theta_coupling_matrix(zeropi_states)
@@ -57,6 +57,10 @@ def deserialize(iodata):
     class instance
     """
     typename = iodata.typename
+    if typename not in io_serializers.SERIALIZABLE_REGISTRY:
+        # classes register upon import; make sure that lazily imported scqubits modules are loaded
+        import scqubits
+        scqubits.import_all()
     if typename in io_serializers.SERIALIZABLE_REGISTRY:
         cls = io_serializers.SERIALIZABLE_REGISTRY[typename]
         return cls.deserialize(iodata)
@@ -18,6 +18,7 @@ from numbers import Number
 
 import numpy as np
 
+import scqubits.core.descriptors as descriptors
 import scqubits.utils.misc as utils
 
 SERIALIZABLE_REGISTRY = {}
@@ -28,14 +29,19 @@ class Serializable(ABC):
     _subclasses = []
 
     def __new__(cls, *args, **kwargs):
-        """Modified `__new__` to set up `cls._init_params`. The latter is used to record which of the `__init__`
-         parameters are to be stored/read in file IO."""
-        cls._init_params = get_init_params(cls)
-        return super().__new__(cls)
+        """Modified `__new__` to set up `self._init_params`. The latter is used to record which of the `__init__`
+         parameters are to be stored/read in file IO. Instances receive their own copy of the list of class-level
+         `__init__` parameters, so that they may adjust it."""
+        instance = super().__new__(cls)
+        instance._init_params = list(cls._init_params)
+        return instance
 
     def __init_subclass__(cls, **kwargs):
-        """Used to register all non-abstract subclasses as a list in `QuantumSystem.subclasses`."""
+        """Used to register all non-abstract subclasses as a list in `QuantumSystem.subclasses`. Also records the
+        `__init__` parameters of the subclass in `cls._init_params`, once per class rather than upon each
+        instantiation."""
         super().__init_subclass__(**kwargs)
+        cls._init_params = get_init_params(cls)
         if not inspect.isabstract(cls):
             cls._subclasses.append(cls)
             SERIALIZABLE_REGISTRY[cls.__name__] = cls
@@ -49,6 +55,37 @@ class Serializable(ABC):
         """
         return {name: getattr(self, name) for name in self._init_params}
 
+    def copy_with(self, **params):
+        """Returns a copy of the object in which the given `__init__` parameters are replaced by new values. In
+        contrast to creating a new object from `get_initdata()`, `__init__` is not executed: attributes are copied
+        from the present object, and the new parameter values are set without central-dispatch broadcasts. As with
+        objects passed to `__init__`, public attributes are shared with the present object, whereas private
+        `Serializable` attributes (e.g., inner objects created by `__init__`) are copied recursively. The copy is not
+        registered with central dispatch.
+
+        Parameters
+        ----------
+        **params
+            `__init__` parameters (name=value) to be changed in the copy
+
+        Returns
+        -------
+        Serializable
+        """
+        unknown_params = set(params) - set(self._init_params)
+        if unknown_params:
+            raise TypeError('Cannot set the following parameters in copy of {}: {}'
+                            .format(type(self).__name__, sorted(unknown_params)))
+        new_obj = type(self).__new__(type(self))
+        new_obj.__dict__.update(self.__dict__)
+        for name, value in self.__dict__.items():
+            if name[0] == '_' and isinstance(value, Serializable):
+                new_obj.__dict__[name] = value.copy_with()
+        new_obj._init_params = list(self._init_params)
+        for name, value in params.items():
+            _set_without_broadcast(new_obj, name, value)
+        return new_obj
+
     @classmethod
     def deserialize(cls, io_data):
         """
@@ -218,6 +255,18 @@ def tuple_deserialize(iodata):
     return tuple(list_deserialize(iodata))
 
 
+def _set_without_broadcast(obj, name, value):
+    """Sets attribute `name` of `obj` to `value`. For attributes managed by a `WatchedProperty`, the value is stored
+    directly (in the inner object, where applicable), bypassing the broadcast to central dispatch."""
+    attribute = getattr(type(obj), name, None)
+    if not isinstance(attribute, descriptors.WatchedProperty):
+        setattr(obj, name, value)
+    elif attribute.inner:
+        _set_without_broadcast(obj.__dict__[attribute.inner], attribute.attr_name, value)
+    else:
+        obj.__dict__[attribute.attr_name] = value
+
+
 def get_init_params(obj):
     """
     Returns a list of the parameters entering the `__init__` method of the given object `obj`.
@@ -23,8 +23,6 @@ Matplotlib.
 #######################################################################################################################
 
 import warnings
-import matplotlib as mpl
-from cycler import cycler
 
 
 # Set format for output of warnings
@@ -54,6 +52,14 @@ AUTORUN_SWEEP = True
 # enable/disable the CENTRAL_DISPATCH system
 DISPATCH_ENABLED = True
 
+# Profiling ------------------------------------------------------------------------------------------------------------
+# record timing data of computational stages (e.g., of ParameterSweep) in `scqubits.utils.profiling.GLOBAL_PROFILER`
+PROFILE = False
+
+# Widgets --------------------------------------------------------------------------------------------------------------
+# time (in seconds) that widgets wait for further input before a parameter change is processed
+WIDGET_DEBOUNCE_TIME = 0.3
+
 # For parallel processing ----------------------------------------------------------------------------------------------
 # store processing pool once generated
 POOL = None
@@ -66,28 +72,21 @@ NUM_CPUS = 1
 MULTIPROC = 'pathos'
 
 # Matplotlib options ---------------------------------------------------------------------------------------------------
-# set custom matplotlib color cycle
-mpl.rcParams['axes.prop_cycle'] = cycler(color=["#016E82",
-                                                "#333795",
-                                                "#2E5EAC",
-                                                "#4498D3",
-                                                "#CD85B9",
-                                                "#45C3D1",
-                                                "#AA1D3F",
-                                                "#F47752",
-                                                "#19B35A",
-                                                "#EDE83B",
-                                                "#ABD379",
-                                                "#F9E6BE"])
-
-# set matplotlib defaults
-mpl.rcParams['font.family'] = "sans-serif"
-mpl.rcParams['font.sans-serif'] = "Arial, Helvetica"
-mpl.rcParams['figure.dpi'] = 150
-mpl.rcParams['font.size'] = 11
-mpl.rcParams['axes.labelsize'] = 11
-mpl.rcParams['xtick.labelsize'] = 10
-mpl.rcParams['ytick.labelsize'] = 10
+# The following are applied to `matplotlib.rcParams` once scqubits' plotting routines are first loaded (matplotlib
+# itself is only imported when needed).
+# custom matplotlib color cycle
+MATPLOTLIB_COLOR_CYCLE = ["#016E82", "#333795", "#2E5EAC", "#4498D3", "#CD85B9", "#45C3D1", "#AA1D3F", "#F47752",
+                          "#19B35A", "#EDE83B", "#ABD379", "#F9E6BE"]
+# further matplotlib defaults
+MATPLOTLIB_RCPARAMS = {
+    'font.family': "sans-serif",
+    'font.sans-serif': "Arial, Helvetica",
+    'figure.dpi': 150,
+    'font.size': 11,
+    'axes.labelsize': 11,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10
+}
 
 # toggle top and right axes on and off
 DESPINE = True
@@ -0,0 +1,75 @@
+# test_central_dispatch.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import threading
+
+import pytest
+
+import scqubits.core.central_dispatch as dispatch
+from scqubits import Transmon
+
+
+class EventRecorder(dispatch.DispatchClient):
+    def __init__(self):
+        self.received = []
+        dispatch.CENTRAL_DISPATCH.register('QUANTUMSYSTEM_UPDATE', self)
+
+    def receive(self, event, sender, **kwargs):
+        self.received.append((event, sender))
+
+
+def test_deferred_coalesces_events():
+    recorder = EventRecorder()
+    qubit1 = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=10)
+    qubit2 = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=10)
+    recorder.received.clear()
+    with dispatch.CENTRAL_DISPATCH.deferred():
+        qubit1.EJ = 10.0
+        qubit2.EJ = 10.0
+        with dispatch.CENTRAL_DISPATCH.deferred():
+            qubit1.EC = 0.2
+        assert recorder.received == []
+    assert recorder.received == [('QUANTUMSYSTEM_UPDATE', qubit1), ('QUANTUMSYSTEM_UPDATE', qubit2)]
+
+
+def test_suppressed_discards_events():
+    recorder = EventRecorder()
+    qubit = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=10)
+    recorder.received.clear()
+    with dispatch.CENTRAL_DISPATCH.deferred():
+        with dispatch.CENTRAL_DISPATCH.suppressed():
+            qubit.EJ = 10.0
+    assert recorder.received == []
+    qubit.EJ = 12.0
+    assert recorder.received == [('QUANTUMSYSTEM_UPDATE', qubit)]
+
+
+def test_suppressed_is_thread_local():
+    recorder = EventRecorder()
+    qubit = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=10)
+    recorder.received.clear()
+    with dispatch.CENTRAL_DISPATCH.suppressed():
+        thread = threading.Thread(target=setattr, args=(qubit, 'EJ', 10.0))
+        thread.start()
+        thread.join()
+    assert recorder.received == [('QUANTUMSYSTEM_UPDATE', qubit)]
+
+
+def test_central_dispatch_is_picklable():
+    dill = pytest.importorskip('dill')   # used for pickling in multiprocessing (pathos)
+    recorder = EventRecorder()
+    with dispatch.CENTRAL_DISPATCH.suppressed():
+        restored = dill.loads(dill.dumps(dispatch.CENTRAL_DISPATCH))
+    assert not restored._scopes()
+    with restored.suppressed():
+        assert restored._scopes()
+    dispatch.CENTRAL_DISPATCH.unregister_object(recorder)
@@ -0,0 +1,60 @@
+# test_circuit.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+import scqubits.core.circuit as circuit
+from scqubits import CircuitFluxQubit
+
+
+def single_junction_circuit():
+    qbt = circuit.Circuit()
+    qbt.add_element(circuit.Capacitance('C', capacitance=1 / (8 * 0.3)), ['GND', '1'])
+    qbt.add_element(circuit.JosephsonJunction('J', critical_current=20.0), ['GND', '1'])
+    phi = circuit.Variable('\\phi')
+    phi.set_variable(21, 1)
+    qbt.add_variable(phi)
+    qbt.map_nodes_linear(['GND', '1'], ['\\phi'], np.asarray([[0], [1]]))
+    return qbt
+
+
+def test_copy_with_user_built_network():
+    qbt = single_junction_circuit()
+    qbt_copy = qbt.copy_with(use_sparse=True)
+    assert qbt_copy.use_sparse and not qbt.use_sparse
+    assert len(qbt_copy.elements) == len(qbt.elements) == 2
+    assert qbt_copy.elements[0] is not qbt.elements[0]
+    assert np.allclose(qbt_copy.hamiltonian().toarray(), qbt.hamiltonian())
+
+    qbt_copy.find_element('J').set_critical_current(10.0)
+    assert qbt.find_element('J').get_critical_current() == 20.0
+
+
+def test_copy_with_network_built_in_init():
+    qbt = CircuitFluxQubit(EJ1=1.0, EJ2=1.0, EJ3=0.8, ECJ1=0.016, ECJ2=0.016, ECJ3=0.021, ECg1=0.83, ECg2=0.83,
+                           ng1=0.1, ng2=0.2, flux=0.46, ncut=5)
+    qbt_copy = qbt.copy_with(flux=0.5)
+    assert qbt_copy.flux == 0.5
+    assert qbt_copy._network_signature() == qbt._network_signature()
+
+    qbt.add_element(circuit.Capacitance('C4'), ['2', '3'])
+    with pytest.raises(ValueError):
+        qbt.copy_with(flux=0.5)
+
+
+def test_live_plot_unavailable():
+    qbt = single_junction_circuit()
+    with pytest.raises(NotImplementedError):
+        qbt.widget(live_plot=True)
+    with pytest.raises(NotImplementedError):
+        qbt.update_wavefunction_plot()
@@ -27,3 +27,11 @@ class TestCircuitFluxQubit(StandardTests):
         cls.param_name = 'flux'
         cls.param_list = np.linspace(0.45, 0.55, 50)
         cls.atol = 2e-5
+
+    def test_sparse_hamiltonian(self):
+        params = dict(EJ1=1.0, EJ2=1.0, EJ3=0.8, ECJ1=0.016, ECJ2=0.016, ECJ3=0.021, ECg1=0.83, ECg2=0.83, ng1=0.1,
+                      ng2=0.2, flux=0.46, ncut=10)
+        dense_qbt = CircuitFluxQubit(**params)
+        sparse_qbt = CircuitFluxQubit(**params, use_sparse=True)
+        assert np.allclose(dense_qbt.hamiltonian(), sparse_qbt.hamiltonian().toarray())
+        assert np.allclose(dense_qbt.eigenvals(evals_count=6), sparse_qbt.eigenvals(evals_count=6))
@@ -0,0 +1,52 @@
+# test_discretization.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+from scqubits import Grid1d
+
+
+STENCILS = [3, 5, 7, 9]
+
+
+@pytest.mark.parametrize("stencil", STENCILS)
+def test_periodic_derivatives_of_sine(stencil):
+    grid = Grid1d(0, 2 * np.pi, 64)
+    # for periodic variables, grid points are spaced by (max_val - min_val) / pt_count
+    x_vals = grid.min_val + grid.grid_spacing() * np.arange(grid.pt_count)
+    first = grid.first_derivative_matrix(periodic=True, stencil=stencil) @ np.sin(x_vals)
+    second = grid.second_derivative_matrix(periodic=True, stencil=stencil) @ np.sin(x_vals)
+    assert np.allclose(first, np.cos(x_vals), atol=1e-2)
+    assert np.allclose(second, -np.sin(x_vals), atol=1e-2)
+
+
+def test_higher_order_stencils_converge_faster():
+    grid = Grid1d(0, 2 * np.pi, 32)
+    x_vals = grid.min_val + grid.grid_spacing() * np.arange(grid.pt_count)
+    errors = [np.max(np.abs(grid.second_derivative_matrix(periodic=True, stencil=stencil) @ np.sin(x_vals)
+                            + np.sin(x_vals)))
+              for stencil in STENCILS]
+    assert np.all(np.diff(errors) < 0)
+
+
+def test_three_point_stencil_matches_standard_form():
+    grid = Grid1d(-1, 1, 10)
+    delta_x = grid.grid_spacing()
+    second = grid.second_derivative_matrix(prefactor=2.0).toarray()
+    reference = 2.0 * (np.diag(-2.0 * np.ones(10)) + np.diag(np.ones(9), 1) + np.diag(np.ones(9), -1)) / delta_x**2
+    assert np.allclose(second, reference)
+
+
+def test_unsupported_stencil():
+    with pytest.raises(ValueError):
+        Grid1d(-1, 1, 10).first_derivative_matrix(stencil=4)
@@ -0,0 +1,71 @@
+# test_dispersive.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+import scqubits as scq
+from scqubits.core.dispersive import dispersive_shifts, perturbative_energies
+
+
+def transmon_oscillator_hilbertspace(add_hc=False):
+    tmon = scq.Transmon(EJ=20.0, EC=0.3, ng=0.1, ncut=30, truncated_dim=6)
+    osc = scq.Oscillator(E_osc=9.0, truncated_dim=8)
+    osc_op = osc.annihilation_operator() if add_hc else osc.creation_operator() + osc.annihilation_operator()
+    hilbertspace = scq.HilbertSpace([tmon, osc])
+    hilbertspace.interaction_list = [scq.InteractionTerm(g_strength=0.02, subsys1=tmon, op1='n_operator',
+                                                         subsys2=osc, op2=osc_op, add_hc=add_hc)]
+    return hilbertspace, tmon, osc
+
+
+@pytest.mark.parametrize('method', ['perturbative', 'schrieffer-wolff'])
+@pytest.mark.parametrize('add_hc', [False, True])
+def test_dispersive_shifts_match_exact_spectrum(method, add_hc):
+    hilbertspace, tmon, osc = transmon_oscillator_hilbertspace(add_hc)
+    hilbertspace.generate_lookup()
+    energy = hilbertspace.lookup.energy_bare_index
+    exact_chi = [energy((j, 1)) - energy((j, 0)) - osc.E_osc for j in range(4)]
+    exact_qubit_freqs = [energy((j, 0)) - energy((0, 0)) for j in range(4)]
+
+    data = dispersive_shifts(hilbertspace, tmon, osc, method=method)
+    assert np.allclose(data.chi[:4], exact_chi, rtol=0, atol=1e-6)
+    assert np.allclose(data.qubit_freqs[:4], exact_qubit_freqs, rtol=1e-6)
+    assert np.allclose(data.lamb_shift, data.dressed_energies[:, 0] - tmon.eigenvals(evals_count=6))
+
+
+def test_dispersive_shifts_vectorized_over_paramvals_and_omegas():
+    hilbertspace, tmon, osc = transmon_oscillator_hilbertspace()
+    ng_vals = np.linspace(0.0, 0.5, 3)
+    osc_omegas = np.linspace(8.0, 10.0, 4)
+    data = dispersive_shifts(hilbertspace, tmon, osc, param_name='ng', param_vals=ng_vals, osc_omegas=osc_omegas)
+    assert data.chi.shape == (3, 4, 6)
+    assert data.dressed_energies.shape == (3, 4, 6, 2)
+    assert tmon.ng == 0.1
+
+    tmon.ng = ng_vals[1]
+    osc.E_osc = osc_omegas[2]
+    single_point = dispersive_shifts(hilbertspace, tmon, osc)
+    assert np.allclose(data.chi[1, 2], single_point.chi)
+    assert np.allclose(data.lamb_shift[1, 2], single_point.lamb_shift)
+
+
+def test_perturbative_energies_two_level_system():
+    # qubit with levels 0, delta coupled by g sigma_x (a + a^dagger): E_{0,0} = -g^2 / (delta + omega)
+    delta, omega, g = 1.0, 3.0, 0.01
+    sigma_x = np.array([[0.0, 1.0], [1.0, 0.0]])
+    a = np.diag(np.sqrt(np.arange(1, 6)), k=1)
+    energies = perturbative_energies([0.0, delta], [sigma_x], omega, [a + a.T], [g])
+    assert np.isclose(energies[0, 0], -g**2 / (delta + omega))
+    assert np.isclose(energies[1, 0], delta + g**2 / (delta - omega))
+
+    with pytest.raises(ValueError):
+        perturbative_energies([0.0, delta], [sigma_x], omega, [a + a.T], [g], osc_levels=6)
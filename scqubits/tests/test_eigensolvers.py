@@ -0,0 +1,81 @@
+# test_eigensolvers.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+import scqubits as scq
+import scqubits.utils.eigensolvers as eigensolvers
+
+
+@pytest.mark.parametrize('solver', ['dense', 'banded', 'sparse', 'lobpcg'])
+def test_solvers_agree(solver):
+    matrix = eigensolvers._grid_hamiltonian(400)
+    evals_reference = np.linalg.eigvalsh(matrix.toarray())[:6]
+    evals = eigensolvers.lowest_eigenvals(matrix, 6, solver=solver)
+    assert np.allclose(evals, evals_reference)
+    evals, evecs = eigensolvers.lowest_eigensys(matrix, 6, solver=solver)
+    assert np.allclose(evals, evals_reference)
+    assert np.allclose(matrix @ evecs, evecs * evals, atol=1e-5)
+
+
+def test_choose_solver():
+    transmon = scq.Transmon(EJ=30.0, EC=1.2, ng=0.3, ncut=31)
+    assert eigensolvers.choose_solver(transmon.hamiltonian(), 6) == 'tridiagonal'
+    fluxonium = scq.Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.33, cutoff=110)
+    assert eigensolvers.choose_solver(fluxonium.hamiltonian(), 6) == 'dense'
+    matrix = eigensolvers._grid_hamiltonian(2500)
+    assert eigensolvers.choose_solver(matrix, 6) == 'sparse'
+    assert eigensolvers.choose_solver(matrix, 1000) == 'dense'
+
+
+def test_eigensolver_override():
+    transmon = scq.Transmon(EJ=30.0, EC=1.2, ng=0.3, ncut=31)
+    evals_reference = transmon.eigenvals()
+    transmon.eigensolver = 'dense'
+    assert np.allclose(transmon.eigenvals(), evals_reference)
+    transmon.eigensolver = 'unknown'
+    with pytest.raises(ValueError):
+        transmon.eigenvals()
+    with pytest.raises(ValueError):
+        eigensolvers.lowest_eigenvals(eigensolvers._grid_hamiltonian(100), 6, solver='tridiagonal')
+
+
+def test_eigensys_near():
+    matrix = eigensolvers._grid_hamiltonian(900)
+    evals_reference = np.linalg.eigvalsh(matrix.toarray())
+    sigma = np.mean(evals_reference[400:402])
+    evals, evecs = eigensolvers.eigensys_near(matrix, sigma, 4)
+    assert np.allclose(evals, evals_reference[np.sort(np.argsort(np.abs(evals_reference - sigma))[:4])])
+    assert np.allclose(matrix @ evecs, evecs * evals)
+
+
+def test_blockwise_eigensys():
+    random_state = np.random.RandomState(seed=0)
+    quantum_numbers = random_state.randint(0, 4, size=60)
+    matrix = random_state.normal(size=(60, 60))
+    matrix = (matrix + matrix.T) * (quantum_numbers[:, None] == quantum_numbers[None, :])
+    blocks = eigensolvers.conserved_blocks(matrix, quantum_numbers)
+    assert len(blocks) == 4
+    evals_reference = np.linalg.eigvalsh(matrix)[:5]
+    assert np.allclose(eigensolvers.blockwise_eigensys(matrix, blocks, 5, return_eigenvectors=False), evals_reference)
+    evals, evecs = eigensolvers.blockwise_eigensys(matrix, blocks, 5)
+    assert evecs.shape == (60, 5)
+    assert np.allclose(evals, evals_reference)
+    assert np.allclose(matrix @ evecs, evecs * evals)
+
+
+def test_calibrate():
+    thresholds = eigensolvers.calibrate(dims=(100, 400), banded_dim=200, bandwidth_fractions=(0.02,), repeats=1,
+                                        update=False)
+    assert set(thresholds) == {'sparse_min_dim', 'banded_max_bandwidth_fraction', 'lobpcg_min_dim', 'timings'}
+    assert len(thresholds['timings']['sparse']) == 2
@@ -11,13 +11,16 @@
 ############################################################################
 
 import numpy as np
+import pytest
 
 import scqubits as qubit
+import scqubits.core.central_dispatch as dispatch
 import scqubits.core.sweep_generators as swp
+import scqubits.core.sweep_observables as observable
 from scqubits import Explorer, InteractionTerm, ParameterSweep
 
 
-def test_explorer():
+def fluxonium_oscillator_sweep():
     qbt = qubit.Fluxonium(
         EJ=2.55,
         EC=0.72,
@@ -61,6 +64,11 @@ def test_explorer():
         subsys_update_list=subsys_update_list,
         update_hilbertspace=update_hilbertspace,
     )
+    return sweep
+
+
+def test_explorer():
+    sweep = fluxonium_oscillator_sweep()
     swp.generate_chi_sweep(sweep)
     swp.generate_charge_matrixelem_sweep(sweep)
 
@@ -70,3 +78,68 @@ def test_explorer():
     )
 
     explorer.interact()
+
+
+def test_explorer_update_in_place():
+    sweep = fluxonium_oscillator_sweep()
+    explorer = Explorer(sweep=sweep, evals_count=10)
+    fig, _ = explorer.plot_explorer_panels(0.0, 1, 0, 1, 0, 1)
+    wavefunc_line = explorer._handles['wavefunctions']['wavefunctions'][0]
+    ydata = np.copy(wavefunc_line.get_ydata())
+
+    assert explorer.update_explorer_panels(0.25, 2, 0, 1, 0, 1) is fig
+    assert explorer._handles['wavefunctions']['wavefunctions'][0] is wavefunc_line
+    assert not np.allclose(ydata, wavefunc_line.get_ydata())
+    param_index = np.searchsorted(sweep.param_vals, 0.25)
+    energies = explorer.panel_data['transitions'][explorer._state['initial_bare']][1][:, 0]
+    assert np.allclose(explorer._handles['transitions']['transitions'][0].get_ydata(), energies / 2, equal_nan=True)
+    assert explorer._state['param_index'] == param_index
+    assert not sweep.lookup._out_of_sync
+
+
+def test_explorer_restores_subsystem_parameters():
+    sweep = fluxonium_oscillator_sweep()
+    qbt = sweep.qbt_subsys_list[0][1]
+    with dispatch.CENTRAL_DISPATCH.suppressed():
+        qbt.flux = 0.1
+    Explorer(sweep=sweep, evals_count=10)
+    assert qbt.flux == 0.1
+    assert not sweep.lookup._out_of_sync
+
+def test_sweep_generators_match_lookups_per_param_index():
+    sweep = fluxonium_oscillator_sweep()
+    qbt = sweep.qbt_subsys_list[0][1]
+    osc = sweep.osc_subsys_list[0][1]
+
+    chi = swp.generate_chi_sweep(sweep)[(1, 0)].chi
+    chi_reference = swp.compute_custom_data_sweep(sweep, observable.dispersive_chi, qubit_subsys=qbt, osc_subsys=osc,
+                                                  chi_indices=(1, 0))
+    assert np.allclose(chi, chi_reference, equal_nan=True)
+
+    matrixelem_table = swp.generate_charge_matrixelem_sweep(sweep)[(0, qbt)].matrixelem_table
+    matrixelem_reference = swp.compute_custom_data_sweep(sweep, observable.qubit_matrixelement, qubit_subsys=qbt,
+                                                         qubit_operator=qbt.n_operator())
+    assert np.allclose(matrixelem_table, matrixelem_reference)
+
+    diff_table = swp.generate_diffspec_sweep(sweep, initial_state_ind=(1, 0)).energy_table
+    target_labels_list, specdata = swp.generate_qubit_transitions_sweep(sweep, 2, (1, 0))
+    for param_index in range(sweep.param_count):
+        initial_energy = sweep.lookup.energy_bare_index((1, 0), param_index)
+        energies = sweep.dressed_specdata.energy_table[param_index]
+        assert np.allclose(diff_table[param_index], energies - initial_energy)
+        for target_index, target_labels in enumerate(target_labels_list):
+            target_energy = sweep.lookup.energy_bare_index(target_labels, param_index)
+            expected = np.nan if target_energy is None else (target_energy - initial_energy) / 2
+            assert np.allclose(specdata.energy_table[param_index, target_index], expected, equal_nan=True)
+
+
+def test_explorer_background_error(monkeypatch):
+    sweep = fluxonium_oscillator_sweep()
+
+    def failing_computation(self):
+        raise ValueError("panel data failure")
+
+    monkeypatch.setattr(Explorer, '_compute_panel_data', failing_computation)
+    explorer = Explorer(sweep=sweep, evals_count=10, background=True)
+    with pytest.raises(ValueError, match="panel data failure"):
+        explorer.plot_explorer_panels(0.0, 1, 0, 1, 0, 1)
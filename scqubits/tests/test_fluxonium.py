@@ -26,3 +26,13 @@ class TestFluxonium(StandardTests):
         cls.op2_str = 'phi_operator'
         cls.param_name = 'flux'
         cls.param_list = np.linspace(0.45, 0.55, 50)
+
+    def test_matelements_vs_paramvals_use_operator_at_each_paramval(self):
+        qbt = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, cutoff=110, flux=0.3)
+        param_vals = np.linspace(0.4, 0.6, 3)
+        specdata = qbt.get_matelements_vs_paramvals('d_hamiltonian_d_flux', 'flux', param_vals, evals_count=4)
+        assert qbt.flux == 0.3
+        for index, flux in enumerate(param_vals):
+            qbt.flux = flux
+            table = qbt.matrixelement_table('d_hamiltonian_d_flux', evecs=specdata.state_table[index])
+            assert np.allclose(specdata.matrixelem_table[index], table)
@@ -40,3 +40,25 @@ class TestFullZeroPi(BaseTest):
         self.qbt = self.qbt_type(**specdata.system_params)
         evals_reference = specdata.energy_table
         return self.eigenvals(io_type, evals_reference)
+
+    def test_zeropi_eigensys_cache(self, io_type):
+        testname = self.file_str + '_1.' + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        _, evecs = self.qbt._zeropi_eigensys()
+        _, evecs_cached = self.qbt._zeropi_eigensys()
+        assert evecs_cached is evecs
+        self.qbt.flux += 0.01
+        _, evecs_updated = self.qbt._zeropi_eigensys()
+        assert evecs_updated is not evecs
+        assert np.allclose(self.qbt.n_theta_operator().toarray(),
+                           self.qbt.n_theta_operator(zeropi_evecs=evecs_updated).toarray())
+
+    def test_copy_with(self, io_type):
+        testname = self.file_str + '_1.' + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        qbt_copy = self.qbt.copy_with(flux=self.qbt.flux + 0.01)
+        assert qbt_copy._zeropi is not self.qbt._zeropi
+        assert qbt_copy.flux != self.qbt.flux
+        assert qbt_copy.get_initdata()['EJ'] == self.qbt.EJ
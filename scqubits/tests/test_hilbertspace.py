@@ -12,8 +12,10 @@
 
 import numpy as np
 import pytest
+import qutip as qt
 
 import scqubits as qubit
+import scqubits.utils.eigensolvers as eigensolvers
 from scqubits.core.hilbert_space import HilbertSpace, InteractionTerm
 from scqubits.core.param_sweep import ParameterSweep
 from scqubits.core.sweep_generators import generate_diffspec_sweep
@@ -219,6 +221,50 @@ class TestHilbertSpace:
                                       2.09778458, 5.73747149, 7.49164636, 13.4096702])
         assert np.allclose(evals, evals_reference)
 
+    @pytest.mark.parametrize('sparse_min_dim', [1000, 10])
+    def test_HilbertSpace_eigensys_for_bare_states(self, monkeypatch, sparse_min_dim):
+        # sparse_min_dim = 10 enforces shift-invert mode
+        monkeypatch.setitem(eigensolvers.THRESHOLDS, 'sparse_min_dim', sparse_min_dim)
+        hilbertspace = self.hilbertspace_initialize()
+        hilbertspace.generate_lookup()
+        bare_labels = [(0, 0, 0), (2, 1, 3), (1, 3, 2), (0, 0, 3)]
+        evals, evecs = hilbertspace.eigensys_for_bare_states(bare_labels)
+        for index, labels in enumerate(bare_labels):
+            dressed_index = hilbertspace.lookup.dressed_index(labels)
+            assert np.isclose(evals[index], hilbertspace.lookup.energy_dressed_index(dressed_index))
+            assert np.isclose(abs(evecs[index].overlap(hilbertspace.lookup.dressed_eigenstates()[dressed_index])), 1)
+
+    @staticmethod
+    def jaynes_cummings_hilbertspace():
+        tmon = qubit.Transmon(EJ=20.0, EC=0.3, ng=0.1, ncut=30, truncated_dim=4)
+        resonator = qubit.Oscillator(E_osc=6.5, truncated_dim=10)
+        qubit_lowering = qt.Qobj(np.diag(np.sqrt(np.arange(1, 4)), k=1))   # in the qubit eigenbasis
+        interaction = InteractionTerm(g_strength=0.1, op1=qubit_lowering, subsys1=tmon,
+                                      op2=resonator.creation_operator(), subsys2=resonator, add_hc=True)
+        return HilbertSpace([tmon, resonator], interaction_list=[interaction])
+
+    def test_HilbertSpace_excitation_blocks(self, num_cpus):
+        hilbertspace = self.jaynes_cummings_hilbertspace()
+        blocks = hilbertspace.excitation_blocks()
+        assert len(blocks) == 13
+        excitation_numbers = hilbertspace.excitation_numbers()
+        assert all(np.all(excitation_numbers[block] == excitation_numbers[block[0]]) for block in blocks)
+
+        evals, evecs = hilbertspace.eigensys(evals_count=12, num_cpus=num_cpus)
+        evals_reference = hilbertspace.hamiltonian().eigenenergies(eigvals=12)
+        assert np.allclose(evals, evals_reference)
+        assert np.allclose(hilbertspace.eigenvals(evals_count=12), evals_reference)
+        hamiltonian = hilbertspace.hamiltonian()
+        for evec, energy in zip(evecs, evals):
+            assert np.allclose((hamiltonian * evec).full(), energy * evec.full())
+
+        hilbertspace.excitation_weights = [1, 2]
+        with pytest.raises(ValueError):
+            hilbertspace.excitation_blocks()
+        hilbertspace.excitation_weights = None
+        assert hilbertspace.excitation_blocks() is None
+        assert self.hilbertspace_initialize().excitation_blocks() is None
+
 
 @pytest.mark.usefixtures("num_cpus")
 class TestParameterSweep:
@@ -302,3 +348,57 @@ class TestParameterSweep:
                                        11.97802377, 12.46554431, 13.40154194, 13.71041554, 15.24359501, 16.70439594,
                                        17.01076356, 17.64202619])
         assert np.allclose(reference_energies, calculated_energies)
+
+    def test_ParameterSweep_target_bare_labels(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        bare_labels = [(1, 0, 1), (0, 0, 0), (0, 2, 0)]
+        target_sweep = ParameterSweep(sweep.param_name, sweep.param_vals, evals_count=15,
+                                      hilbertspace=sweep._hilbertspace, subsys_update_list=sweep.subsys_update_list,
+                                      update_hilbertspace=sweep.update_hilbertspace, num_cpus=num_cpus,
+                                      target_bare_labels=bare_labels)
+        assert target_sweep.evals_count == 3
+        for param_index in range(sweep.param_count):
+            for labels in bare_labels:
+                assert np.isclose(target_sweep.lookup.energy_bare_index(labels, param_index),
+                                  sweep.lookup.energy_bare_index(labels, param_index))
+
+    def test_ParameterSweep_dressed_energies_match_hilbertspace(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        hilbertspace = sweep._hilbertspace
+        CPB1, CPB2, resonator = hilbertspace
+        hilbertspace.interaction_list = [
+            InteractionTerm(g_strength=0.1, op1='n_operator', subsys1=CPB1, op2=resonator.annihilation_operator(),
+                            subsys2=resonator, add_hc=True),
+            InteractionTerm(g_strength=0.05, op1='n_operator', subsys1=CPB1, op2='n_operator', subsys2=CPB2),
+            hilbertspace.interaction_list[1]
+        ]
+        new_sweep = ParameterSweep(sweep.param_name, sweep.param_vals[::25], evals_count=15,
+                                   hilbertspace=hilbertspace, subsys_update_list=sweep.subsys_update_list,
+                                   update_hilbertspace=sweep.update_hilbertspace, num_cpus=num_cpus)
+        for param_index, param_val in enumerate(new_sweep.param_vals):
+            sweep.update_hilbertspace(param_val)
+            assert np.allclose(new_sweep.dressed_specdata.energy_table[param_index],
+                               hilbertspace.eigenvals(evals_count=15))
+
+    def test_ParameterSweep_interaction_only(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        hilbertspace = sweep._hilbertspace
+        interaction1, interaction2 = hilbertspace.interaction_list
+        interaction2.add_hc = True
+        interaction2.op2 = hilbertspace[2].annihilation_operator()
+
+        def update_hilbertspace(g):
+            interaction1.g_strength = g
+            interaction2.g_strength = 0.5 * g
+
+        g_vals = np.linspace(0.0, 0.3, 7)
+        coupling_sweep = ParameterSweep('g', g_vals, evals_count=15, hilbertspace=hilbertspace, subsys_update_list=[],
+                                        update_hilbertspace=update_hilbertspace, num_cpus=num_cpus,
+                                        interaction_only=True)
+        specdata = hilbertspace.get_spectrum_vs_paramvals(g_vals, update_hilbertspace, evals_count=15, num_cpus=1)
+        assert np.allclose(coupling_sweep.dressed_specdata.energy_table, specdata.energy_table)
+
+        with pytest.raises(ValueError):
+            ParameterSweep('g', g_vals, evals_count=15, hilbertspace=hilbertspace,
+                           subsys_update_list=sweep.subsys_update_list, update_hilbertspace=update_hilbertspace,
+                           num_cpus=num_cpus, interaction_only=True)
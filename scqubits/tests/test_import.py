@@ -0,0 +1,53 @@
+# test_import.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import scqubits
+
+HEAVY_MODULES = ['matplotlib', 'matplotlib.pyplot', 'qutip', 'sympy', 'ipywidgets', 'IPython', 'tqdm']
+
+IMPORT_BENCHMARK = """
+import json, sys
+import scqubits
+loaded_on_import = [name for name in %r if name in sys.modules]
+transmon = scqubits.Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=20)
+transmon.eigenvals()
+transmon.matrixelement_table('n_operator')
+print(json.dumps({'loaded_on_import': loaded_on_import,
+                  'loaded': [name for name in %r if name in sys.modules]}))
+""" % (HEAVY_MODULES, HEAVY_MODULES)
+
+
+def run_import_benchmark():
+    output = subprocess.run([sys.executable, '-c', IMPORT_BENCHMARK], check=True, stdout=subprocess.PIPE,
+                            universal_newlines=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="public names are imported eagerly on Python 3.6")
+def test_import_is_lightweight():
+    result = run_import_benchmark()
+    assert result['loaded_on_import'] == []
+    assert result['loaded'] == []
+
+
+def test_lazy_attributes():
+    assert scqubits.Transmon.__name__ == 'Transmon'
+    assert 'FluxQubit' in dir(scqubits)
+    scqubits.import_all()
+    for name in scqubits.__all__:
+        assert getattr(scqubits, name) is not None
@@ -93,4 +93,17 @@ class TestNoise:
         )
         assert compare_coherence_to_reference(qubit, 'ZeroPi')
 
-
+    def test_noise_operators_shared_between_channels(self, monkeypatch):
+        qubit = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, cutoff=150, flux=0.5)
+        esys = qubit.eigensys(evals_count=2)
+        rates = [getattr(qubit, channel)(esys=esys, get_rate=True) for channel in qubit.effective_noise_channels()]
+        call_counts = {}
+        for operator_name in ['d_hamiltonian_d_flux', 'n_operator']:
+            def counting_operator(operator=getattr(qubit, operator_name), name=operator_name):
+                call_counts[name] = call_counts.get(name, 0) + 1
+                return operator()
+            monkeypatch.setattr(qubit, operator_name, counting_operator)
+        rate = qubit.t2_effective(esys=esys, get_rate=True)
+        assert call_counts == {'d_hamiltonian_d_flux': 1, 'n_operator': 1}
+        scale_factors = [0.5 if channel.startswith('t1') else 1 for channel in qubit.effective_noise_channels()]
+        assert np.isclose(rate, np.dot(scale_factors, rates))
@@ -0,0 +1,49 @@
+# test_operators.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+import scqubits.core.operators as op
+from scqubits import Transmon
+
+
+def test_cached_operator_identity():
+    assert op.charge_number(5) is op.charge_number(5)
+    assert op.charge_number(5) is not op.charge_number(6)
+    assert op.identity(7, sparse_format='csc') is not op.identity(7)
+
+
+def test_cached_operator_read_only():
+    with pytest.raises(ValueError):
+        op.charge_shift(3)[0, 0] = 1.0
+    with pytest.raises(ValueError):
+        op.identity(4, sparse_format='csr').data[0] = 2.0
+
+
+def test_cached_operator_values():
+    ncut = 4
+    assert np.array_equal(op.charge_number(ncut), np.diag(np.arange(-ncut, ncut + 1)))
+    assert np.array_equal(op.charge_shift(ncut, offset=1), np.diag(np.ones(2 * ncut), k=1))
+    assert np.array_equal(op.charge_shift(ncut, sparse_format='csr').toarray(), np.diag(np.ones(2 * ncut), k=-1))
+    assert np.array_equal(op.identity(5, sparse_format='csc').toarray(), np.eye(5))
+
+
+def test_public_operators_are_writable_copies():
+    tmon = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=5)
+    n_op = tmon.n_operator()
+    n_op *= 2
+    assert n_op is not tmon.n_operator()
+    assert np.array_equal(tmon.n_operator(), op.charge_number(5))
+    exp_op = tmon.exp_i_phi_operator()
+    exp_op[0, 0] = 1.0
+    assert op.charge_shift(5)[0, 0] == 0.0
@@ -0,0 +1,85 @@
+# test_profiling.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import json
+import pickle
+
+import numpy as np
+
+import scqubits as scq
+import scqubits.settings as settings
+import scqubits.utils.profiling as profiling
+
+
+def sweep_example():
+    qbt = scq.Transmon(EJ=20.0, EC=0.3, ng=0.1, ncut=15, truncated_dim=3)
+    osc = scq.Oscillator(E_osc=6.0, truncated_dim=4)
+    hilbertspace = scq.HilbertSpace([qbt, osc])
+    hilbertspace.interaction_list = [
+        scq.InteractionTerm(g_strength=0.1, op1=qbt.n_operator(), subsys1=qbt,
+                            op2=osc.creation_operator() + osc.annihilation_operator(), subsys2=osc)
+    ]
+
+    def update_hilbertspace(param_val):
+        qbt.ng = param_val
+
+    autorun = settings.AUTORUN_SWEEP
+    settings.AUTORUN_SWEEP = False
+    sweep = scq.ParameterSweep(param_name='ng', param_vals=np.linspace(0.0, 0.5, 4), evals_count=6,
+                               hilbertspace=hilbertspace, subsys_update_list=[qbt],
+                               update_hilbertspace=update_hilbertspace)
+    settings.AUTORUN_SWEEP = autorun
+    return sweep
+
+
+def test_sweep_stages_recorded(tmp_path):
+    sweep = sweep_example()
+    with profiling.profile(track_memory=True) as profiler:
+        sweep.run()
+    report = profiler.report()
+    assert report['ParameterSweep.run']['calls'] == 1
+    assert report['bare eigensys: Transmon (subsys 0)']['calls'] == 4
+    assert report['dressed eigensys']['calls'] == 4
+    assert report['bare-dressed state mapping']['calls'] == 1
+    assert report['ParameterSweep.run']['total_time'] >= report['dressed spectra']['total_time']
+    assert report['ParameterSweep.run']['peak_memory'] >= report['dressed eigensys']['peak_memory'] > 0
+    assert 'dressed eigensys' in str(profiler)
+
+    filename = str(tmp_path / 'trace.json')
+    profiler.export_chrome_trace(filename)
+    with open(filename) as file:
+        trace = json.load(file)
+    assert len(trace['traceEvents']) == len(profiler.events)
+    assert all(event['ph'] == 'X' for event in trace['traceEvents'])
+
+
+def test_inactive_by_default():
+    sweep = sweep_example()
+    profiling.GLOBAL_PROFILER.reset()
+    sweep.run()
+    assert profiling.GLOBAL_PROFILER.events == []
+    settings.PROFILE = True
+    try:
+        sweep.run()
+    finally:
+        settings.PROFILE = False
+    assert profiling.GLOBAL_PROFILER.report()['ParameterSweep.run']['calls'] == 1
+    profiling.GLOBAL_PROFILER.reset()
+
+
+def test_profiler_state_is_picklable():
+    with profiling.profile() as profiler:
+        profiling.stage('stage')(lambda: None)()
+    restored = pickle.loads(pickle.dumps(profiler))
+    assert restored.report()['stage']['calls'] == 1
+    restored.reset()
+    assert isinstance(pickle.loads(pickle.dumps(profiling._thread_state)), profiling._ThreadState)
@@ -0,0 +1,56 @@
+# test_spectrum_utils.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import qutip as qt
+import scipy.sparse as sparse
+
+import scqubits.utils.spectrum_utils as spec_utils
+
+
+def random_operator_and_states(dim=40, states_count=5, seed=1):
+    random_generator = np.random.RandomState(seed)
+    operator = random_generator.standard_normal((dim, dim)) + 1j * random_generator.standard_normal((dim, dim))
+    operator = operator + operator.conj().T
+    states = random_generator.standard_normal((dim, states_count)) + 1j * random_generator.standard_normal(
+        (dim, states_count))
+    reference = np.asarray([[spec_utils.matrix_element(states[:, n], operator, states[:, m])
+                             for m in range(states_count)] for n in range(states_count)])
+    return operator, states, reference
+
+
+def test_matrixelement_table_operator_types():
+    operator, states, reference = random_operator_and_states()
+    assert np.allclose(spec_utils.get_matrixelement_table(operator, states), reference)
+    assert np.allclose(spec_utils.get_matrixelement_table(sparse.csr_matrix(operator), states), reference)
+    kets = [qt.Qobj(states[:, [n]]) for n in range(states.shape[1])]
+    assert np.allclose(spec_utils.get_matrixelement_table(qt.Qobj(operator), kets), reference)
+
+
+def test_matrixelement_table_subblock():
+    operator, states, reference = random_operator_and_states()
+    table = spec_utils.get_matrixelement_table(operator, states, row_indices=[0, 3], column_indices=[1, 2, 4])
+    assert np.allclose(table, reference[np.ix_([0, 3], [1, 2, 4])])
+
+
+def test_matrixelement_table_stack():
+    operator, states, reference = random_operator_and_states()
+    operator2, states2, _ = random_operator_and_states(seed=2)
+    state_tables = np.asarray([states, states2])
+    references = np.asarray([reference, spec_utils.get_matrixelement_table(operator, states2)])
+    assert np.allclose(spec_utils.get_matrixelement_table_stack(operator, state_tables), references)
+    assert np.allclose(spec_utils.get_matrixelement_table_stack(sparse.csr_matrix(operator), state_tables), references)
+    references[1] = spec_utils.get_matrixelement_table(operator2, states2)
+    assert np.allclose(spec_utils.get_matrixelement_table_stack([operator, operator2], state_tables), references)
+    sparse_operators = [sparse.csr_matrix(operator), sparse.csr_matrix(operator2)]
+    assert np.allclose(spec_utils.get_matrixelement_table_stack(sparse_operators, state_tables, column_indices=[0]),
+                       references[:, :, [0]])
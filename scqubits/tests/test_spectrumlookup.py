@@ -11,6 +11,7 @@
 ############################################################################
 
 import numpy as np
+import pytest
 
 import scqubits as qubit
 from scqubits.core.hilbert_space import HilbertSpace, InteractionTerm
@@ -348,3 +349,63 @@ class TestParameterSweep:
         )
         CPB1 = sweep.get_subsys(0)
         assert np.allclose(reference, sweep.lookup.bare_eigenstates(CPB1, 21))
+
+    def test_sweep_lookup_batch(self):
+        sweep = self.initialize()
+        lookup = sweep.lookup
+        bare_labels = np.asarray([[0, 0, 0], [1, 0, 0], [0, 1, 1], [2, 3, 3]])
+        param_indices = [0, 15, 299]
+        dressed_indices = lookup.dressed_index_batch(bare_labels)
+        energies = lookup.energy_bare_index_batch(bare_labels)
+        assert dressed_indices.shape == energies.shape == (300, 4)
+        for param_index in param_indices:
+            for label_index, labels in enumerate(bare_labels):
+                dressed_index = lookup.dressed_index(tuple(labels), param_index)
+                energy = lookup.energy_bare_index(tuple(labels), param_index)
+                if dressed_index is None:
+                    assert dressed_indices[param_index, label_index] == -1
+                    assert np.isnan(energies[param_index, label_index])
+                else:
+                    assert dressed_indices[param_index, label_index] == dressed_index
+                    assert energies[param_index, label_index] == energy
+                    assert lookup.bare_index(dressed_index, param_index) == tuple(labels)
+        assert np.array_equal(lookup.dressed_index_batch(bare_labels[1], param_indices),
+                              dressed_indices[param_indices, 1])
+        assert lookup.dressed_index((0, 0, 4)) is None
+        assert lookup.bare_index(20) is None
+
+    def test_sweep_continuation_labeling(self):
+        # transmon tuned through resonance with the resonator: avoided crossing of (1,0) and (0,1)
+        tmon = qubit.Transmon(EJ=10.0, EC=0.25, ng=0.0, ncut=30, truncated_dim=4)
+        resonator = qubit.Oscillator(E_osc=5.0, truncated_dim=4)
+        hilbertspace = HilbertSpace([tmon, resonator])
+        hilbertspace.interaction_list = [
+            InteractionTerm(g_strength=0.1, op1=tmon.n_operator(), subsys1=tmon,
+                            op2=resonator.creation_operator() + resonator.annihilation_operator(), subsys2=resonator)
+        ]
+
+        def update_hilbertspace(EJ):
+            tmon.EJ = EJ
+
+        bare_labels = [(1, 0), (0, 1)]
+        sweeps = {labeling_scheme: ParameterSweep('EJ', np.linspace(10.0, 20.0, 41), evals_count=12,
+                                                  hilbertspace=hilbertspace, subsys_update_list=[tmon],
+                                                  update_hilbertspace=update_hilbertspace,
+                                                  labeling_scheme=labeling_scheme)
+                  for labeling_scheme in ['overlap', 'continuation']}
+
+        # labels follow the adiabatic branches, i.e., the dressed states 1 and 2 throughout
+        dressed_indices = sweeps['continuation'].lookup.dressed_index_batch(bare_labels)
+        assert np.all(dressed_indices == [1, 2])
+        assert np.all(sweeps['continuation'].lookup._bare_positions >= 0)
+        # labeling by overlaps only swaps labels at the avoided crossing
+        dressed_indices = sweeps['overlap'].lookup.dressed_index_batch(bare_labels)
+        assert np.array_equal(dressed_indices[0], [1, 2]) and np.array_equal(dressed_indices[-1], [2, 1])
+
+        def update_not_expected(param_val):
+            raise AssertionError('invalid labeling_scheme must be rejected before computing the sweep')
+
+        with pytest.raises(ValueError):
+            ParameterSweep('EJ', np.linspace(10.0, 20.0, 3), evals_count=12, hilbertspace=hilbertspace,
+                           subsys_update_list=[tmon], update_hilbertspace=update_not_expected,
+                           labeling_scheme='adiabatic')
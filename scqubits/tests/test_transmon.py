@@ -32,3 +32,29 @@ class TestTransmon(StandardTests):
     def test_plot_n_wavefunction(self):
         self.qbt = Transmon(EJ=1.0, EC=1.0, ng=0.0, ncut=10)
         self.qbt.plot_n_wavefunction(esys=None, which=1, mode='real')
+
+    def test_update_wavefunction_plot(self):
+        self.qbt = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=20, truncated_dim=4)
+        handle = self.qbt.update_wavefunction_plot()
+        ydata = np.copy(handle.wavefunc_line.get_ydata())
+        self.qbt.EJ = 30.0
+        assert self.qbt.update_wavefunction_plot(handle) is handle
+        assert not np.allclose(ydata, handle.wavefunc_line.get_ydata())
+
+    def test_live_plot_job_uses_snapshot(self):
+        self.qbt = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=20, truncated_dim=4)
+        compute = self.qbt._live_plot_job()
+        self.qbt.EJ = 30.0
+        handle = compute()(None)
+        self.qbt.EJ = 20.0
+        assert np.allclose(handle.wavefunc_line.get_ydata(),
+                           self.qbt.update_wavefunction_plot().wavefunc_line.get_ydata())
+
+    def test_copy_with(self):
+        self.qbt = Transmon(EJ=20.0, EC=0.3, ng=0.2, ncut=20, truncated_dim=4)
+        qbt_copy = self.qbt.copy_with(ng=0.4)
+        assert self.qbt.ng == 0.2
+        assert qbt_copy.get_initdata() == dict(self.qbt.get_initdata(), ng=0.4)
+        assert np.allclose(qbt_copy.eigenvals(evals_count=4), Transmon(EJ=20.0, EC=0.3, ng=0.4, ncut=20).eigenvals(evals_count=4))
+        with pytest.raises(TypeError):
+            self.qbt.copy_with(EJ1=1.0)
@@ -18,21 +18,135 @@ else:
     _HAS_IPYWIDGETS = True
 
 try:
-    from IPython.display import display
+    from IPython.display import clear_output, display
 except ImportError:
     _HAS_IPYTHON = False
 else:
     _HAS_IPYTHON = True
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+
 import scqubits.utils.misc as utils
 import scqubits.core.units as units
 import scqubits.settings as settings
 
 
+def _running_loop():
+    """Returns the running asyncio event loop of the current thread, or None."""
+    if hasattr(asyncio, 'get_running_loop'):
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+    try:   # Python 3.6
+        loop = asyncio.get_event_loop()
+    except RuntimeError:   # no event loop set in this thread
+        return None
+    return loop if loop.is_running() else None
+
+
+class Debouncer:
+    """
+    Wraps `func` such that a rapid succession of calls results in a single call of `func`, issued once no further
+    call has occurred for `wait_time` seconds. Calls are scheduled on the running asyncio event loop (as in a jupyter
+    kernel); without a running event loop, `func` is called immediately.
+
+    Parameters
+    ----------
+    func: callable
+    wait_time: float
+        waiting time in seconds
+    """
+    def __init__(self, func, wait_time):
+        self.func = func
+        self.wait_time = wait_time
+        self._pending = None
+
+    def __call__(self, *args, **kwargs):
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        loop = _running_loop()
+        if self.wait_time <= 0 or loop is None:
+            self.func(*args, **kwargs)
+            return
+        self._pending = loop.call_later(self.wait_time, lambda: self.func(*args, **kwargs))
+
+
+class LatestJobExecutor:
+    """
+    Runs jobs on a single background worker thread, such that only the most recently submitted job matters: submitting
+    a job cancels the pending job (if it has not started yet), and results of superseded jobs are discarded. Results
+    are handed to the `on_result` callback on the asyncio event loop of the submitting thread (as in a jupyter kernel),
+    so that e.g. plotting remains on the main thread. Without a running event loop, jobs are run synchronously.
+    """
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._lock = threading.Lock()
+        self._job_id = 0
+        self._future = None
+
+    def submit(self, job, on_result, on_error=None):
+        """
+        Parameters
+        ----------
+        job: callable
+            function without arguments, executed in the worker thread
+        on_result: callable
+            signature `on_result(result)`, called with the return value of `job` unless superseded
+        on_error: callable, optional
+            signature `on_error(exception)`, called if `job` raised an exception; if None, the exception is re-raised
+            on the event loop
+        """
+        loop = _running_loop()
+        with self._lock:
+            self._job_id += 1
+            job_id = self._job_id
+            if self._future is not None:
+                self._future.cancel()   # no effect if already running; its result is discarded below
+            if loop is None:
+                self._future = None
+        if loop is None:
+            on_result(job())
+            return
+
+        future = self._executor.submit(job)
+        with self._lock:
+            self._future = future
+
+        def job_done(done_future):
+            if not done_future.cancelled() and self.is_latest(job_id):
+                loop.call_soon_threadsafe(self._deliver, job_id, done_future, on_result, on_error)
+
+        future.add_done_callback(job_done)
+
+    def is_latest(self, job_id):
+        with self._lock:
+            return job_id == self._job_id
+
+    def _deliver(self, job_id, future, on_result, on_error):
+        if not self.is_latest(job_id):   # superseded while waiting for the event loop
+            return
+        exception = future.exception()
+        if exception is None:
+            on_result(future.result())
+        elif on_error is None:
+            raise exception
+        else:
+            on_error(exception)
+
+
 @utils.Required(ipywidgets=_HAS_IPYWIDGETS, IPython=_HAS_IPYTHON)
-def create_widget(callback_func, init_params, image_filename=None):
+def create_widget(callback_func, init_params, image_filename=None, plot_func=None):
     """
-    Displays ipywidgets for initialization of a QuantumSystem object.
+    Displays ipywidgets for initialization of a QuantumSystem object. Rapid successive changes of widget values are
+    debounced (see `settings.WIDGET_DEBOUNCE_TIME`). New values are passed to `callback_func` on the main thread, the
+    plot data are computed in a background thread; work for outdated values is cancelled or discarded, and only
+    results for the latest values are displayed.
 
     Parameters
     ----------
@@ -43,6 +157,12 @@ def create_widget(callback_func, init_params, image_filename=None):
         names and values of initialization parameters
     image_filename: str, optional
         file name for circuit image to be displayed alongside the qubit
+    plot_func: function, optional
+        called without arguments after `callback_func` (on the main thread); returns a function `compute()`, which is
+        called in the background thread and must not access objects that may be changed in the meantime (typically, it
+        operates on a copy of the qubit). `compute()` returns a function `render(handle)`, which is called on the main
+        thread with the `PlotHandle` returned by the previous call to `render` (None upon first call), and which is
+        expected to update that plot in place and return it
     Returns
     -------
 
@@ -73,5 +193,40 @@ def create_widget(callback_func, init_params, image_filename=None):
     else:
         ui_widget = ipywidgets.VBox(box_list)
 
-    out = ipywidgets.interactive_output(callback_func, widgets)
+    out = ipywidgets.Output()
+    plot_handle = None
+    executor = LatestJobExecutor()
+
+    def show(render):
+        nonlocal plot_handle
+        if render is None:
+            return
+        new_handle = render(plot_handle)
+        if new_handle is not plot_handle:
+            plt.close(new_handle.figure)   # figure is displayed and refreshed through the output widget only
+            plot_handle = new_handle
+        with out:
+            clear_output(wait=True)
+            display(plot_handle.figure)
+
+    def show_error(exception):
+        with out:
+            clear_output(wait=True)
+            print('{}: {}'.format(type(exception).__name__, exception))
+
+    def update(*args):
+        values = {name: widget.value for name, widget in widgets.items()}
+        try:
+            callback_func(**values)
+            compute = plot_func() if plot_func is not None else None
+        except Exception as exception:
+            show_error(exception)
+            return
+        if compute is not None:
+            executor.submit(compute, show, on_error=show_error)
+
+    debounced_update = Debouncer(update, settings.WIDGET_DEBOUNCE_TIME)
+    for widget in widgets.values():
+        widget.observe(debounced_update, 'value')
+    update()
     display(ui_widget, out)
@@ -0,0 +1,493 @@
+# eigensolvers.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Solvers for the lowest eigenvalues (and eigenvectors) of Hermitian matrices, and the automatic selection among them
+based on the matrix dimension, bandwidth and sparsity and on the number of eigenvalues requested. Available solvers:
+
+* 'dense':        `scipy.linalg.eigh` restricted to the lowest eigenvalues (`subset_by_index`, driver='evr')
+* 'tridiagonal':  `scipy.linalg.eigh_tridiagonal`, for real tridiagonal matrices
+* 'banded':       `scipy.linalg.eig_banded`, for matrices with small bandwidth (only advantageous when eigenvectors
+  are not needed)
+* 'sparse':       `scipy.sparse.linalg.eigsh` in shift-invert mode
+* 'lobpcg':       `scipy.sparse.linalg.lobpcg` with Jacobi preconditioner, avoids the factorization needed in
+  shift-invert mode
+
+The crossover points used by `choose_solver` are stored in `THRESHOLDS`; `calibrate()` measures them on the current
+machine. Eigenstates inside the spectrum are obtained by `eigensys_near` and `eigensys_for_basis_states`. Matrices conserving a
+quantum number (see `conserved_blocks`) are diagonalized block by block with `blockwise_eigensys`.
+"""
+
+import functools
+import inspect
+import time
+import warnings
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse.linalg
+from scipy import sparse
+
+import scqubits.utils.spectrum_utils as spec_utils
+from scqubits.utils.cpu_switch import get_map_method
+
+SOLVERS = ('dense', 'tridiagonal', 'banded', 'sparse', 'lobpcg')
+
+# crossover points for the automatic solver selection (see `choose_solver`)
+THRESHOLDS = {
+    # minimum dimension for which iterative sparse solvers are used
+    'sparse_min_dim': 400,
+    # maximum fraction of nonzero matrix elements for which iterative sparse solvers are used
+    'sparse_max_density': 0.05,
+    # maximum ratio evals_count / dimension for which iterative sparse solvers are used
+    'sparse_max_evals_fraction': 0.1,
+    # maximum ratio bandwidth / dimension for which the banded solver is used (eigenvalues only)
+    'banded_max_bandwidth_fraction': 0.05,
+    # minimum dimension for which 'lobpcg' replaces 'sparse'; None: 'lobpcg' is only used when requested explicitly
+    'lobpcg_min_dim': None,
+}
+
+
+def bandwidth(matrix):
+    """Returns the bandwidth of a Hermitian matrix, i.e., the largest distance of a nonzero upper-triangle element
+    from the main diagonal.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+
+    Returns
+    -------
+    int
+    """
+    if sparse.issparse(matrix):
+        matrix = sparse.triu(matrix, format='coo')
+        nonzero = matrix.data != 0
+        return int(np.max(matrix.col[nonzero] - matrix.row[nonzero], initial=0))
+    for offset in range(matrix.shape[0] - 1, 0, -1):   # full matrices are identified upon the first check
+        if np.any(np.diagonal(matrix, offset)):
+            return offset
+    return 0
+
+
+def density(matrix):
+    """Returns the fraction of nonzero matrix elements.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+
+    Returns
+    -------
+    float
+    """
+    nonzero_count = matrix.count_nonzero() if sparse.issparse(matrix) else np.count_nonzero(matrix)
+    return nonzero_count / (matrix.shape[0] * matrix.shape[1])
+
+
+def choose_solver(matrix, evals_count, return_eigenvectors=True):
+    """Selects the solver for the lowest `evals_count` eigenvalues of `matrix`, based on the crossover points stored
+    in `THRESHOLDS`.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix
+    evals_count: int
+        number of desired eigenvalues
+    return_eigenvectors: bool, optional
+        whether eigenvectors are calculated as well (default value = True)
+
+    Returns
+    -------
+    str
+        name of the solver, one of `SOLVERS`
+    """
+    dim = matrix.shape[0]
+    matrix_bandwidth = bandwidth(matrix)
+    if matrix_bandwidth <= 1 and not np.iscomplexobj(matrix):
+        return 'tridiagonal'
+    if (dim >= THRESHOLDS['sparse_min_dim'] and evals_count <= THRESHOLDS['sparse_max_evals_fraction'] * dim
+            and density(matrix) <= THRESHOLDS['sparse_max_density']):
+        lobpcg_min_dim = THRESHOLDS['lobpcg_min_dim']
+        if lobpcg_min_dim is not None and dim >= lobpcg_min_dim:
+            return 'lobpcg'
+        return 'sparse'
+    if not return_eigenvectors and matrix_bandwidth <= THRESHOLDS['banded_max_bandwidth_fraction'] * dim:
+        return 'banded'
+    return 'dense'
+
+
+def lowest_eigenvals(matrix, evals_count, solver=None):
+    """Calculates the lowest eigenvalues of a Hermitian matrix.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix
+    evals_count: int
+        number of desired eigenvalues
+    solver: str or None, optional
+        one of `SOLVERS`; None selects the solver with `choose_solver` (default value = None)
+
+    Returns
+    -------
+    ndarray
+        eigenvalues in ascending order
+    """
+    return _solve(matrix, evals_count, solver, return_eigenvectors=False)
+
+
+def lowest_eigensys(matrix, evals_count, solver=None):
+    """Calculates the lowest eigenvalues and corresponding eigenvectors of a Hermitian matrix.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix
+    evals_count: int
+        number of desired eigenvalues
+    solver: str or None, optional
+        one of `SOLVERS`; None selects the solver with `choose_solver` (default value = None)
+
+    Returns
+    -------
+    ndarray, ndarray
+        eigenvalues in ascending order, eigenvectors as columns (`evecs[:, 0]` is the first eigenvector etc.)
+    """
+    return _solve(matrix, evals_count, solver, return_eigenvectors=True)
+
+
+def eigensys_near(matrix, sigma, evals_count):
+    """Calculates the eigenvalues closest to `sigma` and the corresponding eigenvectors of a Hermitian matrix. Large
+    sparse matrices are treated with `eigsh` in shift-invert mode, so that eigenvalues deep inside the spectrum are
+    obtained without calculating all eigenvalues below.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix
+    sigma: float
+        energy around which eigenvalues are sought
+    evals_count: int
+        number of desired eigenvalues
+
+    Returns
+    -------
+    ndarray, ndarray
+        eigenvalues in ascending order, eigenvectors as columns
+    """
+    dim = matrix.shape[0]
+    if not sparse.issparse(matrix) or dim < THRESHOLDS['sparse_min_dim'] or evals_count >= dim - 1:
+        evals, evecs = scipy.linalg.eigh(matrix.toarray() if sparse.issparse(matrix) else matrix)
+        selected = np.sort(np.argsort(np.abs(evals - sigma), kind='stable')[:evals_count])
+        return evals[selected], evecs[:, selected]
+    matrix = sparse.csc_matrix(matrix)
+    try:
+        evals, evecs = scipy.sparse.linalg.eigsh(matrix, k=evals_count, sigma=sigma, which='LM')
+    except RuntimeError:    # matrix - sigma is exactly singular: sigma coincides with an eigenvalue
+        sigma += 1e-9 * max(1.0, abs(sigma))
+        evals, evecs = scipy.sparse.linalg.eigsh(matrix, k=evals_count, sigma=sigma, which='LM')
+    return spec_utils.order_eigensystem(evals, evecs)
+
+
+def eigensys_for_basis_states(matrix, basis_indices, candidates_count=3):
+    """For each of the given basis states, finds the eigenstate of a Hermitian matrix with the largest overlap. The
+    candidates for basis state `i` are the `candidates_count` eigenstates with eigenvalues closest to the diagonal
+    element `matrix[i, i]` (see `eigensys_near`). Only these eigenstates are calculated for large sparse matrices.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix
+    basis_indices: list of int
+        indices of the basis states
+    candidates_count: int, optional
+        number of eigenstates considered per basis state (default value = 3)
+
+    Returns
+    -------
+    ndarray, ndarray
+        eigenvalues and eigenvectors (as columns), one per entry of `basis_indices` and in the same order
+    """
+    basis_indices = np.asarray(basis_indices, dtype=np.int_)
+    dim = matrix.shape[0]
+    if not sparse.issparse(matrix) or dim < THRESHOLDS['sparse_min_dim']:
+        # all eigenstates are obtained at once
+        evals, evecs = scipy.linalg.eigh(matrix.toarray() if sparse.issparse(matrix) else matrix)
+        selected = np.argmax(np.abs(evecs[basis_indices, :]), axis=1)
+        return evals[selected], evecs[:, selected]
+    diagonal = matrix.diagonal().real
+    selected_evals = np.empty(len(basis_indices), dtype=np.float_)
+    selected_evecs = np.empty((dim, len(basis_indices)), dtype=np.result_type(matrix.dtype, np.float_))
+    for position, basis_index in enumerate(basis_indices):
+        evals, evecs = eigensys_near(matrix, diagonal[basis_index], min(candidates_count, dim - 2))
+        selected = np.argmax(np.abs(evecs[basis_index, :]))
+        selected_evals[position] = evals[selected]
+        selected_evecs[:, position] = evecs[:, selected]
+    return selected_evals, selected_evecs
+
+
+def conserved_blocks(matrix, quantum_numbers, rtol=1e-12):
+    """Checks whether a Hermitian matrix conserves the given quantum numbers of the basis states, i.e., has no
+    nonzero matrix elements between basis states with different quantum numbers, and if so returns the blocks of basis
+    states sharing the same quantum number.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix
+    quantum_numbers: ndarray
+        quantum number of each basis state
+    rtol: float, optional
+        matrix elements smaller than `rtol` times the largest matrix element (in magnitude) are regarded as zero
+        (default value = 1e-12)
+
+    Returns
+    -------
+    list of ndarray or None
+        basis indices belonging to each block, with blocks ordered by increasing quantum number; None if the matrix
+        couples basis states with different quantum numbers
+    """
+    matrix = sparse.coo_matrix(matrix)
+    quantum_numbers = np.asarray(quantum_numbers)
+    magnitudes = np.abs(matrix.data)
+    significant = magnitudes > rtol * np.max(magnitudes, initial=0.0)
+    if np.any(quantum_numbers[matrix.row[significant]] != quantum_numbers[matrix.col[significant]]):
+        return None
+    _, block_indices = np.unique(quantum_numbers, return_inverse=True)
+    ordering = np.argsort(block_indices, kind='stable')
+    return np.split(ordering, np.flatnonzero(np.diff(block_indices[ordering])) + 1)
+
+
+def _block_eigensys(block_matrix, evals_count, return_eigenvectors):
+    return _solve(block_matrix, min(evals_count, block_matrix.shape[0]), None, return_eigenvectors)
+
+
+def blockwise_eigensys(matrix, blocks, evals_count, return_eigenvectors=True, num_cpus=1):
+    """Calculates the lowest eigenvalues (and eigenvectors) of a block-diagonal Hermitian matrix by diagonalizing the
+    blocks independently (see `conserved_blocks`). The cost scales with the sum of the cubed block dimensions instead
+    of the cubed matrix dimension.
+
+    Parameters
+    ----------
+    matrix: ndarray or scipy sparse matrix
+        Hermitian matrix, block diagonal with respect to `blocks`
+    blocks: list of ndarray
+        basis indices belonging to each block
+    evals_count: int
+        number of desired eigenvalues
+    return_eigenvectors: bool, optional
+        (default value = True)
+    num_cpus: int, optional
+        number of cores among which the blocks are distributed (default value = 1)
+
+    Returns
+    -------
+    ndarray or (ndarray, ndarray)
+        eigenvalues in ascending order [, eigenvectors as columns]
+    """
+    matrix = sparse.csr_matrix(matrix)
+    block_matrices = [matrix[block][:, block].toarray() for block in blocks]
+    target_map = get_map_method(num_cpus)
+    func = functools.partial(_block_eigensys, evals_count=evals_count, return_eigenvectors=return_eigenvectors)
+    results = list(target_map(func, block_matrices))
+    if not return_eigenvectors:
+        return np.sort(np.concatenate(results))[:evals_count]
+
+    evals = np.concatenate([block_evals for block_evals, _ in results])
+    block_ids = np.concatenate([np.full(len(block_evals), index) for index, (block_evals, _) in enumerate(results)])
+    block_columns = np.concatenate([np.arange(len(block_evals)) for block_evals, _ in results])
+    selected = np.argsort(evals, kind='stable')[:evals_count]
+    # only the selected eigenvectors are embedded into the full space, avoiding a (possibly dimension-squared) array
+    # holding the eigenvectors of all blocks
+    evecs = np.zeros((matrix.shape[0], len(selected)), dtype=np.result_type(matrix.dtype, np.float_))
+    for index, (block, (_, block_evecs)) in enumerate(zip(blocks, results)):
+        columns = np.flatnonzero(block_ids[selected] == index)
+        if len(columns) > 0:
+            evecs[np.ix_(block, columns)] = block_evecs[:, block_columns[selected[columns]]]
+    return evals[selected], evecs
+
+
+def _solve(matrix, evals_count, solver, return_eigenvectors):
+    if solver is None:
+        solver = choose_solver(matrix, evals_count, return_eigenvectors)
+    elif solver not in SOLVERS:
+        raise ValueError("Unknown eigensolver '{}'. Supported choices: {}.".format(solver, SOLVERS))
+    elif solver == 'tridiagonal' and (np.iscomplexobj(matrix) or bandwidth(matrix) > 1):
+        raise ValueError("The 'tridiagonal' eigensolver requires a real tridiagonal matrix.")
+    if solver in ('sparse', 'lobpcg') and evals_count >= matrix.shape[0] - 1:
+        solver = 'dense'    # iterative solvers require evals_count < dimension - 1
+    if solver not in ('sparse', 'lobpcg') and sparse.issparse(matrix):
+        matrix = matrix.toarray()
+    result = _SOLVER_FUNCTIONS[solver](matrix, evals_count, return_eigenvectors)
+    if return_eigenvectors:
+        evals, evecs = result
+        if solver in ('sparse', 'lobpcg'):
+            evals, evecs = spec_utils.order_eigensystem(evals, evecs)
+        return evals, evecs
+    return np.sort(result)
+
+
+# `subset_by_index` and `driver` of `scipy.linalg.eigh` require scipy >= 1.5; earlier versions take `eigvals`
+_EIGH_HAS_SUBSET_BY_INDEX = 'subset_by_index' in inspect.signature(scipy.linalg.eigh).parameters
+
+
+def _dense(matrix, evals_count, return_eigenvectors):
+    if _EIGH_HAS_SUBSET_BY_INDEX:
+        return scipy.linalg.eigh(matrix, eigvals_only=not return_eigenvectors, subset_by_index=(0, evals_count - 1),
+                                 driver='evr')
+    return scipy.linalg.eigh(matrix, eigvals_only=not return_eigenvectors, eigvals=(0, evals_count - 1))
+
+
+def _tridiagonal(matrix, evals_count, return_eigenvectors):
+    return scipy.linalg.eigh_tridiagonal(np.diagonal(matrix).real, np.diagonal(matrix, 1).real,
+                                         eigvals_only=not return_eigenvectors, select='i',
+                                         select_range=(0, evals_count - 1))
+
+
+def _banded(matrix, evals_count, return_eigenvectors):
+    matrix_bandwidth = max(bandwidth(matrix), 1)
+    dim = matrix.shape[0]
+    banded_matrix = np.zeros((matrix_bandwidth + 1, dim), dtype=matrix.dtype)   # upper form, see `eig_banded`
+    for offset in range(matrix_bandwidth + 1):
+        banded_matrix[matrix_bandwidth - offset, offset:] = np.diagonal(matrix, offset)
+    return scipy.linalg.eig_banded(banded_matrix, eigvals_only=not return_eigenvectors, select='i',
+                                   select_range=(0, evals_count - 1))
+
+
+def _sparse(matrix, evals_count, return_eigenvectors):
+    return spec_utils.sparse_lowest_eigsh(matrix, evals_count, return_eigenvectors=return_eigenvectors)
+
+
+def _lobpcg(matrix, evals_count, return_eigenvectors):
+    matrix = sparse.csr_matrix(matrix)
+    dim = matrix.shape[0]
+    if dim < 5 * evals_count:    # lobpcg is not suited for small matrices
+        return _dense(matrix.toarray(), evals_count, return_eigenvectors)
+    diag_elements = matrix.diagonal().real
+    shift = np.min(diag_elements - (np.asarray(abs(matrix).sum(axis=1)).ravel() - np.abs(diag_elements)))
+    preconditioner = sparse.diags(1.0 / (diag_elements - shift + 1.0))
+    random_generator = np.random.RandomState(seed=0)    # deterministic starting vectors
+    initial_vecs = random_generator.standard_normal((dim, evals_count))
+    if np.iscomplexobj(matrix):
+        initial_vecs = initial_vecs + 1j * random_generator.standard_normal((dim, evals_count))
+    evals, evecs = scipy.sparse.linalg.lobpcg(matrix, initial_vecs, M=preconditioner, largest=False, tol=1e-7,
+                                              maxiter=max(500, 20 * evals_count))
+    if return_eigenvectors:
+        return evals, evecs
+    return evals
+
+
+_SOLVER_FUNCTIONS = {
+    'dense': _dense,
+    'tridiagonal': _tridiagonal,
+    'banded': _banded,
+    'sparse': _sparse,
+    'lobpcg': _lobpcg
+}
+
+
+# —Calibration——————————————————————————————————————————————————————————————————————————————————————————————————————————
+
+def _grid_hamiltonian(dim):
+    """Returns a Hermitian test matrix of approximately dimension `dim`: the 2d finite-difference Hamiltonian of a
+    particle in a cosine potential, with the same sparsity structure as grid-based qubit Hamiltonians."""
+    side = int(round(np.sqrt(dim)))
+    grid = np.linspace(-np.pi, np.pi, side)
+    laplacian = sparse.diags([np.ones(side - 1), -2 * np.ones(side), np.ones(side - 1)], [-1, 0, 1])
+    identity = sparse.identity(side)
+    kinetic = -(sparse.kron(laplacian, identity) + sparse.kron(identity, laplacian)) / (grid[1] - grid[0])**2
+    potential = -10.0 * np.add.outer(np.cos(grid), np.cos(2 * grid)).ravel()
+    return sparse.csr_matrix(kinetic + sparse.diags(potential))
+
+
+def _banded_hamiltonian(dim, matrix_bandwidth):
+    """Returns a random real symmetric test matrix with given bandwidth."""
+    random_generator = np.random.RandomState(seed=0)
+    matrix = np.diag(np.arange(dim, dtype=np.float_))
+    for offset in range(1, matrix_bandwidth + 1):
+        diagonal = random_generator.standard_normal(dim - offset)
+        matrix += np.diag(diagonal, offset) + np.diag(diagonal, -offset)
+    return matrix
+
+
+def _best_time(func, repeats):
+    best_time = np.inf
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+def calibrate(dims=(100, 200, 400, 800, 1600, 3200), banded_dim=600,
+              bandwidth_fractions=(0.01, 0.02, 0.05, 0.1, 0.2), evals_count=6, repeats=3, update=True):
+    """Measures the crossover points between solvers on the current machine, by timing the calculation of the lowest
+    eigenpairs of test matrices of various dimensions and bandwidths.
+
+    Parameters
+    ----------
+    dims: tuple of int, optional
+        matrix dimensions at which dense and sparse solvers are compared
+    banded_dim: int, optional
+        matrix dimension at which banded and dense solvers are compared
+    bandwidth_fractions: tuple of float, optional
+        ratios bandwidth / dimension at which banded and dense solvers are compared (eigenvalues only)
+    evals_count: int, optional
+        number of eigenpairs calculated (default value = 6)
+    repeats: int, optional
+        each timing is the best of `repeats` runs (default value = 3)
+    update: bool, optional
+        if set to True, `THRESHOLDS` is updated with the measured crossover points (default value = True)
+
+    Returns
+    -------
+    dict
+        crossover points (same keys as `THRESHOLDS`), and the measured timings in seconds under key 'timings'
+    """
+    timings = {'dims': list(dims), 'dense': [], 'sparse': [], 'lobpcg': [],
+               'bandwidth_fractions': list(bandwidth_fractions), 'banded': [], 'banded_dense': []}
+    for dim in dims:
+        matrix = _grid_hamiltonian(dim)
+        dense_matrix = matrix.toarray()
+        timings['dense'].append(_best_time(lambda: _dense(dense_matrix, evals_count, True), repeats))
+        timings['sparse'].append(_best_time(lambda: _sparse(matrix, evals_count, True), repeats))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')     # convergence warnings of lobpcg
+            timings['lobpcg'].append(_best_time(lambda: _lobpcg(matrix, evals_count, True), repeats))
+
+    sparse_min_dim = None   # smallest dimension above which the sparse solver is consistently faster
+    for index in reversed(range(len(dims))):
+        if timings['sparse'][index] >= timings['dense'][index]:
+            break
+        sparse_min_dim = dims[index]
+    lobpcg_min_dim = None
+    for index in reversed(range(len(dims))):
+        if timings['lobpcg'][index] >= timings['sparse'][index]:
+            break
+        lobpcg_min_dim = dims[index]
+
+    banded_max_bandwidth_fraction = 0.0
+    for fraction in bandwidth_fractions:
+        matrix = _banded_hamiltonian(banded_dim, max(2, int(fraction * banded_dim)))
+        timings['banded'].append(_best_time(lambda: _banded(matrix, evals_count, False), repeats))
+        timings['banded_dense'].append(_best_time(lambda: _dense(matrix, evals_count, False), repeats))
+        if timings['banded'][-1] >= timings['banded_dense'][-1]:
+            break
+        banded_max_bandwidth_fraction = fraction
+
+    thresholds = {'sparse_min_dim': sparse_min_dim if sparse_min_dim is not None else np.inf,
+                  'banded_max_bandwidth_fraction': banded_max_bandwidth_fraction,
+                  'lobpcg_min_dim': lobpcg_min_dim}
+    if update:
+        THRESHOLDS.update(thresholds)
+    thresholds['timings'] = timings
+    return thresholds
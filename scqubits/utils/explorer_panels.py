@@ -9,46 +9,141 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import numpy as np
+
+import scqubits.core.storage as storage
 import scqubits.core.units as units
 import scqubits.settings as settings
+import scqubits.utils.plot_defaults as defaults
 import scqubits.utils.sweep_plotting as splot
 
 
+# The display_... functions draw a single explorer panel and return the plot elements needed to update the panel via
+# the corresponding update_... functions, without redrawing the panel.
+
+
+def update_marker(marker_line, param_val):
+    """Moves the vertical line marking the current parameter value."""
+    marker_line.set_xdata([param_val, param_val])
+
+
 def display_bare_spectrum(sweep, subsys, param_val, fig_ax):
     title = 'bare spectrum: subsystem {} ({})'.format(sweep.get_subsys_index(subsys), subsys._sys_type)
     __ = splot.bare_spectrum(sweep, subsys, title=title, fig_ax=fig_ax)
     _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
+    return axes.axvline(param_val, color='gray', linestyle=':')
 
 
-def display_bare_wavefunctions(sweep, subsys, param_val, fig_ax):
-    title = 'wavefunctions: subsystem {} ({})'.format(sweep.get_subsys_index(subsys), subsys._sys_type)
-    __ = splot.bare_wavefunction(sweep, param_val, subsys, title=title, fig_ax=fig_ax)
+def _wavefunction_curves(wavefunc_data, param_index):
+    energies = wavefunc_data['energy_table'][param_index]
+    scale = 0.75 * (energies[-1] - energies[0]) / len(energies)
+    return energies, energies[:, np.newaxis] + scale * wavefunc_data['amplitude_table'][param_index]
 
 
-def display_dressed_spectrum(sweep, initial_bare, final_bare, energy_initial, energy_final, param_val, fig_ax):
+def _fill_wavefunctions(axes, phi_vals, energies, curves):
+    return [axes.fill_between(phi_vals, curve, energy, where=(curve != energy), interpolate=True)
+            for energy, curve in zip(energies, curves)]
+
+
+def display_bare_wavefunctions_data(wavefunc_data, qbt_index_subsys, param_index, fig_ax):
+    """Draws bare wavefunctions from pre-calculated data (see `Explorer`), mirroring `plot_wavefunction` in
+    'real' mode."""
+    qbt_index, qbt_subsys = qbt_index_subsys
+    _, axes = fig_ax
+    phi_vals = wavefunc_data['phi_vals']
+    energies, curves = _wavefunction_curves(wavefunc_data, param_index)
+
+    potential_line, = axes.plot(phi_vals, wavefunc_data['potential_table'][param_index], color='gray')
+    wavefunc_lines = [axes.plot(phi_vals, curve)[0] for curve in curves]
+    fills = _fill_wavefunctions(axes, phi_vals, energies, curves)
+
+    axes.set_title('wavefunctions: subsystem {} ({})'.format(qbt_index, qbt_subsys._sys_type))
+    options = qbt_subsys.wavefunction1d_defaults('real', energies, len(energies))
+    axes.set_xlabel(options['xlabel'])
+    axes.set_ylabel(options['ylabel'])
+    if wavefunc_data['ylim_list'][param_index] is not None:
+        axes.set_ylim(wavefunc_data['ylim_list'][param_index])
+    return {'axes': axes, 'potential': potential_line, 'wavefunctions': wavefunc_lines, 'fills': fills}
+
+
+def update_bare_wavefunctions(handles, wavefunc_data, param_index):
+    energies, curves = _wavefunction_curves(wavefunc_data, param_index)
+    handles['potential'].set_ydata(wavefunc_data['potential_table'][param_index])
+    for line, curve in zip(handles['wavefunctions'], curves):
+        line.set_ydata(curve)
+    for fill in handles['fills']:   # PolyCollections cannot be reshaped in place
+        fill.remove()
+    handles['fills'] = _fill_wavefunctions(handles['axes'], wavefunc_data['phi_vals'], energies, curves)
+    if wavefunc_data['ylim_list'][param_index] is not None:
+        handles['axes'].set_ylim(wavefunc_data['ylim_list'][param_index])
+
+
+def _dressed_spectrum_title(initial_bare, final_bare, energy_initial, energy_final):
     energy_difference = energy_final - energy_initial
-    title = r'{} $\rightarrow$ {}: {:.4f} {}'.format(initial_bare, final_bare, energy_difference,
-                                                     units.get_units())
+    return r'{} $\rightarrow$ {}: {:.4f} {}'.format(initial_bare, final_bare, energy_difference, units.get_units())
+
+
+def display_dressed_spectrum(sweep, initial_bare, final_bare, energy_initial, energy_final, param_val, fig_ax):
+    title = _dressed_spectrum_title(initial_bare, final_bare, energy_initial, energy_final)
     __ = splot.dressed_spectrum(sweep, title=title, fig_ax=fig_ax)
     _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
-    axes.scatter([param_val] * 2, [energy_initial, energy_final], s=40, c='gray')
+    marker_line = axes.axvline(param_val, color='gray', linestyle=':')
+    marker_points = axes.scatter([param_val] * 2, [energy_initial, energy_final], s=40, c='gray')
+    return {'axes': axes, 'marker_line': marker_line, 'marker_points': marker_points}
+
+
+def update_dressed_spectrum(handles, initial_bare, final_bare, energy_initial, energy_final, param_val):
+    handles['axes'].set_title(_dressed_spectrum_title(initial_bare, final_bare, energy_initial, energy_final))
+    update_marker(handles['marker_line'], param_val)
+    handles['marker_points'].set_offsets([[param_val, energy_initial], [param_val, energy_final]])
 
 
-def display_n_photon_qubit_transitions(sweep, photonnumber, initial_bare, param_val, fig_ax):
-    title = r'{}-photon qubit transitions, {} $\rightarrow$'.format(photonnumber, initial_bare)
-    __ = splot.n_photon_qubit_spectrum(sweep, photonnumber, initial_state_labels=initial_bare,
-                                       title=title, fig_ax=fig_ax)
+def _n_photon_title(photonnumber, initial_bare):
+    return r'{}-photon qubit transitions, {} $\rightarrow$'.format(photonnumber, initial_bare)
+
+
+def display_n_photon_qubit_transitions(sweep, photonnumber, initial_bare, param_val, fig_ax, transitions_data=None):
+    """Draws the n-photon qubit transitions panel. If `transitions_data` = (target labels, transition energies for a
+    single photon) is provided, it is used instead of generating the transition data from the sweep."""
+    title = _n_photon_title(photonnumber, initial_bare)
     _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
+    if transitions_data is None:
+        __ = splot.n_photon_qubit_spectrum(sweep, photonnumber, initial_state_labels=initial_bare,
+                                           title=title, fig_ax=fig_ax)
+    else:
+        label_list, energy_table = transitions_data
+        specdata = storage.SpectrumData(energy_table / photonnumber, sweep.system_params, sweep.param_name,
+                                        sweep.param_vals)
+        __ = specdata.plot_evals_vs_paramvals(label_list=label_list, title=title, fig_ax=fig_ax)
+    transition_lines = list(axes.get_lines())
+    marker_line = axes.axvline(param_val, color='gray', linestyle=':')
+    return {'axes': axes, 'transitions': transition_lines, 'marker_line': marker_line}
+
+
+def update_n_photon_qubit_transitions(handles, transitions_data, photonnumber, initial_bare, param_val):
+    _, energy_table = transitions_data
+    axes = handles['axes']
+    for line, energies in zip(handles['transitions'], energy_table.T):
+        line.set_ydata(energies / photonnumber)
+    axes.set_title(_n_photon_title(photonnumber, initial_bare))
+    axes.relim()
+    axes.autoscale_view()
+    update_marker(handles['marker_line'], param_val)
 
 
 def display_chi_01(data_dict, qbt_index, osc_index, param_index, fig_ax):
     datastore = data_dict[(osc_index, qbt_index)]
     __ = splot.chi_01(datastore, param_index=param_index, fig_ax=fig_ax)
     _, axes = fig_ax
-    axes.axvline(datastore.param_vals[param_index], color='gray', linestyle=':')
+    marker_line = axes.axvline(datastore.param_vals[param_index], color='gray', linestyle=':')
+    return {'axes': axes, 'marker_line': marker_line}
+
+
+def update_chi_01(handles, data_dict, qbt_index, osc_index, param_index):
+    datastore = data_dict[(osc_index, qbt_index)]
+    options = defaults.chi01(datastore.param_name, datastore.chi[param_index])
+    handles['axes'].set_title(options['title'])
+    update_marker(handles['marker_line'], datastore.param_vals[param_index])
 
 
 def display_charge_matrixelems(data_dict, initial_bare, qbt_index_subsys, param_val, fig_ax):
@@ -58,4 +153,4 @@ def display_charge_matrixelems(data_dict, initial_bare, qbt_index_subsys, param_
     __ = splot.charge_matrixelem(data_dict[qbt_index_subsys], qbt_index_subsys, bare_qbt_initial,
                                  title=title, fig_ax=fig_ax)
     _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
+    return axes.axvline(param_val, color='gray', linestyle=':')
@@ -16,10 +16,15 @@ import numpy as np
 
 from scqubits.settings import IN_IPYTHON
 
-if IN_IPYTHON:
-    from tqdm.notebook import tqdm
-else:
-    from tqdm import tqdm
+
+def tqdm(*args, **kwargs):
+    """Returns a tqdm progress bar (notebook version when run in IPython). tqdm is only imported upon first use, which
+    keeps `import scqubits` light."""
+    if IN_IPYTHON:
+        from tqdm.notebook import tqdm as tqdm_class
+    else:
+        from tqdm import tqdm as tqdm_class
+    return tqdm_class(*args, **kwargs)
 
 
 def process_which(which, max_index):
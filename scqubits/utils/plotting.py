@@ -11,6 +11,7 @@
 
 import os
 import warnings
+from abc import ABC, abstractmethod
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -32,6 +33,14 @@ except ImportError:
     _LABELLINES_ENABLED = False
 
 
+def _set_matplotlib_defaults():
+    mpl.rcParams['axes.prop_cycle'] = mpl.cycler(color=settings.MATPLOTLIB_COLOR_CYCLE)
+    mpl.rcParams.update(settings.MATPLOTLIB_RCPARAMS)
+
+
+_set_matplotlib_defaults()
+
+
 # A dictionary of plotting options that are directly passed to specific matplotlib's
 # plot commands.
 _direct_plot_options = {
@@ -140,6 +149,260 @@ def _process_special_option(figure, axes, key, value):
         axes.grid(**value) if isinstance(value, dict) else axes.grid(value)
 
 
+# —Updatable plots—————————————————————————————————————————————————————————————————————————————————————————————————————
+# The following classes create the plots produced by the corresponding plotting functions, and keep references to the
+# generated plot elements. New data can then be passed to `<handle>.update(...)`, which modifies the existing plot
+# elements in place and requests a redraw of the canvas, rather than recreating figure and axes.
+
+
+def _has_fixed_ylim(kwargs):
+    return any(key in kwargs for key in ('ylim', 'ymax', 'y_range'))
+
+
+class PlotHandle(ABC):
+    """
+    Base class for handles to plots that can be updated with new data.
+
+    Parameters
+    ----------
+    figure: matplotlib.Figure
+    axes: matplotlib.Axes
+    autoscale: bool, optional
+        whether to rescale the axes limits upon update (default value = True)
+    """
+    def __init__(self, figure, axes, autoscale=True):
+        self.figure = figure
+        self.axes = axes
+        self.autoscale = autoscale
+
+    def update(self, *args, **kwargs):
+        """Replaces the plotted data and requests a redraw of the figure canvas. Arguments are those of the plotting
+        function associated with the handle, without plotting options."""
+        self._update_artists(*args, **kwargs)
+        if self.autoscale:
+            self.axes.relim()
+            self.axes.autoscale_view()
+        self.figure.canvas.draw_idle()
+
+    @abstractmethod
+    def _update_artists(self, *args, **kwargs):
+        """Replaces the data of the matplotlib artists managed by the handle."""
+
+
+class DataVsParamvalsHandle(PlotHandle):
+    """Updatable plot of a set of ydata vs xdata, see `data_vs_paramvals`. Update with `update(ydata, xdata=None)`;
+    the number of curves must remain unchanged."""
+    def __init__(self, xdata, ydata, label_list=None, **kwargs):
+        fig, axes = kwargs.get('fig_ax') or plt.subplots()
+        super().__init__(fig, axes, autoscale=not _has_fixed_ylim(kwargs))
+
+        if label_list is None:
+            self.lines = axes.plot(xdata, ydata, **_extract_kwargs_options(kwargs, 'plot'))
+        else:
+            self.lines = [axes.plot(xdata, ydataset, label=label_list[idx], **_extract_kwargs_options(kwargs, 'plot'))[0]
+                          for idx, ydataset in enumerate(ydata.T)]
+            axes.legend(loc='center left', bbox_to_anchor=(1, 0.5))
+        _process_options(fig, axes, **kwargs)
+
+    def _update_artists(self, ydata, xdata=None):
+        ydata = np.asarray(ydata)
+        for line, ydataset in zip(self.lines, ydata.reshape(ydata.shape[0], -1).T):
+            if xdata is None:
+                line.set_ydata(ydataset)
+            else:
+                line.set_data(xdata, ydataset)
+
+
+class EvalsVsParamvalsHandle(DataVsParamvalsHandle):
+    """Updatable plot of eigenvalues as a function of one parameter, see `evals_vs_paramvals`. Update with
+    `update(specdata)`."""
+    def __init__(self, specdata, which=-1, subtract_ground=False, label_list=None, **kwargs):
+        self.index_list = utils.process_which(which, specdata.energy_table[0].size)
+        self.subtract_ground = subtract_ground
+        xdata, ydata = self._xydata(specdata)
+        super().__init__(xdata, ydata, label_list=label_list, **defaults.evals_vs_paramvals(specdata, **kwargs))
+
+    def _xydata(self, specdata):
+        ydata = specdata.energy_table[:, self.index_list]
+        if self.subtract_ground:
+            ydata = (ydata.T - ydata[:, 0]).T
+        return specdata.param_vals, ydata
+
+    def _update_artists(self, specdata):
+        xdata, ydata = self._xydata(specdata)
+        super()._update_artists(ydata, xdata=xdata)
+
+
+class Wavefunction1dHandle(PlotHandle):
+    """Updatable plot of a single real-valued 1d wave function, see `wavefunction1d`. Update with
+    `update(wavefunc, potential_vals=None, offset=0, scaling=1)`."""
+    def __init__(self, wavefunc, potential_vals=None, offset=0, scaling=1, **kwargs):
+        fig, axes = kwargs.get('fig_ax') or plt.subplots()
+        super().__init__(fig, axes, autoscale=not _has_fixed_ylim(kwargs))
+
+        x_vals = wavefunc.basis_labels
+        y_vals = offset + scaling * wavefunc.amplitudes
+
+        self.potential_line = None
+        if potential_vals is not None:
+            self.potential_line, = axes.plot(x_vals, potential_vals, color='gray',
+                                             **_extract_kwargs_options(kwargs, 'plot'))
+
+        self.wavefunc_line, = axes.plot(x_vals, y_vals, **_extract_kwargs_options(kwargs, 'plot'))
+        self.fill = self._fill(x_vals, y_vals, offset)
+        _process_options(fig, axes, **kwargs)
+
+    def _fill(self, x_vals, y_vals, offset):
+        offset_vals = [offset] * len(x_vals)
+        return self.axes.fill_between(x_vals, y_vals, offset_vals, where=(y_vals != offset_vals), interpolate=True)
+
+    def _update_artists(self, wavefunc, potential_vals=None, offset=0, scaling=1):
+        x_vals = wavefunc.basis_labels
+        y_vals = offset + scaling * wavefunc.amplitudes
+        if potential_vals is not None and self.potential_line is not None:
+            self.potential_line.set_data(x_vals, potential_vals)
+        self.wavefunc_line.set_data(x_vals, y_vals)
+        self.fill.remove()   # the polygon of a fill_between plot cannot be reshaped in place
+        self.fill = self._fill(x_vals, y_vals, offset)
+
+
+class Wavefunction2dHandle(PlotHandle):
+    """Updatable density plot of a real-valued wave function in 2 "spatial" dimensions, see `wavefunction2d`. Update
+    with `update(wavefunc)`."""
+    def __init__(self, wavefunc, zero_calibrate=False, **kwargs):
+        fig, axes = kwargs.get('fig_ax') or plt.subplots()
+        super().__init__(fig, axes, autoscale=False)
+        self.zero_calibrate = zero_calibrate
+
+        imshow_minval, imshow_maxval = self._color_range(wavefunc.amplitudes)
+        cmap = plt.get_cmap('PRGn') if zero_calibrate else plt.cm.viridis
+        self.image = axes.imshow(wavefunc.amplitudes, extent=self._extent(wavefunc), cmap=cmap, vmin=imshow_minval,
+                                 vmax=imshow_maxval, origin='lower', aspect='auto',
+                                 **_extract_kwargs_options(kwargs, 'imshow'))
+        divider = make_axes_locatable(axes)
+        cax = divider.append_axes("right", size="2%", pad=0.05)
+        self.colorbar = fig.colorbar(self.image, cax=cax)
+
+        _process_options(fig, axes, defaults.wavefunction2d(), **kwargs)
+
+    def _color_range(self, amplitudes):
+        if self.zero_calibrate:
+            absmax = np.amax(np.abs(amplitudes))
+            return -absmax, absmax
+        return np.min(amplitudes), np.max(amplitudes)
+
+    @staticmethod
+    def _extent(wavefunc):
+        min_vals = wavefunc.gridspec.min_vals
+        max_vals = wavefunc.gridspec.max_vals
+        return [min_vals[0], max_vals[0], min_vals[1], max_vals[1]]
+
+    def _update_artists(self, wavefunc):
+        self.image.set_data(wavefunc.amplitudes)
+        self.image.set_extent(self._extent(wavefunc))
+        self.image.set_clim(*self._color_range(wavefunc.amplitudes))   # colorbar follows the image norm
+
+
+class Matrix2dHandle(PlotHandle):
+    """Updatable color-coded 2d plot of a matrix, see `matrix2d`. Update with `update(matrix)`; the matrix shape must
+    remain unchanged."""
+    def __init__(self, matrix, mode='abs', show_numbers=True, **kwargs):
+        fig, axes = kwargs.get('fig_ax') or plt.subplots()
+        super().__init__(fig, axes, autoscale=False)
+        self.modefunction = constants.MODE_FUNC_DICT[mode]
+
+        zheight = self.modefunction(matrix).flatten()  # height of bars from matrix elements
+        nrm = mpl.colors.Normalize(0, max(zheight))  # <-- normalize colors to max. data
+
+        self.image = axes.matshow(self.modefunction(matrix), cmap=plt.cm.viridis, norm=nrm, interpolation=None)
+        cax, _ = mpl.colorbar.make_axes(axes, shrink=.75, pad=.02)  # add colorbar with normalized range
+        self.colorbar = fig.colorbar(self.image, cax=cax)
+
+        self.texts = []
+        if show_numbers:
+            for y_index in range(matrix.shape[0]):
+                for x_index in range(matrix.shape[1]):
+                    self.texts.append(axes.text(x_index, y_index, "{:.03f}".format(matrix[y_index, x_index]),
+                                                va='center', ha='center', fontsize=8, rotation=45, color='white'))
+        # shift the grid
+        for axis, locs in [(axes.xaxis, np.arange(matrix.shape[1])), (axes.yaxis, np.arange(matrix.shape[0]))]:
+            axis.set_ticks(locs + 0.5, minor=True)
+            axis.set(ticks=locs, ticklabels=locs)
+        axes.grid(True, which='minor', linewidth=0)
+        axes.grid(False, which='major', linewidth=0)
+
+        _process_options(fig, axes, **kwargs)
+
+    def _update_artists(self, matrix):
+        values = self.modefunction(matrix)
+        self.image.set_data(values)
+        self.image.set_clim(0, np.max(values))
+        if self.texts:
+            for text, value in zip(self.texts, np.asarray(matrix).flatten()):
+                text.set_text("{:.03f}".format(value))
+
+
+class MatrixSkyscraperHandle(PlotHandle):
+    """Updatable 3d skyscraper plot of a matrix, see `matrix_skyscraper`. Update with `update(matrix)`."""
+    def __init__(self, matrix, mode='abs', **kwargs):
+        fig, axes = kwargs.get('fig_ax') or plt.subplots(subplot_kw={'projection': '3d'})
+        super().__init__(fig, axes, autoscale=False)
+        self.modefunction = constants.MODE_FUNC_DICT[mode]
+
+        # skyscraper plot
+        axes.view_init(azim=210, elev=23)
+        self.bars = self._draw_bars(matrix)
+        axes.axes.xaxis.set_major_locator(plt.IndexLocator(1, -0.5))  # set x-ticks to integers
+        axes.axes.yaxis.set_major_locator(plt.IndexLocator(1, -0.5))  # set y-ticks to integers
+
+        _process_options(fig, axes, opts=defaults.matrix(), **kwargs)
+
+    def _draw_bars(self, matrix):
+        matsize = len(matrix)
+        element_count = matsize ** 2  # num. of elements to plot
+
+        xgrid, ygrid = np.meshgrid(range(matsize), range(matsize))
+        xgrid = xgrid.T.flatten() - 0.5  # center bars on integer value of x-axis
+        ygrid = ygrid.T.flatten() - 0.5  # center bars on integer value of y-axis
+
+        zbottom = np.zeros(element_count)  # all bars start at z=0
+        dx = 0.75 * np.ones(element_count)  # width of bars in x-direction
+        dy = dx  # width of bars in y-direction (same as x-direction)
+
+        zheight = self.modefunction(matrix).flatten()  # height of bars from matrix elements
+        nrm = mpl.colors.Normalize(0, max(zheight))  # <-- normalize colors to max. data
+        colors = plt.cm.viridis(nrm(zheight))  # list of colors for each bar
+
+        bars = self.axes.bar3d(xgrid, ygrid, zbottom, dx, dy, zheight, color=colors)
+        self.axes.set_zlim3d([0, max(zheight)])
+        return bars
+
+    def _update_artists(self, matrix):
+        self.bars.remove()   # bar3d polygons cannot be reshaped in place
+        self.bars = self._draw_bars(matrix)
+
+
+class MatrixHandle(PlotHandle):
+    """Updatable combination of skyscraper and 2d color-coded plot of a matrix, see `matrix`. Update with
+    `update(matrix)`. Here, `axes` is the tuple (skyscraper axes, 2d axes)."""
+    def __init__(self, data_matrix, mode='abs', show_numbers=False, **kwargs):
+        if 'fig_ax' in kwargs:
+            fig, (ax1, ax2) = kwargs.pop('fig_ax')
+        else:
+            fig = plt.figure()
+            ax1 = fig.add_subplot(1, 2, 1, projection='3d')
+            ax2 = plt.subplot(1, 2, 2)
+        super().__init__(fig, (ax1, ax2), autoscale=False)
+
+        self.matrix2d_handle = Matrix2dHandle(data_matrix, mode=mode, show_numbers=show_numbers, fig_ax=(fig, ax2),
+                                              **kwargs)
+        self.skyscraper_handle = MatrixSkyscraperHandle(data_matrix, mode=mode, fig_ax=(fig, ax1), **kwargs)
+
+    def _update_artists(self, matrix):
+        self.matrix2d_handle._update_artists(matrix)
+        self.skyscraper_handle._update_artists(matrix)
+
+
 def wavefunction1d(wavefunc, potential_vals=None, offset=0, scaling=1, **kwargs):
     """
     Plots the amplitude of a single real-valued 1d wave function, along with the potential energy if provided.
@@ -162,19 +425,8 @@ def wavefunction1d(wavefunc, potential_vals=None, offset=0, scaling=1, **kwargs)
     tuple(Figure, Axes)
         matplotlib objects for further editing
     """
-    fig, axes = kwargs.get('fig_ax') or plt.subplots()
-
-    x_vals = wavefunc.basis_labels
-    y_vals = offset + scaling * wavefunc.amplitudes
-    offset_vals = [offset] * len(x_vals)
-
-    if potential_vals is not None:
-        axes.plot(x_vals, potential_vals, color='gray', **_extract_kwargs_options(kwargs, 'plot'))
-
-    axes.plot(x_vals, y_vals, **_extract_kwargs_options(kwargs, 'plot'))
-    axes.fill_between(x_vals, y_vals, offset_vals, where=(y_vals != offset_vals), interpolate=True)
-    _process_options(fig, axes, **kwargs)
-    return fig, axes
+    handle = Wavefunction1dHandle(wavefunc, potential_vals=potential_vals, offset=offset, scaling=scaling, **kwargs)
+    return handle.figure, handle.axes
 
 
 def wavefunction1d_discrete(wavefunc, **kwargs):
@@ -224,30 +476,8 @@ def wavefunction2d(wavefunc, zero_calibrate=False, **kwargs):
     tuple(Figure, Axes)
         matplotlib objects for further editing
     """
-    fig, axes = kwargs.get('fig_ax') or plt.subplots()
-
-    min_vals = wavefunc.gridspec.min_vals
-    max_vals = wavefunc.gridspec.max_vals
-
-    if zero_calibrate:
-        absmax = np.amax(np.abs(wavefunc.amplitudes))
-        imshow_minval = -absmax
-        imshow_maxval = absmax
-        cmap = plt.get_cmap('PRGn')
-    else:
-        imshow_minval = np.min(wavefunc.amplitudes)
-        imshow_maxval = np.max(wavefunc.amplitudes)
-        cmap = plt.cm.viridis
-
-    im = axes.imshow(wavefunc.amplitudes, extent=[min_vals[0], max_vals[0], min_vals[1], max_vals[1]],
-                     cmap=cmap, vmin=imshow_minval, vmax=imshow_maxval, origin='lower', aspect='auto',
-                     **_extract_kwargs_options(kwargs, 'imshow'))
-    divider = make_axes_locatable(axes)
-    cax = divider.append_axes("right", size="2%", pad=0.05)
-    fig.colorbar(im, cax=cax)
-
-    _process_options(fig, axes, defaults.wavefunction2d(), **kwargs)
-    return fig, axes
+    handle = Wavefunction2dHandle(wavefunc, zero_calibrate=zero_calibrate, **kwargs)
+    return handle.figure, handle.axes
 
 
 def contours(x_vals, y_vals, func, contour_vals=None, show_colorbar=True, **kwargs):
@@ -309,16 +539,8 @@ def matrix(data_matrix, mode='abs', show_numbers=False, **kwargs):
     Figure, (Axes1, Axes2)
         figure and axes objects for further editing
     """
-    if 'fig_ax' in kwargs:
-        fig, (ax1, ax2) = kwargs['fig_ax']
-    else:
-        fig = plt.figure()
-        ax1 = fig.add_subplot(1, 2, 1, projection='3d')
-        ax2 = plt.subplot(1, 2, 2)
-
-    fig, ax2 = matrix2d(data_matrix, mode=mode, show_numbers=show_numbers, fig_ax=(fig, ax2), **kwargs)
-    fig, ax1 = matrix_skyscraper(data_matrix, mode=mode, fig_ax=(fig, ax1), **kwargs)
-    return fig, (ax1, ax2)
+    handle = MatrixHandle(data_matrix, mode=mode, show_numbers=show_numbers, **kwargs)
+    return handle.figure, handle.axes
 
 
 def matrix_skyscraper(matrix, mode='abs', **kwargs):
@@ -338,33 +560,8 @@ def matrix_skyscraper(matrix, mode='abs', **kwargs):
     Figure, Axes
         figure and axes objects for further editing
     """
-    fig, axes = kwargs.get('fig_ax') or plt.subplots(projection='3d')
-
-    matsize = len(matrix)
-    element_count = matsize ** 2  # num. of elements to plot
-
-    xgrid, ygrid = np.meshgrid(range(matsize), range(matsize))
-    xgrid = xgrid.T.flatten() - 0.5  # center bars on integer value of x-axis
-    ygrid = ygrid.T.flatten() - 0.5  # center bars on integer value of y-axis
-
-    zbottom = np.zeros(element_count)  # all bars start at z=0
-    dx = 0.75 * np.ones(element_count)  # width of bars in x-direction
-    dy = dx  # width of bars in y-direction (same as x-direction)
-
-    modefunction = constants.MODE_FUNC_DICT[mode]
-    zheight = modefunction(matrix).flatten()  # height of bars from matrix elements
-    nrm = mpl.colors.Normalize(0, max(zheight))  # <-- normalize colors to max. data
-    colors = plt.cm.viridis(nrm(zheight))  # list of colors for each bar
-
-    # skyscraper plot
-    axes.view_init(azim=210, elev=23)
-    axes.bar3d(xgrid, ygrid, zbottom, dx, dy, zheight, color=colors)
-    axes.axes.xaxis.set_major_locator(plt.IndexLocator(1, -0.5))  # set x-ticks to integers
-    axes.axes.yaxis.set_major_locator(plt.IndexLocator(1, -0.5))  # set y-ticks to integers
-    axes.set_zlim3d([0, max(zheight)])
-
-    _process_options(fig, axes, opts=defaults.matrix(), **kwargs)
-    return fig, axes
+    handle = MatrixSkyscraperHandle(matrix, mode=mode, **kwargs)
+    return handle.figure, handle.axes
 
 
 def matrix2d(matrix, mode='abs', show_numbers=True, **kwargs):
@@ -386,30 +583,8 @@ def matrix2d(matrix, mode='abs', show_numbers=True, **kwargs):
     Figure, Axes
         figure and axes objects for further editing
     """
-    fig, axes = kwargs.get('fig_ax') or plt.subplots()
-
-    modefunction = constants.MODE_FUNC_DICT[mode]
-    zheight = modefunction(matrix).flatten()  # height of bars from matrix elements
-    nrm = mpl.colors.Normalize(0, max(zheight))  # <-- normalize colors to max. data
-
-    axes.matshow(modefunction(matrix), cmap=plt.cm.viridis, interpolation=None)
-    cax, _ = mpl.colorbar.make_axes(axes, shrink=.75, pad=.02)  # add colorbar with normalized range
-    mpl.colorbar.ColorbarBase(cax, cmap=plt.cm.viridis, norm=nrm)
-
-    if show_numbers:
-        for y_index in range(matrix.shape[0]):
-            for x_index in range(matrix.shape[1]):
-                axes.text(x_index, y_index, "{:.03f}".format(matrix[y_index, x_index]),
-                          va='center', ha='center', fontsize=8, rotation=45, color='white')
-    # shift the grid
-    for axis, locs in [(axes.xaxis, np.arange(matrix.shape[1])), (axes.yaxis, np.arange(matrix.shape[0]))]:
-        axis.set_ticks(locs + 0.5, minor=True)
-        axis.set(ticks=locs, ticklabels=locs)
-    axes.grid(True, which='minor', linewidth=0)
-    axes.grid(False, which='major', linewidth=0)
-
-    _process_options(fig, axes, **kwargs)
-    return fig, axes
+    handle = Matrix2dHandle(matrix, mode=mode, show_numbers=show_numbers, **kwargs)
+    return handle.figure, handle.axes
 
 
 print_matrix = matrix2d  # legacv, support of name now deprecated
@@ -433,16 +608,8 @@ def data_vs_paramvals(xdata, ydata, label_list=None, **kwargs):
     tuple(Figure, Axes)
         matplotlib objects for further editing
     """
-    fig, axes = kwargs.get('fig_ax') or plt.subplots()
- 
-    if label_list is None: 
-        axes.plot(xdata, ydata, **_extract_kwargs_options(kwargs, 'plot'))
-    else:
-        for idx, ydataset in enumerate(ydata.T):
-            axes.plot(xdata, ydataset, label=label_list[idx], **_extract_kwargs_options(kwargs, 'plot'))
-        axes.legend(loc='center left', bbox_to_anchor=(1, 0.5))
-    _process_options(fig, axes, **kwargs)
-    return fig, axes
+    handle = DataVsParamvalsHandle(xdata, ydata, label_list=label_list, **kwargs)
+    return handle.figure, handle.axes
 
 
 def evals_vs_paramvals(specdata, which=-1, subtract_ground=False, label_list=None, **kwargs):
@@ -468,14 +635,9 @@ def evals_vs_paramvals(specdata, which=-1, subtract_ground=False, label_list=Non
     tuple(Figure, Axes)
         matplotlib objects for further editing
     """
-    index_list = utils.process_which(which, specdata.energy_table[0].size)
-
-    xdata = specdata.param_vals
-    ydata = specdata.energy_table[:, index_list]
-    if subtract_ground:
-        ydata = (ydata.T - ydata[:, 0]).T
-    return data_vs_paramvals(xdata, ydata, label_list=label_list,
-                             **defaults.evals_vs_paramvals(specdata, **kwargs))
+    handle = EvalsVsParamvalsHandle(specdata, which=which, subtract_ground=subtract_ground, label_list=label_list,
+                                    **kwargs)
+    return handle.figure, handle.axes
 
 
 def matelem_vs_paramvals(specdata, select_elems=4, mode='abs', **kwargs):
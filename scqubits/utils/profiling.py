@@ -0,0 +1,272 @@
+# profiling.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Opt-in instrumentation recording wall time, call counts and (optionally) peak memory for the stages of lengthy
+computations such as `ParameterSweep.run`. Recording is active within a `profile()` block, or globally when
+`settings.PROFILE` is set to True (data then accumulates in `GLOBAL_PROFILER`). Example::
+
+    with profile(track_memory=True) as profiler:
+        sweep.run()
+    print(profiler)
+    profiler.export_chrome_trace('sweep_trace.json')   # view in chrome://tracing or https://ui.perfetto.dev
+
+Stages executed in worker processes (`num_cpus > 1`) are not recorded.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import scqubits.settings as settings
+
+
+class Profiler:
+    """Collects timing (and memory) records of profiled stages.
+
+    Parameters
+    ----------
+    track_memory: bool, optional
+        if set to True, `tracemalloc` is used to record the peak memory allocated within each stage (default value =
+        False); memory tracking slows down the profiled computation considerably
+    """
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.events = []
+        self._lock = threading.Lock()
+        self._start_time = time.perf_counter()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']   # locks cannot be pickled (e.g., when dill pickles this module for multiprocessing)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Discards all records."""
+        with self._lock:
+            self.events = []
+
+    def record(self, name, start, duration, peak_memory=None):
+        """Adds the record of a single stage execution.
+
+        Parameters
+        ----------
+        name: str
+            name of the stage
+        start: float
+            start time as obtained from `time.perf_counter()`
+        duration: float
+            wall time in seconds
+        peak_memory: int, optional
+            peak memory (bytes) allocated during the stage in addition to memory allocated at its beginning
+        """
+        event = {'name': name,
+                 'start': start,
+                 'duration': duration,
+                 'peak_memory': peak_memory,
+                 'thread_id': threading.get_ident()}
+        with self._lock:
+            self.events.append(event)
+
+    def report(self):
+        """Returns the summary of all records per stage, in the order in which the stages were first entered.
+
+        Returns
+        -------
+        dict
+            `{stage name: {'calls': int, 'total_time': float, 'mean_time': float, 'max_time': float,
+            'peak_memory': int or None}}`, times in seconds and memory in bytes
+        """
+        summary = {}
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event['start'])
+        for event in events:
+            entry = summary.setdefault(event['name'], {'calls': 0, 'total_time': 0.0, 'max_time': 0.0,
+                                                       'peak_memory': None})
+            entry['calls'] += 1
+            entry['total_time'] += event['duration']
+            entry['max_time'] = max(entry['max_time'], event['duration'])
+            if event['peak_memory'] is not None:
+                entry['peak_memory'] = max(entry['peak_memory'] or 0, event['peak_memory'])
+        for entry in summary.values():
+            entry['mean_time'] = entry['total_time'] / entry['calls']
+        return summary
+
+    def __str__(self):
+        summary = self.report()
+        name_width = max([len(name) for name in summary] + [5])
+        output = '{:<{width}}  {:>7}  {:>12}  {:>12}  {:>12}  {:>12}'.format(
+            'stage', 'calls', 'total [s]', 'mean [s]', 'max [s]', 'peak [MiB]', width=name_width)
+        for name, entry in summary.items():
+            peak = '-' if entry['peak_memory'] is None else '{:.2f}'.format(entry['peak_memory'] / 2**20)
+            output += '\n{:<{width}}  {:>7}  {:>12.6f}  {:>12.6f}  {:>12.6f}  {:>12}'.format(
+                name, entry['calls'], entry['total_time'], entry['mean_time'], entry['max_time'], peak,
+                width=name_width)
+        return output
+
+    def chrome_trace(self):
+        """Returns the records in Chrome's trace-event format (complete events, times in microseconds).
+
+        Returns
+        -------
+        dict
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        trace_events = []
+        for event in events:
+            trace_event = {'name': event['name'],
+                           'cat': 'scqubits',
+                           'ph': 'X',
+                           'ts': (event['start'] - self._start_time) * 1e6,
+                           'dur': event['duration'] * 1e6,
+                           'pid': pid,
+                           'tid': event['thread_id']}
+            if event['peak_memory'] is not None:
+                trace_event['args'] = {'peak_memory': event['peak_memory']}
+            trace_events.append(trace_event)
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, filename):
+        """Writes the records to a JSON file that can be loaded in chrome://tracing or https://ui.perfetto.dev.
+
+        Parameters
+        ----------
+        filename: str
+        """
+        with open(filename, 'w') as file:
+            json.dump(self.chrome_trace(), file)
+
+
+GLOBAL_PROFILER = Profiler()    # collects records whenever `settings.PROFILE` is True
+
+_ACTIVE_PROFILERS = []          # stack of profilers activated by `profile()`
+
+
+class _ThreadState(threading.local):
+    """Per-thread profiling state; pickled as a fresh instance, since `threading.local` objects cannot be pickled."""
+    def __reduce__(self):
+        return _ThreadState, ()
+
+
+_thread_state = _ThreadState()
+
+
+def active_profiler():
+    """Returns the profiler to which stages are currently reported, or None if profiling is inactive.
+
+    Returns
+    -------
+    Profiler or None
+    """
+    if _ACTIVE_PROFILERS:
+        return _ACTIVE_PROFILERS[-1]
+    if settings.PROFILE:
+        return GLOBAL_PROFILER
+    return None
+
+
+@contextlib.contextmanager
+def profile(track_memory=False):
+    """Context manager activating a new `Profiler` for the enclosed code.
+
+    Parameters
+    ----------
+    track_memory: bool, optional
+        record peak memory per stage (see `Profiler`; default value = False)
+
+    Returns
+    -------
+    Profiler
+    """
+    profiler = Profiler(track_memory=track_memory)
+    started_tracing = track_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _ACTIVE_PROFILERS.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _ACTIVE_PROFILERS.remove(profiler)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+class stage:
+    """Context manager (or decorator) recording the enclosed code as a stage with the given name. Without an active
+    profiler, it does nothing.
+
+    Parameters
+    ----------
+    name: str
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._profiler = active_profiler()
+        if self._profiler is None:
+            return self
+        self._memory_frame = self._enter_memory_frame() if tracemalloc.is_tracing() else None
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._profiler is None:
+            return False
+        duration = time.perf_counter() - self._start
+        peak_memory = None if self._memory_frame is None else self._exit_memory_frame()
+        self._profiler.record(self.name, self._start, duration, peak_memory)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def profiled_func(*args, **kwargs):
+            with stage(self.name):
+                return func(*args, **kwargs)
+        return profiled_func
+
+    # Peak memory per stage: `tracemalloc` only keeps a single peak value. Each thread holds a stack of frames for
+    # the stages entered; upon entering a stage, the peak reached so far is credited to the enclosing frame before
+    # the tracemalloc peak is reset, and upon exit, the stage's peak is passed on to the enclosing frame.
+    @staticmethod
+    def _frames():
+        if not hasattr(_thread_state, 'memory_frames'):
+            _thread_state.memory_frames = []
+        return _thread_state.memory_frames
+
+    def _enter_memory_frame(self):
+        frames = self._frames()
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            frames[-1]['peak'] = max(frames[-1]['peak'], peak)
+        if hasattr(tracemalloc, 'reset_peak'):    # Python >= 3.9
+            tracemalloc.reset_peak()
+        frame = {'start': current, 'peak': current}
+        frames.append(frame)
+        return frame
+
+    def _exit_memory_frame(self):
+        frames = self._frames()
+        _, peak = tracemalloc.get_traced_memory()
+        frame = frames.pop()
+        frame_peak = max(frame['peak'], peak)
+        if frames:
+            frames[-1]['peak'] = max(frames[-1]['peak'], frame_peak)
+        return frame_peak - frame['start']
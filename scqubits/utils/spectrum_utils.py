@@ -10,9 +10,27 @@
 ############################################################################
 
 import cmath
+import sys
 
 import numpy as np
-import qutip as qt
+import scipy.sparse.linalg
+from scipy import sparse
+
+
+def is_qobj(obj):
+    """Checks whether `obj` is a `qutip.Qobj`, without importing qutip: unless qutip has been imported already, `obj`
+    cannot be a Qobj.
+
+    Parameters
+    ----------
+    obj: object
+
+    Returns
+    -------
+    bool
+    """
+    qutip = sys.modules.get('qutip')
+    return qutip is not None and isinstance(obj, qutip.Qobj)
 
 
 def order_eigensystem(evals, evecs):
@@ -33,6 +51,32 @@ def order_eigensystem(evals, evecs):
     return evals, evecs
 
 
+def sparse_lowest_eigsh(matrix, evals_count, return_eigenvectors=True):
+    """Calculates the lowest eigenvalues (and eigenvectors) of a sparse Hermitian matrix with `eigsh` in shift-invert
+    mode. The shift is placed below the spectrum, using the Gershgorin lower bound for the smallest eigenvalue.
+
+    Parameters
+    ----------
+    matrix: scipy sparse matrix
+        Hermitian matrix
+    evals_count: int
+        number of desired eigenvalues
+    return_eigenvectors: bool, optional
+        if set to False, only eigenvalues are computed (default value = True)
+
+    Returns
+    -------
+    ndarray or (ndarray, ndarray)
+        eigenvalues (unsorted), or eigenvalues and eigenvectors as returned by `eigsh`
+    """
+    matrix = sparse.csc_matrix(matrix)
+    diag_elements = matrix.diagonal().real
+    radii = np.asarray(abs(matrix).sum(axis=1)).ravel() - np.abs(diag_elements)
+    lower_bound = np.min(diag_elements - radii)
+    sigma = lower_bound - 1e-6 * max(1.0, abs(lower_bound))    # stay clear of an exact eigenvalue at the bound
+    return sparse.linalg.eigsh(matrix, k=evals_count, sigma=sigma, which='LM', return_eigenvectors=return_eigenvectors)
+
+
 def extract_phase(complex_array, position=None):
     """Extracts global phase from `complex_array` at given `position`. If position is not specified, the `position` is
     set to to an intermediate position to avoid machine-precision problems with tails of wavefunctions at beginning
@@ -105,12 +149,12 @@ def matrix_element(state1, operator, state2):
     float or complex
         matrix element
     """
-    if isinstance(operator, qt.Qobj):
+    if is_qobj(operator):
         op_matrix = operator.data
     else:
         op_matrix = operator
 
-    if isinstance(state1, qt.Qobj):
+    if is_qobj(state1):
         vec1 = state1.data.toarray()
         vec2 = state2.data.toarray()
     else:
@@ -122,32 +166,88 @@ def matrix_element(state1, operator, state2):
     return np.vdot(vec1, op_matrix.dot(vec2))  # No, operator is sparse. Must use its own 'dot' method.
 
 
-def get_matrixelement_table(operator, state_table):
-    """Calculates a table of matrix elements.
+def _operator_matrix(operator):
+    """Returns the matrix of `operator` as ndarray or scipy sparse matrix."""
+    if is_qobj(operator):
+        return sparse.csr_matrix(operator.data)
+    return operator
+
+
+def _state_matrix(state_table, operator):
+    """Returns the states in `state_table` as columns of an ndarray. For a `qutip.Qobj` operator, `state_table` is
+    expected to be a list of states (kets or 1d arrays); otherwise, it is expected in scipy's `eigsh` form."""
+    if not is_qobj(operator):
+        return np.asarray(state_table)
+    return np.column_stack([state.full().ravel() if is_qobj(state) else np.ravel(state) for state in state_table])
+
+
+def get_matrixelement_table(operator, state_table, row_indices=None, column_indices=None):
+    """Calculates a table of matrix elements `<v_n|operator|v_m>`. The table is obtained as `V^H (A V)` with two
+    matrix-matrix products, where the columns of `V` are the states.
 
     Parameters
     ----------
-    operator: ndarray or sparse matrix object
+    operator: ndarray or sparse matrix object or qutip.Qobj
         operator with respect to which matrix elements are to be calculated
     state_table: list or ndarray
         list or array of numpy arrays representing the states `|v0>, |v1>, ...`
-        Note: `state_table` is expected to be in scipy's `eigsh` transposed form.
+        Note: `state_table` is expected to be in scipy's `eigsh` transposed form, unless `operator` is a `qutip.Qobj`;
+        in that case, `state_table` is expected to be a list of states (kets or 1d arrays).
+    row_indices: list of int, optional
+        if given, only the rows `n` in `row_indices` are calculated (default value = None: all rows)
+    column_indices: list of int, optional
+        if given, only the columns `m` in `column_indices` are calculated (default value = None: all columns)
 
     Returns
     -------
     ndarray
         table of matrix elements
     """
-    if isinstance(operator, qt.Qobj):
-        state_list = state_table
-    else:
-        state_list = state_table.T
+    states = _state_matrix(state_table, operator)
+    operator = _operator_matrix(operator)
+    row_states = states if row_indices is None else states[:, row_indices]
+    column_states = states if column_indices is None else states[:, column_indices]
+    return row_states.conj().T @ np.asarray(operator @ column_states)
+
 
-    tablesize = len(state_list)
-    mtable = [[matrix_element(state_list[n], operator, state_list[m]) for m in range(tablesize)]
-              for n in range(tablesize)]
+def get_matrixelement_table_stack(operator, state_tables, row_indices=None, column_indices=None):
+    """Calculates tables of matrix elements for a stack of state tables, e.g., eigenstates for a sequence of parameter
+    values. The operator may be fixed or given separately for each state table.
+
+    Parameters
+    ----------
+    operator: ndarray or sparse matrix object or list
+        operator with respect to which matrix elements are to be calculated, or list (or 3d array) of operators, one
+        per state table
+    state_tables: ndarray
+        array of shape (stack size, Hilbert space dimension, number of states); `state_tables[p]` is a state table in
+        scipy's `eigsh` form
+    row_indices: list of int, optional
+        if given, only the rows `n` in `row_indices` are calculated (default value = None: all rows)
+    column_indices: list of int, optional
+        if given, only the columns `m` in `column_indices` are calculated (default value = None: all columns)
 
-    return np.asarray(mtable)
+    Returns
+    -------
+    ndarray
+        array of shape (stack size, number of rows, number of columns) holding the tables of matrix elements
+    """
+    state_tables = np.asarray(state_tables)
+    row_states = state_tables if row_indices is None else state_tables[:, :, row_indices]
+    column_states = state_tables if column_indices is None else state_tables[:, :, column_indices]
+    if isinstance(operator, (list, tuple)) and not all(isinstance(op, np.ndarray) for op in operator):
+        # sparse operators, one per state table
+        return np.asarray([row_states[index].conj().T @ np.asarray(_operator_matrix(op) @ column_states[index])
+                           for index, op in enumerate(operator)])
+    if isinstance(operator, (list, tuple, np.ndarray)):
+        # dense operator(s); a single operator is broadcast over the stack
+        operator_states = np.matmul(np.asarray(operator), column_states)
+    else:
+        # a single sparse operator acts on all state tables at once
+        stack_size, dim, column_count = column_states.shape
+        operator_states = np.asarray(_operator_matrix(operator) @ column_states.transpose(1, 0, 2).reshape(dim, -1))
+        operator_states = operator_states.reshape(dim, stack_size, column_count).transpose(1, 0, 2)
+    return np.matmul(row_states.conj().transpose(0, 2, 1), operator_states)
 
 
 def closest_dressed_energy(bare_energy, dressed_energy_vals):
@@ -255,7 +355,32 @@ def convert_esys_to_ndarray(esys_qutip):
     return esys_ndarray
 
 
+def convert_evecs_to_qutip_eigenstates(evecs, dims):
+    """Takes eigenvectors stored as columns of an ndarray and converts them into an array of qutip kets, as obtained
+    from qutip `.eigenstates()`.
+
+    Parameters
+    ----------
+    evecs: ndarray
+        evecs[:, 0] is the first eigenvector etc.
+    dims: list of int
+        dimensions of the subsystems composing the Hilbert space
+
+    Returns
+    -------
+    QutipEigenstates
+    """
+    import qutip as qt
+    from scqubits.io_utils.fileio_qutip import QutipEigenstates
+    ket_dims = [list(dims), [1] * len(dims)]
+    eigenstates = np.empty(evecs.shape[1], dtype=np.dtype('O'))
+    for index in range(evecs.shape[1]):
+        eigenstates[index] = qt.Qobj(inpt=evecs[:, [index]], dims=ket_dims, type='ket')
+    return eigenstates.view(QutipEigenstates)
+
+
 def convert_ndarray_to_qobj(operator, subsystem, op_in_eigenbasis, evecs):
+    import qutip as qt
     dim = subsystem.truncated_dim
     if op_in_eigenbasis is False:
         if evecs is None:
@@ -266,6 +391,7 @@ def convert_ndarray_to_qobj(operator, subsystem, op_in_eigenbasis, evecs):
 
 
 def convert_opstring_to_qobj(operator, subsystem, evecs):
+    import qutip as qt
     if evecs is None:
         _, evecs = subsystem.eigensys(evals_count=subsystem.truncated_dim)
     operator_matrixelements = subsystem.matrixelement_table(operator, evecs=evecs)
@@ -273,7 +399,7 @@ def convert_opstring_to_qobj(operator, subsystem, evecs):
 
 
 def convert_operator_to_qobj(operator, subsystem, op_in_eigenbasis, evecs):
-    if isinstance(operator, qt.Qobj):
+    if is_qobj(operator):
         return operator
     if isinstance(operator, np.ndarray):
         return convert_ndarray_to_qobj(operator, subsystem, op_in_eigenbasis, evecs)